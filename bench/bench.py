@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+'''
+#############################################################################
+#
+#       B E N C H M A R K S
+#
+#       Each workload runs in a fresh interpreter (a new process), is
+#       timed in-process around rpn.globl.eval_string, and is compared
+#       against a saved baseline.  Startup is timed as a whole process.
+#
+#       Absolute times move with machine load and CPU frequency, so each
+#       process also times a fixed pure Python calibration loop, and the
+#       fastest run is compared as a ratio to it.  A workload regresses
+#       when its ratio grows by more than the threshold, or by more than
+#       SPREAD_K times the run-to-run spread (median absolute deviation)
+#       seen in the baseline and current runs, whichever is larger.
+#
+#       Usage: bench.py [-b FILE] [-k NAME,...] [-r N] [-s] [-t PCT]
+#
+#       -b FILE   Baseline file (default bench/baseline.json)
+#       -k NAMES  Run only these workloads (comma separated)
+#       -r N      Timed runs per workload (default 15)
+#       -s        Save results as the new baseline
+#       -t PCT    Minimum regression threshold in percent (default 5)
+#
+#       A workload that throws an error fails rather than being timed.
+#       Exit status is 1 if any workload regressed or failed, and no
+#       baseline is saved if any failed.
+#
+#############################################################################
+'''
+
+import getopt
+import io
+import json
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHDIR = os.path.dirname(os.path.abspath(__file__))
+TOPDIR   = os.path.dirname(BENCHDIR)
+ETCDIR   = os.path.join(TOPDIR, "etc")
+
+
+# name: (files to load, setup, body, stdin, needs)
+WORKLOADS = {
+    "hanoi"   : (["hanoi.rpn"], "", "8 hanoi", None, None),
+    "rfib"    : (["recursive.rpn"], "", "12 rfib drop", None, None),
+    "fib2"    : (["recursive.rpn"], "", "10 fib2 drop", None, None),
+    "rfact"   : (["recursive.rpn"], "", "20 rfact drop", None, None),
+    "doloop"  : ([], ": bench_loop  0 2000 0 do I 3 * + 1 - loop ;",
+                 "bench_loop drop", None, None),
+    "craps"   : (["craps.rpn"], "", "craps", "10\n10\n10\n10\n10\n0\n", None),
+    "tvm"     : ([], ": bench_tvm  50 0 do clfin 20 !N 3 !PMT -80 !PV 100 !FV INT drop loop ;",
+                 "bench_tvm", None, None),
+    "units"   : ([], ": bench_units  100 0 do 453.59237_g \"lb\" convert drop 1_mi \"km\" convert drop loop ;",
+                 "bench_units", None, None),
+    "vector"  : ([], ": bench_vec  200 0 do [ 1 2 3 ] [ 4 5 6 ] + 2 * [ 1 1 1 ] - drop loop ;",
+                 "bench_vec", None, "numpy"),
+    "quad"    : ([], ": bench_f  | in:x |  @x sq @x * 2 @x * - ;",
+                 "0 4.5 \"bench_f\" quad drop drop", None, "scipy"),
+    "fzero"   : ([], ": bench_g  | in:x |  @x sq @x 2 * - 3 - ;",
+                 "7 \"bench_g\" fzero drop  -5 \"bench_g\" fzero drop", None, "scipy"),
+}
+
+REPS       = 15
+CALIB_REPS = 7
+SPREAD_K   = 4
+
+
+def calibrate():
+    """Fastest time of a fixed pure Python loop, the unit that workload
+    times are measured in."""
+    times = []
+    for _ in range(CALIB_REPS):
+        start = time.perf_counter()
+        acc = 0
+        for i in range(100000):
+            acc += i * i % 7
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def spread(times):
+    """Median absolute deviation of TIMES, relative to their median."""
+    median = statistics.median(times)
+    return statistics.median([abs(t - median) for t in times]) / median
+
+
+def run_worker(name, reps, outfile):
+    """Run one workload in this (fresh) process and write its timings."""
+    sys.path.insert(0, TOPDIR)
+    # pylint: disable=import-outside-toplevel
+    from rpn import app
+    from rpn.exception import ParseErr, RuntimeErr
+    import rpn.globl
+
+    (files, setup, body, stdin, needs) = WORKLOADS[name]
+    app.initialize(os.path.join(TOPDIR, "rpn"), ["-q"])
+    rpn.globl.interactive = False
+    result = None
+    if needs is None or rpn.globl.have_module(needs):
+        try:
+            for f in files:
+                # load_file reports errors itself, so look for them in the counters
+                caught = rpn.globl.counters["throw.caught"]
+                app.load_file(os.path.join(ETCDIR, f))
+                if rpn.globl.counters["throw.caught"] != caught:
+                    sys.exit("{}: Error loading {}".format(name, f))
+            rpn.globl.eval_string(setup, catch=False)
+            result = time_body(body, reps, stdin)
+        except (ParseErr, RuntimeErr) as e:
+            sys.exit("{}: {}".format(name, e))
+    with open(outfile, "w") as file:
+        json.dump(result, file)
+
+
+def time_body(body, reps, stdin):
+    """Time REPS runs of BODY after one warmup run."""
+    # pylint: disable=import-outside-toplevel
+    import rpn.globl
+
+    calib   = calibrate()
+    params  = rpn.globl.param_stack.snapshot()
+    strings = rpn.globl.string_stack.snapshot()
+    times = []
+    for i in range(reps + 1):
+        random.seed(i)
+        if stdin is not None:
+            sys.stdin = io.StringIO(stdin)
+        start = time.perf_counter()
+        rpn.globl.eval_string(body, catch=False)
+        elapsed = time.perf_counter() - start
+        rpn.globl.flush()
+        rpn.globl.param_stack.restore(params)
+        rpn.globl.string_stack.restore(strings)
+        if i > 0:           # First run is warmup
+            times.append(elapsed)
+    return { "times" : times, "calib" : min(calib, calibrate()) }
+
+
+def measure(name, reps):
+    """Run workload NAME in a fresh interpreter.  Return {"times": run
+    times, "calib": calibration time} or None if it was skipped."""
+    if name == "startup":
+        cmd = [sys.executable, "-m", "rpn", "-q", "1", "drop"]
+        calib = calibrate()
+        times = []
+        for _ in range(reps):
+            start = time.perf_counter()
+            subprocess.run(cmd, cwd=TOPDIR, stdin=subprocess.DEVNULL,
+                           stdout=subprocess.DEVNULL, check=True)
+            times.append(time.perf_counter() - start)
+        return { "times" : times, "calib" : min(calib, calibrate()) }
+
+    (fd, outfile) = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", name, str(reps), outfile],
+                       cwd=TOPDIR, stdin=subprocess.DEVNULL,
+                       stdout=subprocess.DEVNULL, check=True)
+        with open(outfile, "r") as file:
+            return json.load(file)
+    finally:
+        os.remove(outfile)
+
+
+def main(argv):
+    baseline_file = os.path.join(BENCHDIR, "baseline.json")
+    names = ["startup"] + list(WORKLOADS)
+    reps = REPS
+    save = False
+    threshold = 5.0
+
+    if len(argv) == 4 and argv[0] == "--worker":
+        run_worker(argv[1], int(argv[2]), argv[3])
+        return 0
+
+    try:
+        opts, _ = getopt.getopt(argv, "b:k:r:st:")
+    except getopt.GetoptError as e:
+        print(str(e))
+        print(__doc__.strip("\n#"))
+        return 64
+    for opt, arg in opts:
+        if opt == "-b":
+            baseline_file = arg
+        elif opt == "-k":
+            names = arg.split(",")
+        elif opt == "-r":
+            reps = int(arg)
+        elif opt == "-s":
+            save = True
+        elif opt == "-t":
+            threshold = float(arg)
+
+    baseline = dict()
+    if os.path.isfile(baseline_file):
+        with open(baseline_file, "r") as file:
+            baseline = json.load(file)
+
+    results = dict()
+    regressed = []
+    failed = []
+    print("{:<10} {:>12} {:>12} {:>8} {:>10} {:>8} {:>8}".format(
+        "Workload", "Median (ms)", "Min (ms)", "Ratio", "Base ratio", "Change", "Limit"))
+    for name in names:
+        if name != "startup" and name not in WORKLOADS:
+            print("{:<10} unknown workload".format(name))
+            continue
+        try:
+            measured = measure(name, reps)
+        except subprocess.CalledProcessError:
+            print("{:<10} FAILED".format(name), flush=True)
+            failed.append(name)
+            continue
+        if measured is None:
+            print("{:<10} skipped".format(name))
+            continue
+        times = measured["times"]
+        median = statistics.median(times)
+        fastest = min(times)
+        ratio = fastest / measured["calib"]
+        results[name] = { "median" : median, "min" : fastest, "runs" : len(times),
+                          "calib" : measured["calib"], "ratio" : ratio, "spread" : spread(times) }
+        line = "{:<10} {:>12.2f} {:>12.2f} {:>8.2f}".format(name, median * 1e3, fastest * 1e3, ratio)
+        if "ratio" in baseline.get(name, {}):
+            base = baseline[name]
+            change = 100.0 * (ratio - base["ratio"]) / base["ratio"]
+            limit = max(threshold,
+                        100.0 * SPREAD_K * math.hypot(base["spread"], results[name]["spread"]))
+            line += " {:>10.2f} {:>+7.1f}% {:>7.1f}%".format(base["ratio"], change, limit)
+            if change > limit:
+                line += "  REGRESSION"
+                regressed.append(name)
+        print(line, flush=True)
+
+    if save and failed:
+        print("Baseline not saved: {} failed".format(", ".join(failed)))
+    elif save:
+        baseline.update(results)
+        with open(baseline_file, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print("Saved baseline to {}".format(baseline_file))
+
+    if regressed:
+        print("Regressions: {}".format(", ".join(regressed)))
+    if failed:
+        print("Failures: {}".format(", ".join(failed)))
+    return 1 if regressed or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
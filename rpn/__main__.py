@@ -12,6 +12,7 @@ import os
 import sys
 from rpn import app
 from rpn import exception
+from rpn import globl
 
 
 def main(argv):
@@ -26,9 +27,11 @@ def main(argv):
     except exception.FatalErr as e:
         if len(str(e)) > 0:
             print("Fatal error: {}".format(e)) # OK
+        globl.flight_dump()
         sys.exit(1)
     except exception.RuntimeErr as err_main:
         print("Uncaught exception: {} ({})".format(err_main.code, str(err_main))) # OK
+        globl.flight_dump()
         sys.exit(1)
 
     app.end_program()
@@ -34,29 +34,35 @@ from   rpn.debug     import dbg, typename
 from   rpn.exception import *   # pylint: disable=wildcard-import
 import rpn.flag
 import rpn.globl
+import rpn.profiler
 import rpn.tvm
 import rpn.type
 import rpn.unit
 import rpn.util
+import rpn.warm
 import rpn.word
 
 
 disable_all_extensions = False
 load_init_file = True
+profile_file = None
+warm_file = None
 want_debug = False
 
 
 def usage():
     print("""\
-Usage: rpn [-d] [-f FILE] [-i] [-l FILE] [-q] [-V] cmds...
+Usage: rpn [-d] [-f FILE] [-i] [-l FILE] [-P FILE] [-q] [-V] [-W FILE] cmds...
 
 -d        Enable debugging
 -f FILE   Load FILE and exit
 -i        Force interactive mode
 -l FILE   Load FILE and continue
+-P FILE   Profile all words, write report to FILE at exit
 -q        Do not load init file (~/.rpnrc)
 -Q        Disable all extensions (implies -q)
--V        Display version information""")
+-V        Display version information
+-W FILE   Warm start from profile FILE, and update it at exit""")
     sys.exit(64)                # EX_USAGE
 
 
@@ -84,7 +90,8 @@ def initialize(rpndir, argv):
     sigwinch_handler(0, 0)     # Read & define ROWS and COLS via stty(1)
 
     # Set initial conditions
-    rpn.globl.eval_string("clreg clflag clfin")
+    for prim in ["clreg", "clflag", "clfin"]:
+        rpn.globl.call_primitive(prim)
     rpn.flag.set_flag(rpn.flag.F_EQUAL_ISCLOSE)
     rpn.flag.set_flag(rpn.flag.F_SHOW_PROMPT)
 
@@ -134,7 +141,7 @@ def initialize(rpndir, argv):
 
 def define_variables():
     # Variables defined here are all protected=True by default
-    rpn.globl.sharpout = rpn.globl.defvar('#OUT', rpn.type.Integer(0),
+    rpn.globl.sharpout = rpn.globl.defvar('#OUT', None, var_class=rpn.util.OutColumnVariable,
                                           readonly=True, noshadow=True)
     rpn.tvm.CF = rpn.globl.defvar('CF', rpn.type.Integer(1),
                                   noshadow=True,
@@ -143,6 +150,9 @@ def define_variables():
                                   doc="Compounding Frequency")
     rpn.globl.scr_cols = rpn.globl.defvar('COLS', rpn.type.Integer(0),
                                           pre_hooks=[pre_require_int, pre_require_positive])
+    rpn.globl.disp_max = rpn.globl.defvar('DISPMAX', rpn.type.Integer(1000),
+                                          pre_hooks=[pre_require_int, pre_require_positive],
+                                          doc="Arrays with more elements are displayed summarized")
     rpn.tvm.FV = rpn.globl.defvar('FV', None,
                                   noshadow=True,
                                   pre_hooks=[pre_require_int_or_float],
@@ -168,6 +178,9 @@ def define_variables():
                                   pre_hooks=[pre_require_int, pre_require_positive],
                                   post_hooks=[post_label_with_identifier],
                                   doc="Payment Frequency")
+    rpn.globl.plot_mode = rpn.globl.defvar('PLOTMODE', rpn.type.Integer(0),
+                                           pre_hooks=[pre_require_int, pre_validate_plotmode_arg],
+                                           doc="plot rendering: 0=ASCII, 1=half blocks, 2=braille")
     rpn.tvm.PMT = rpn.globl.defvar('PMT', None,
                                    noshadow=True,
                                    pre_hooks=[pre_require_int_or_float],
@@ -204,13 +217,29 @@ def parse_args(argv):
     global want_debug             # pylint: disable=global-statement
     global load_init_file         # pylint: disable=global-statement
     global disable_all_extensions # pylint: disable=global-statement
+    global profile_file           # pylint: disable=global-statement
+    global warm_file              # pylint: disable=global-statement
 
     try:
-        opts, argv = getopt.getopt(argv, "dDf:il:qQV")
+        opts, argv = getopt.getopt(argv, "dDf:il:P:qQVW:")
     except getopt.GetoptError as e:
         print(str(e))           # OK
         usage()
 
+    # Start profiling and apply any warm start profile before any
+    # -f/-l file is loaded
+    for opt, arg in opts:
+        if opt == "-P":
+            profile_file = arg
+            rpn.profiler.profile_on()
+        elif opt == "-W":
+            warm_file = arg
+            try:
+                rpn.warm.load(arg)
+            except RuntimeErr as err_w_opt:
+                rpn.globl.lnwriteln(str(err_w_opt))
+            rpn.warm.start()
+
     for opt, arg in opts:
         if opt == "-d":         # Sets debug only when main_loop is ready
             want_debug = True
@@ -230,6 +259,8 @@ def parse_args(argv):
                 load_file(arg)
             except RuntimeErr as err_l_opt:
                 rpn.globl.lnwriteln(str(err_l_opt))
+        elif opt in ("-P", "-W"):
+            pass                # Handled above
         elif opt == "-q":
             load_init_file = False
         elif opt == "-Q":
@@ -278,7 +309,8 @@ def main_loop():
 
     if not rpn.globl.param_stack.empty():
         if rpn.globl.param_stack.size() == 1:
-            rpn.globl.eval_string("dup . cr")
+            for prim in ["dup", ".", "cr"]:
+                rpn.globl.call_primitive(prim)
         else:
             rpn.word.w_dot_s('.s')
 
@@ -299,7 +331,7 @@ def main_loop():
 
 
 def end_program():
-    if rpn.globl.sharpout.obj.value != 0:
+    if rpn.globl.out_col != 0:
         rpn.globl.writeln()
 
     if not rpn.globl.string_stack.empty():
@@ -308,7 +340,7 @@ def end_program():
             rpn.word.w_cr('cr')
         else:
             rpn.globl.lnwriteln("Strings:")
-            rpn.word.w_dollar_dot_s('$.s')
+            rpn.globl.lnwriteln(rpn.globl.string_stack)
 
     if not rpn.globl.param_stack.empty():
         if rpn.globl.param_stack.size() == 1:
@@ -316,7 +348,22 @@ def end_program():
             rpn.word.w_cr('cr')
         else:
             rpn.globl.lnwriteln("Stack:")
-            rpn.word.w_dot_s('.s')
+            rpn.globl.lnwriteln(rpn.globl.param_stack)
+    rpn.globl.flush()
+
+    rpn.profiler.sample_off()
+    if profile_file is not None:
+        rpn.profiler.profile_off()
+        try:
+            rpn.profiler.write_file(profile_file)
+        except RuntimeErr as err_profile:
+            rpn.globl.lnwriteln(str(err_profile))
+
+    if warm_file is not None:
+        try:
+            rpn.warm.save(warm_file)
+        except RuntimeErr as err_warm:
+            rpn.globl.lnwriteln(str(err_warm))
 
 
 def generate_token_list():
@@ -524,6 +571,7 @@ def sigint_handler(_signam, _frame):
 
 def sigquit_handler(_signum, _frame):
     rpn.globl.lnwriteln("[Quit]")
+    rpn.globl.flight_dump()
     raise EndProgram()
 
 
@@ -558,6 +606,10 @@ def pre_require_non_negative(identifier, _cur, new):
     if new.value < 0:
         throw(X_INVALID_ARG, "!{}".format(identifier), "Must be non-negative")
 
+def pre_validate_plotmode_arg(identifier, _cur, new):
+    if new.value not in [0, 1, 2]:
+        throw(X_INVALID_ARG, "!{}".format(identifier), "PLOTMODE {} out of range (0..2 expected)".format(new.value))
+
 def pre_validate_sreg_arg(identifier, _cur, new):
     if type(new) is not rpn.type.Integer:
         throw(X_ARG_TYPE_MISMATCH, "!{}".format(identifier), "({})".format(typename(new)))
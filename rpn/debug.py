@@ -29,6 +29,7 @@ debug_levels = {
     "Symbol#eval"               : 0,
     "Word#__init__"             : 0,
     "ascii"                     : 0,
+    "callsite"                  : 0,
     "catch"                     : 0,
     "constant"                  : 2,
     "cross"                     : 0,
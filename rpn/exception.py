@@ -177,8 +177,11 @@ throw_code_text = {
 
 
 class RuntimeErr(Exception):
+    thrown = 0                  # Instances ever created
+
     def __init__(self, code=0, from_thrower="", message=""):
         super().__init__()
+        RuntimeErr.thrown += 1
         self.code = code
         self.from_thrower = from_thrower
         self.message = message
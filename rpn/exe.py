@@ -6,6 +6,7 @@
 #############################################################################
 '''
 
+import collections
 import sys
 
 
@@ -21,6 +22,8 @@ import rpn.globl
 
 
 class Executable:
+    __slots__ = ()
+
     def __call__(self, name):
         raise FatalErr("Executable#__call__: Subclass responsibility")
 
@@ -214,17 +217,127 @@ class BeginWhile(Executable):
         return "BeginWhile[{}, {}]".format(repr(self._begin_seq), repr(self._while_seq))
 
 
+#############################################################################
+#
+#       C A L L   S I T E
+#
+#############################################################################
+class CallSite(Executable):
+    """An inline cache around a built-in binary numeric word.  The call
+site remembers the (type(y), type(x)) pair it last saw.  If the next call
+matches, the cached handler runs directly: a rpn.word.binop_raw_table
+handler when both operands are unboxed numbers on the parameter stack, or
+a rpn.word.binop_table handler when neither operand has units.  Any miss
+falls back to the word's generic implementation and respecializes.
+A warm start profile (rpn.warm) can name a type pair to specialize on
+as soon as the call site is created."""
+
+    observed = collections.Counter() # (name, ytype, xtype) -> specializations
+    warm     = dict()                # name -> (ytype, xtype)
+
+    def __init__(self, word, table, raw_table):
+        me = whoami()
+        self.name = word.name
+        if type(word) is not rpn.util.Word:
+            raise FatalErr("{}: Word {} is not an rpn.util.Word".format(me, repr(word)))
+        self._word      = word
+        self._table     = table     # {(type(y), type(x), op): handler}
+        self._raw_table = raw_table # Same, for bare int/float/complex
+        self._ytype     = None
+        self._xtype     = None
+        self._handler   = None
+        self._raw       = False
+        pair = CallSite.warm.get(self.name)
+        if pair is not None:
+            self._specialize(pair[0], pair[1])
+            if self._handler is not None:
+                # Count it as the miss a cold call site would have taken
+                CallSite.observed[(self.name, pair[0], pair[1])] += 1
+
+    def __call__(self, name):
+        # Record before running, as Word.__call__ does
+        rpn.globl.flight.record(self._word)
+        dbg("trace", 1, "trace({})".format(repr(self)))
+        stack = rpn.globl.param_stack
+        if stack.size() >= 2:
+            x = stack.pop_raw()
+            y = stack.pop_raw()
+            if type(y) is self._ytype and type(x) is self._xtype:
+                if self._raw:
+                    result = self._handler(y, x)
+                    if result is not None:
+                        stack.push_raw(result)
+                        rpn.flag.set_flag(rpn.flag.F_SHOW_X)
+                        rpn.globl.counters["cache.callsite.hits"] += 1
+                        return
+                elif y.uexpr is None and x.uexpr is None:
+                    try:
+                        result = self._handler(self.name, y, x)
+                    except RuntimeErr:
+                        stack.push_raw(y)
+                        stack.push_raw(x)
+                        raise
+                    stack.push(result)
+                    rpn.flag.set_flag(rpn.flag.F_SHOW_X)
+                    rpn.globl.counters["cache.callsite.hits"] += 1
+                    return
+            stack.push_raw(y)
+            stack.push_raw(x)
+            self._respecialize(type(y), type(x))
+        self._word.run(self.name)
+
+    def _respecialize(self, ytype, xtype):
+        rpn.globl.counters["cache.callsite.misses"] += 1
+        CallSite.observed[(self.name, ytype, xtype)] += 1
+        self._specialize(ytype, xtype)
+
+    def _specialize(self, ytype, xtype):
+        key = (ytype, xtype, self.name)
+        if key in self._raw_table:
+            (handler, raw) = (self._raw_table[key], True)
+        elif key in self._table:
+            (handler, raw) = (self._table[key], False)
+        else:
+            return
+        dbg("callsite", 1, "{}: Specializing on ({}, {})".format(self.name, ytype.__name__, xtype.__name__))
+        self._ytype   = ytype
+        self._xtype   = xtype
+        self._handler = handler
+        self._raw     = raw
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return "CallSite[{}]".format(self.name)
+
+
 #############################################################################
 #
 #       C A S E
 #
 #############################################################################
 class Case(Executable):
-    def __init__(self, case_clauses, otherwise_seq):
+    def __init__(self, case_clauses, otherwise_seq, uses_caseval=True):
         self.name = 'case'
         self._case_clauses  = case_clauses
         self._otherwise_seq = otherwise_seq
 
+        # Jump table from label to clause.  The first clause with a
+        # given label wins, as it did with the linear scan.
+        self._dispatch = dict()
+        for clause in case_clauses.items():
+            self._dispatch.setdefault(clause.x(), clause)
+
+        # `caseval' gets a scope only if the clauses refer to it.  The
+        # scope and variable are allocated once and reused.
+        self._case_scope = None
+        self._caseval = None
+        if uses_caseval:
+            self._caseval = rpn.util.Variable("caseval")
+            self._case_scope = rpn.util.Scope("Case")
+            self._case_scope.define_variable('caseval', self._caseval)
+
     def __call__(self, name):
         dbg("trace", 2, "trace({})".format(repr(self)))
         if rpn.globl.param_stack.empty():
@@ -233,23 +346,21 @@ class Case(Executable):
         if type(n) is not rpn.type.Integer:
             rpn.globl.param_stack.push(n)
             throw(X_ARG_TYPE_MISMATCH, 'case', "({})".format(typename(n)))
-        nval = n.value
-
-        # Determine the correct sequence to call
-        seq = self._otherwise_seq
-        for clause in self._case_clauses.items():
-            if clause.x() == nval:
-                seq = clause
-                break
-
-        # Call it with a new scope
-        case_scope = rpn.util.Scope("Case")
-        case_scope.define_variable('caseval', rpn.util.Variable("caseval", n))
+        seq = self._dispatch.get(n.value, self._otherwise_seq)
+
+        if self._case_scope is None:
+            seq.__call__("seq")
+            return
+
+        # Save the old value in case this Case is re-entered recursively
+        old_caseval = self._caseval.obj
+        self._caseval.obj = n
         try:
-            rpn.globl.push_scope(case_scope, "Starting Case")
+            rpn.globl.push_scope(self._case_scope, "Starting Case")
             seq.__call__("seq")
         finally:
             rpn.globl.pop_scope("Case complete")
+            self._caseval.obj = old_caseval
 
     def patch_recurse(self, new_word):
         self._case_clauses.patch_recurse(new_word)
@@ -324,6 +435,7 @@ class Catch(Executable):
             rpn.globl.execute(self._word)
         except RuntimeErr as err_catch:
             dbg("catch", 1, "{}: Caught a throw, e={}".format(me, str(err_catch)))
+            rpn.globl.counters["throw.caught"] += 1
             rpn.globl.param_stack.push(rpn.type.Integer(int(err_catch.code)))
         else:
             dbg("catch", 1, "{}: Nothing caught, finishing normally".format(me))
@@ -560,7 +672,7 @@ the right thing with empty stack (uses zero)."""
                 rpn.word.w_dollar_cat('$cat')
             else:
                 rpn.globl.param_stack.push(var.obj)
-                rpn.globl.eval_string("anum")
+                rpn.globl.call_primitive("anum")
             rpn.flag.clear_flag(rpn.flag.F_SHOW_X)
         else:
             if self._modifier is not None and self._modifier == '/' and var.obj.zerop():
@@ -835,7 +947,7 @@ The TOS is consumed as normal."""
         if not stringp and self._modifier in ['+', '-', '*', '/']:
             rpn.globl.param_stack.push(cur_obj)
             rpn.flag.copy_flag(rpn.flag.F_SHOW_X, 54)
-            rpn.globl.eval_string("swap")
+            rpn.globl.call_primitive("swap")
             if self._modifier == '+':
                 rpn.word.w_plus('+')
             elif self._modifier == '-':
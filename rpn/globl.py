@@ -7,6 +7,7 @@
 '''
 
 from   fractions import Fraction
+import collections
 import itertools
 import os
 import re
@@ -44,6 +45,8 @@ import rpn.util
 RPN_VERSION  = 15.8
 
 DATE_RE       = re.compile(r'^(\d{1,2})\.(\d{2})(\d{4})$') # MM.DDYYYY
+DISP_EDGE     = 3     # Elements shown at each end of a summarized array
+FLIGHT_SIZE   = 4096  # Flight recorder entries; must be a power of two
 INTEGER_RE    = re.compile(r'^\d+$')
 JULIAN_OFFSET = 1721424 # date.toordinal() returns 1 for 0001-01-01, so compensate
 MATRIX_MAX    = 999
@@ -59,23 +62,31 @@ SIZE_MAX      = 320   # R00..R319; further restricted by SIZE
 TIME_RE       = re.compile(r'^[-+]?(\d+)\.(\d{,2})(\d*)$') # HH.MMSSsss
 
 colon_stack       = rpn.util.Stack("Colon stack")
+counters          = collections.Counter() # Monotonic counters; see rpn.metrics
 default_protected = True
+disp_max          = None
 disp_stack        = rpn.util.Stack("Display stack", 1)
+flight            = rpn.util.FlightRecorder(FLIGHT_SIZE)
 got_interrupt     = False
 interactive       = None
 lexer             = None
-param_stack       = rpn.util.Stack("Parameter stack")
+out_col           = 0           # Output column; #OUT reads this
+out_tty           = sys.stdout.isatty()
+param_stack       = rpn.util.ParamStack("Parameter stack")
 parse_stack       = rpn.util.Stack("Parse stack")
+plot_mode         = None
+primitives        = dict()
 reg_stack         = rpn.util.Stack("Register stack", 1)
 return_stack      = rpn.util.Stack("Return stack")
 root_scope        = rpn.util.Scope("ROOT")
 rpn_parser        = None
-scope_stack       = rpn.util.Stack("Scope stack", 1)
+scope_stack       = rpn.util.ScopeChain("Scope stack", 1)
 scr_cols          = None
 scr_rows          = None
 sharpout          = None
 sigint_detected   = False
 stat_data         = []
+stat_sums         = rpn.util.StatSums()   # Running sums over stat_data
 string_stack      = rpn.util.Stack("String stack")
 uexpr             = dict()
 
@@ -123,6 +134,29 @@ def bool_to_int(condition):
     return 1 if condition is True else 0
 
 
+def call_primitive(name):
+    """Run the built-in word NAME directly, without the parser.  The
+    Word is looked up in the root scope once and then cached.  Colon
+    words are entered on the colon stack, as execute() does."""
+    word = primitives.get(name)
+    if word is None:
+        counters["cache.primitive.misses"] += 1
+        word = root_scope.word(name)
+        if word is None:
+            raise FatalErr("call_primitive: Word '{}' not found".format(name))
+        primitives[name] = word
+    else:
+        counters["cache.primitive.hits"] += 1
+    if word.typ != "colon":
+        word.__call__(name)
+        return
+    colon_stack.push(word)
+    try:
+        word.__call__(name)
+    finally:
+        colon_stack.pop()
+
+
 def convert_mode_to_radians(x, force_mode=None):
     me = whoami()
     mode = force_mode if force_mode is not None else angle_mode_letter()
@@ -147,32 +181,42 @@ def convert_radians_to_mode(r, force_mode=None):
     raise FatalErr("{}: Bad angle_mode '{}'".format(me, mode))
 
 
-def defvar(name, value, **kwargs):
+def defvar(name, value, var_class=None, **kwargs):
     me = whoami()
     if type(name) is not str:
         raise FatalErr("defvar: name '{}' is not a string ".format(name))
     root_scope.add_vname(rpn.util.VName(name))
-    var = rpn.util.Variable(name, value, **kwargs)
+    var = (var_class or rpn.util.Variable)(name, value, **kwargs)
     dbg(me, 1, "{}: Creating variable {} at address {} in {}".format(me, name, hex(id(var)), repr(root_scope)))
     root_scope.define_variable(name, var)
     return var
 
 
-def eval_string(s):
+def eval_string(s, catch=True):
+    """Parse and execute S.  Errors are reported and absorbed here,
+    unless CATCH is false, in which case they propagate to the caller."""
     me = whoami()
     dbg("eval_string", 1, "eval_string('{}')".format(s))
     scope_stack_size = scope_stack.size()
-    rpn.parser.initialize_lexer()
-    rpn.parser.initialize_parser()
+    counters["parse.calls"] += 1
+    pair = rpn.parser.acquire_parser()
+    # PLY clears errorok when a grammar action raises SyntaxError, after
+    # the action has reported the error, and then recovers silently
+    pair[1].errorok = True
     try:
-        result = rpn_parser.parse(s) # , debug=dbg("eval_string"))
+        result = pair[1].parse(s, lexer=pair[0]) # , debug=dbg("eval_string"))
+        if not catch and not pair[1].errorok:
+            raise ParseErr("Syntax error")
     except ParseErr as e:
         if str(e) != 'EOF':
+            if not catch:
+                raise
             rpn.globl.lnwriteln("Parse error: {}".format(str(e)))
     except RuntimeErr as e:
         dbg(me, 1, "{}: Caught RuntimeErr, code={}".format(me, e.code))
-        if e.code >= 0:
+        if e.code >= 0 or (not catch and e.code != X_EXIT):
             raise
+        counters["throw.caught"] += 1
         if e.code == X_ABORT or \
            e.code == X_ABORT_QUOTE:
             param_stack.clear()
@@ -194,6 +238,7 @@ def eval_string(s):
         if result is not None:
             dbg("eval_string", 1, "result={}".format(result))
     finally:
+        rpn.parser.release_parser(pair)
         if scope_stack.size() > scope_stack_size:
             dbg("eval_string", 1, "Gotta pop {} scopes from the stack".format(scope_stack.size() - scope_stack_size))
         while scope_stack.size() > scope_stack_size:
@@ -214,6 +259,8 @@ def execute(executable):
                 rpn.globl.colon_stack.pop()
     except RecursionError:
         lnwriteln("{}: Excessive recursion".format(executable))
+        if not interactive:
+            flight_dump()
     except RuntimeErr as err_execute:
         if err_execute.code == X_INTERRUPT:
             rpn.globl.lnwriteln(throw_code_text[X_INTERRUPT])
@@ -223,6 +270,14 @@ def execute(executable):
             return
         raise
 
+
+def flight_dump():
+    """Write the flight recorder to stderr for post-mortem analysis."""
+    flush()
+    sys.stderr.write("\n".join(flight.dump()) + "\n")
+    sys.stderr.flush()
+
+
 # I should really just use __format__() correctly
 def gfmt(x):
     return disp_stack.top().dcfmt(x)
@@ -309,6 +364,7 @@ def separate_decorations(ident):
 
 def lookup_variable(name, how_many=1):
     me = whoami()
+    counters["var.lookups"] += 1
     for (_, scope) in scope_stack.items_top_to_bottom():
         dbg(me, 1, "{}: Looking for variable {} in {}...".format(me, name, scope.name))
         dbg(me, 3, "{} has variables: {}".format(scope.name, scope.variables()))
@@ -334,7 +390,9 @@ def lookup_vname(ident):
         dbg(me, 3, "{} has vnames: {}".format(scope, scope.vnames()))
         if scope.has_vname_named(ident):
             dbg(me, 2, "{}: Found vname {} in {}".format(me, ident, repr(scope)))
-            return (scope.vname(ident), scope)
+            vname = scope.vname(ident)
+            vname.referenced = True
+            return (vname, scope)
     dbg(me, 2, "{}: VName {} not found".format(me, ident))
     return (None, None)
 
@@ -390,14 +448,11 @@ def push_scope(scope, why):
 
 
 def register_valid_p(reg):
-    me = whoami()
     if not isinstance(reg, int):
-        raise FatalErr("{}: Attempting to validate non-integer register {}".format(me, reg))
-    (sizevar, _) = rpn.globl.lookup_variable("SIZE")
-    size = sizevar.obj.value
-    if 0 <= reg < size:
-        return (True, size)
-    return (False, size)
+        raise FatalErr("register_valid_p: Attempting to validate non-integer register {}".format(reg))
+    # The register set caches SIZE, so no scope chain lookup is needed
+    reg_set = reg_stack.top()
+    return (reg_set.valid_p(reg), reg_set.size)
 
 
 def update_screen_size():
@@ -478,31 +533,37 @@ def show_version_info():
         rpn.globl.writeln("[not found]")
 
 
+# Output is written to sys.stdout without flushing, so it is line
+# buffered on a terminal and block buffered on a pipe.  flush() is
+# called before input is read, at cr on a terminal, and at exit.
+def flush():
+    sys.stdout.flush()
+
 def write(s=""):
+    global out_col              # pylint: disable=global-statement
     if len(s) == 0:
         return
-    outval = rpn.globl.sharpout.obj.value
-    newline = s.find("\n")
-    while newline != -1:
-        substring = s[:newline]
-        print(substring)       # OK
-        outval = 0
-        s = s[newline+1:]
-        newline = s.find("\n")
-    outval += len(s)
-    print(s, end='', flush=True) # OK
-    rpn.globl.sharpout.obj = rpn.type.Integer(outval)
+    sys.stdout.write(s)         # OK
+    counters["output.bytes"] += len(s)
+    newline = s.rfind("\n")
+    if newline == -1:
+        out_col += len(s)
+    else:
+        out_col = len(s) - newline - 1
 
 def writeln(s=""):
-    print(s, flush=True)       # OK
-    rpn.globl.sharpout.obj = rpn.type.Integer(0)
+    global out_col              # pylint: disable=global-statement
+    s = "{}\n".format(s)
+    sys.stdout.write(s)         # OK
+    counters["output.bytes"] += len(s)
+    out_col = 0
 
 def lnwrite(s=""):
-    if rpn.globl.sharpout.obj.value != 0:
+    if out_col != 0:
         writeln()
     write(s)
 
 def lnwriteln(s=""):
-    if rpn.globl.sharpout.obj.value != 0:
+    if out_col != 0:
         writeln()
     writeln(s)
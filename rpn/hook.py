@@ -0,0 +1,124 @@
+'''
+#############################################################################
+#
+#       E X E C U T I O N   H O O K S
+#
+#       Callbacks run before and after every word, and when a word
+#       throws.  Every word call goes through Word.__call__ (or a CallSite
+#       wrapping a binop word), so while any hook is registered those two
+#       methods are swapped for dispatching versions.  Once the last hook
+#       is removed the originals are put back, and the interpreter runs
+#       exactly its normal code path.
+#
+#       before(word)            Called before WORD runs
+#       after(word)             Called after WORD returns normally
+#       throw(word, err)        Called when WORD raises RuntimeErr ERR
+#
+#############################################################################
+'''
+
+from   rpn.exception import *   # pylint: disable=wildcard-import
+import rpn.exe
+import rpn.globl
+import rpn.util
+
+
+hooks = { "before" : [],
+          "after"  : [],
+          "throw"  : [] }
+
+_word_call     = rpn.util.Word.__call__
+_callsite_call = rpn.exe.CallSite.__call__
+_installed     = False
+_running       = False      # True while a hook runs; hooks do not nest
+
+
+def _dispatch(call, obj, word, name):
+    global _running             # pylint: disable=global-statement
+    if _running:
+        call(obj, name)
+        return
+
+    _running = True
+    try:
+        for fn in hooks["before"]:
+            fn(word)
+    finally:
+        _running = False
+
+    try:
+        call(obj, name)
+    except RuntimeErr as err_hook:
+        if hooks["throw"]:
+            _running = True
+            try:
+                for fn in hooks["throw"]:
+                    fn(word, err_hook)
+            finally:
+                _running = False
+        raise
+
+    _running = True
+    try:
+        for fn in hooks["after"]:
+            fn(word)
+    finally:
+        _running = False
+
+
+def _hooked_word_call(self, name):
+    _dispatch(_word_call, self, self, name)
+
+
+def _hooked_callsite_call(self, name):
+    # A CallSite that falls back runs its word with Word.run(), not
+    # Word.__call__, so hooks run once either way
+    _dispatch(_callsite_call, self, self._word, name)
+
+
+def _update():
+    global _installed           # pylint: disable=global-statement
+    want = any(hooks.values())
+    if want and not _installed:
+        rpn.util.Word.__call__    = _hooked_word_call
+        rpn.exe.CallSite.__call__ = _hooked_callsite_call
+        _installed = True
+    elif not want and _installed:
+        rpn.util.Word.__call__    = _word_call
+        rpn.exe.CallSite.__call__ = _callsite_call
+        _installed = False
+
+
+def add(kind, fn):
+    if kind not in hooks:
+        raise FatalErr("rpn.hook.add: Unknown hook kind '{}'".format(kind))
+    hooks[kind].append(fn)
+    _update()
+
+
+def remove(kind, fn):
+    if kind not in hooks:
+        raise FatalErr("rpn.hook.remove: Unknown hook kind '{}'".format(kind))
+    if fn in hooks[kind]:
+        hooks[kind].remove(fn)
+    _update()
+
+
+class SymbolHook:
+    '''Before hook that pushes the word name on the string stack and
+    evaluates an RPN symbol.'''
+
+    __slots__ = ['symbol']
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    def __call__(self, word):
+        rpn.globl.string_stack.push(rpn.type.String(word.name))
+        self.symbol.eval()
+
+    def __eq__(self, other):
+        return type(other) is SymbolHook and other.symbol._word is self.symbol._word
+
+    def __hash__(self):
+        return id(self.symbol._word)
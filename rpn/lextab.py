@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ABORT_QUOTE', 'AGAIN', 'ASCII', 'AT_SIGN', 'BEGIN', 'CASE', 'CATCH', 'CLOSE_BRACKET', 'CLOSE_PAREN', 'COLON', 'COMMA', 'CONSTANT', 'DO', 'DOC_STR', 'DOT_QUOTE', 'ELSE', 'ENDCASE', 'ENDOF', 'EXCLAM', 'FLOAT', 'FORGET', 'HELP', 'HIDE', 'IDENTIFIER', 'IF', 'INTEGER', 'LOOP', 'OF', 'OPEN_BRACKET', 'OPEN_PAREN', 'OTHERWISE', 'PLUS_LOOP', 'RATIONAL', 'RECURSE', 'REPEAT', 'SEMICOLON', 'SHOW', 'STRING', 'SYMBOL', 'THEN', 'UNDEF', 'UNTIL', 'VARIABLE', 'VBAR', 'WHILE', 'WS'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_newline>\\n+)|(?P<t_STRING>"([^"]|\\n)*")|(?P<t_SYMBOL>\'([^\']|\\n)*\')|(?P<t_RATIONAL>\\d+::\\d+(_[^ \\t\\n]+)?)|(?P<t_FLOAT>[-+]?((\\d+(\\.\\d*[eE][-+]?\\d+|[eE][-+]?\\d+|\\.\\d*))|(\\d*(\\.\\d+[eE][-+]?\\d+|[eE][-+]?\\d+|\\.\\d+)))(_[^ \\t\\n]+)?)|(?P<t_ASCII>ascii[ \t]+([^ \t]+))|(?P<t_INTEGER>[-+]?((0[xX][0-9a-fA-F]+)|(0[oO][0-7]+)|(0[bB][0-1]+)|(\\d+))(_[^ \\t\\n]+)?)|(?P<t_ABORT_QUOTE>abort"([^"]|\\n)*")|(?P<t_AT_SIGN>@)|(?P<t_BACKSLASH>\\\\.*)|(?P<t_CLOSE_PAREN>\\))|(?P<t_CLOSE_BRACKET>\\])|(?P<t_COMMA>,)|(?P<t_DOC_STR>doc:"([^"]|\\n)*")|(?P<t_DOT_QUOTE>\\."([^"]|\\n)*")|(?P<t_EXCLAM>!)|(?P<t_OPEN_BRACKET>\\[)|(?P<t_OPEN_PAREN>\\()|(?P<t_VBAR>\\|)|(?P<t_WS>[ \\t\\n]+)|(?P<t_IDENTIFIER>[-#$%&\\*+,./:;<=>?A-Z^_a-z~][-!"#$%&\\\'*+,./0-9:;<=>?@A-Z^_a-z~]*)', [None, ('t_newline', 'newline'), ('t_STRING', 'STRING'), None, ('t_SYMBOL', 'SYMBOL'), None, ('t_RATIONAL', 'RATIONAL'), None, ('t_FLOAT', 'FLOAT'), None, None, None, None, None, None, ('t_ASCII', 'ASCII'), None, ('t_INTEGER', 'INTEGER'), None, None, None, None, None, None, ('t_ABORT_QUOTE', 'ABORT_QUOTE'), None, ('t_AT_SIGN', 'AT_SIGN'), ('t_BACKSLASH', 'BACKSLASH'), ('t_CLOSE_PAREN', 'CLOSE_PAREN'), ('t_CLOSE_BRACKET', 'CLOSE_BRACKET'), ('t_COMMA', 'COMMA'), ('t_DOC_STR', 'DOC_STR'), None, ('t_DOT_QUOTE', 'DOT_QUOTE'), None, ('t_EXCLAM', 'EXCLAM'), ('t_OPEN_BRACKET', 'OPEN_BRACKET'), ('t_OPEN_PAREN', 'OPEN_PAREN'), ('t_VBAR', 'VBAR'), ('t_WS', 'WS'), ('t_IDENTIFIER', 'IDENTIFIER')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,157 @@
+'''
+#############################################################################
+#
+#       M E M O R Y   A C C O U N T I N G
+#
+#       Deep sys.getsizeof() walks over the interpreter's data areas.  An
+#       object is charged to the first area that reaches it, and to the
+#       nearest enclosing rpn.type object (or "other").  Words, scope
+#       frames and stacks are only entered from the area that owns them,
+#       so a Symbol's captured scope chain or a Sequence's reference to a
+#       global word is not charged twice.
+#
+#############################################################################
+'''
+
+import sys
+import tracemalloc
+import types
+
+import rpn.globl
+import rpn.profiler
+import rpn.unit
+import rpn.util
+import rpn.word
+
+
+_opaque = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+           types.MethodType, rpn.util.Word, rpn.util.Stack, rpn.util.ScopeFrame,
+           rpn.util.ScopeChain)
+_containers = (list, tuple, set, frozenset)
+_last_snapshot = None
+
+
+def _slot_values(obj):
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get("__slots__", ()):
+            try:
+                yield getattr(obj, slot)
+            except AttributeError:
+                pass
+
+
+def _walk(roots, seen, by_type):
+    """Return the total size of ROOTS and everything they reach that
+    is not already in SEEN.  BY_TYPE accumulates [count, bytes] per
+    rpn.type class name."""
+    total = 0
+    todo = [(obj, "other", True) for obj in roots]
+    while todo:
+        (obj, owner, force) = todo.pop()
+        if id(obj) in seen or (not force and isinstance(obj, _opaque)):
+            continue
+        seen.add(id(obj))
+        if type(obj).__module__ == "rpn.type":
+            owner = type(obj).__name__
+            by_type.setdefault(owner, [0, 0])[0] += 1
+        size = sys.getsizeof(obj)
+        total += size
+        by_type.setdefault(owner, [0, 0])[1] += size
+
+        if isinstance(obj, dict):
+            children = list(obj.keys()) + list(obj.values())
+        elif isinstance(obj, _containers):
+            children = list(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, _opaque):
+            children = [obj.__dict__]
+        else:
+            children = list(_slot_values(obj))
+        for child in children:
+            todo.append((child, owner, False))
+        if type(obj) is rpn.util.Scope:
+            # Words defined in a scope belong to that scope
+            for word in obj.words().values():
+                todo.append((word, owner, True))
+    return total
+
+
+def _scopes():
+    scopes = []
+    for (_, scope) in rpn.globl.scope_stack.items_bottom_to_top():
+        if scope not in scopes:
+            scopes.append(scope)
+    return scopes
+
+
+def _areas():
+    """Yield (area name, list of roots) in charging order."""
+    yield ("Caches", [rpn.globl.primitives, rpn.word.binop_table, rpn.word.binop_raw_table,
+                      rpn.word.fact_helper.memoized, rpn.word.fib_helper.memoized,
+                      rpn.profiler.stats, rpn.profiler.stacks, rpn.profiler.samples])
+    yield ("Parameter stack", rpn.globl.param_stack.snapshot())
+    yield ("String stack",    rpn.globl.string_stack.snapshot())
+    yield ("Return stack",    rpn.globl.return_stack.snapshot())
+    yield ("Statistics data", [rpn.globl.stat_data, rpn.globl.stat_sums])
+    yield ("Registers",       rpn.globl.reg_stack.snapshot())
+    for scope in _scopes():
+        yield ("Scope {} ({} words, {} variables)".format(scope.name, len(scope.words()), len(scope.variables())),
+               [scope])
+    yield ("Unit tables",     [rpn.unit.units, rpn.unit.category, rpn.unit.prefix_list, rpn.globl.uexpr])
+
+
+def usage():
+    """Return ([(area, bytes)], {class: [count, bytes]})."""
+    seen = set()
+    by_type = dict()
+    areas = [(name, _walk(roots, seen, by_type)) for (name, roots) in _areas()]
+    return (areas, by_type)
+
+
+def total():
+    (areas, _) = usage()
+    return sum([size for (_, size) in areas])
+
+
+def trace_on():
+    """Start tracemalloc so that report() can show allocation growth.
+    Tracing slows every allocation several times over, so it runs only
+    between trace_on() and trace_off()."""
+    global _last_snapshot       # pylint: disable=global-statement
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _last_snapshot = tracemalloc.take_snapshot()
+
+
+def trace_off():
+    global _last_snapshot       # pylint: disable=global-statement
+    tracemalloc.stop()
+    _last_snapshot = None
+
+
+def report(limit=10):
+    """Return report lines.  While tracemalloc is running, also show the
+    LIMIT source lines whose allocations grew most since the previous
+    report (or trace_on)."""
+    global _last_snapshot       # pylint: disable=global-statement
+    (areas, by_type) = usage()
+    lines = ["{:<48} {:>12}".format("Area", "Bytes")]
+    for (name, size) in areas:
+        lines.append("{:<48} {:>12}".format(name, size))
+    lines.append("{:<48} {:>12}".format("Total", sum([size for (_, size) in areas])))
+    lines.append("")
+    lines.append("{:<20} {:>10} {:>12}".format("Type", "Count", "Bytes"))
+    for (name, (count, size)) in sorted(by_type.items(), key=lambda kv: kv[1][1], reverse=True):
+        lines.append("{:<20} {:>10} {:>12}".format(name, count, size))
+
+    if not tracemalloc.is_tracing():
+        return lines
+    lines.append("")
+    (current, peak) = tracemalloc.get_traced_memory()
+    lines.append("tracemalloc: {} bytes current, {} bytes peak".format(current, peak))
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)])
+    if _last_snapshot is not None:
+        for stat in snapshot.compare_to(_last_snapshot, "lineno")[:limit]:
+            lines.append(str(stat))
+    _last_snapshot = snapshot
+    return lines
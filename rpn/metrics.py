@@ -0,0 +1,66 @@
+'''
+#############################################################################
+#
+#       M E T R I C S
+#
+#       Monotonic interpreter counters, for watching a long-lived session
+#       without attaching a profiler.  Most counters live in
+#       rpn.globl.counters and are bumped where the event happens; words
+#       executed come from the flight recorder, exceptions thrown from
+#       RuntimeErr, and object creation from each rpn.type class.
+#
+#############################################################################
+'''
+
+import json
+
+from   rpn.exception import *   # pylint: disable=wildcard-import
+import rpn.globl
+import rpn.type
+
+
+# Counters bumped in rpn.globl.counters, reported as 0 until they are
+COUNTERS = ("cache.callsite.hits", "cache.callsite.misses",
+            "cache.primitive.hits", "cache.primitive.misses",
+            "output.bytes", "parse.calls", "parse.lexer_builds",
+            "scope.pushes", "throw.caught", "var.lookups", "words.colon")
+
+
+def snapshot():
+    """Return a dict of counter name -> value, including derived
+    totals and cache hit rates."""
+    result = dict.fromkeys(COUNTERS, 0)
+    result.update(rpn.globl.counters)
+    total = rpn.globl.flight.steps()
+    result["words.total"]   = total
+    result["words.builtin"] = total - result["words.colon"]
+    result["throw.thrown"]  = RuntimeErr.thrown
+    for cls in rpn.type.Stackable.__subclasses__():
+        result["alloc." + cls.__name__] = cls._allocs[0]
+    for cache in ["callsite", "primitive"]:
+        hits   = result["cache.{}.hits".format(cache)]
+        misses = result["cache.{}.misses".format(cache)]
+        result["cache.{}.hit_rate".format(cache)] = hits / (hits + misses) if hits + misses > 0 else 0.0
+    return result
+
+
+def report():
+    lines = []
+    for (name, value) in sorted(snapshot().items()):
+        if type(value) is float:
+            lines.append("{:<28} {:>14.4f}".format(name, value))
+        else:
+            lines.append("{:<28} {:>14}".format(name, value))
+    return lines
+
+
+def as_json():
+    return json.dumps(snapshot(), indent=2, sort_keys=True)
+
+
+def write_file(name, filename):
+    try:
+        with open(filename, "w") as file:
+            file.write(as_json() + "\n")
+    except OSError as e:
+        throw(X_FILE_IO, name, "Cannot write file '{}': {}".format(filename, e.strerror))
@@ -252,10 +252,12 @@ def t_error(t):
 
 
 def initialize_lexer():
+    rpn.globl.counters["parse.lexer_builds"] += 1
     rpn.globl.lexer = lex.lex(optimize=True)
 
 
 
+
 
 #############################################################################
 #
@@ -296,7 +298,8 @@ def p_begin_while(p):
 
 def p_case(p):
     '''case : CASE case_scope_push case_clause_list otherwise_list ENDCASE case_scope_pop'''
-    p[0] = rpn.exe.Case(p[3], p[4])
+    # Only bind caseval at run time if some clause actually mentions it
+    p[0] = rpn.exe.Case(p[3], p[4], p[2].vname("caseval").referenced)
 
 def p_case_clause(p):
     '''case_clause : integer OF sequence ENDOF'''
@@ -304,17 +307,19 @@ def p_case_clause(p):
 
 def p_case_clause_list(p):
     '''case_clause_list : case_clause
-                        | case_clause case_clause_list'''
+                        | case_clause_list case_clause'''
     if len(p) == 2:
         p[0] = rpn.util.List(p[1])
     else:
-        p[0] = rpn.util.List(p[1], p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
-def p_case_scope_push(p):               # pylint: disable=unused-argument
+def p_case_scope_push(p):
     '''case_scope_push : empty'''
     scope = rpn.util.Scope("case")
     scope.add_vname(rpn.util.VName("caseval"))
     rpn.globl.push_scope(scope, "Parsing Case")
+    p[0] = scope
 
 def p_case_scope_pop(p):                # pylint: disable=unused-argument
     '''case_scope_pop : empty'''
@@ -458,15 +463,15 @@ def p_executable(p):
 
 def p_executable_list(p):
     '''executable_list : empty
-                       | executable executable_list'''
+                       | executable_list executable'''
+    # Left recursive, so each executable is appended in O(1)
     me = whoami()
     if len(p) == 2:
         p[0] = rpn.util.List()
     elif len(p) == 3:
-        if p[1] is None:
-            p[0] = p[2]
-        else:
-            p[0] = rpn.util.List(p[1], p[2])
+        if p[2] is not None:
+            p[1].append(p[2])
+        p[0] = p[1]
     dbg(me, 1, "{}: Returning {}".format(me, p[0]))
 
 def p_execute(p):
@@ -560,11 +565,11 @@ def p_hide(p):
 
 def p_identifier_list(p):
     '''identifier_list : empty
-                       | IDENTIFIER identifier_list'''
+                       | identifier_list IDENTIFIER'''
     if len(p) == 2:
         p[0] = rpn.util.List()
     elif len(p) == 3:
-        (_, ident) = rpn.globl.separate_decorations(p[1])
+        (_, ident) = rpn.globl.separate_decorations(p[2])
         if not rpn.util.Variable.name_valid_p(ident):
             rpn.globl.lnwriteln("|{}|: Variable name is not valid".format(ident))
             raise SyntaxError
@@ -572,7 +577,8 @@ def p_identifier_list(p):
         if var is not None and var.noshadow():
             rpn.globl.lnwriteln("|{}|: Variable cannot be shadowed".format(ident))
             raise SyntaxError
-        p[0] = rpn.util.List(p[1], p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_if_else_then(p):
     '''if_else_then : IF sequence ELSE sequence THEN'''
@@ -645,11 +651,12 @@ def p_number(p):
 
 def p_number_list(p):
     '''number_list : empty
-                   | number number_list'''
+                   | number_list number'''
     if len(p) == 2:
         p[0] = rpn.util.List()
     elif len(p) == 3:
-        p[0] = rpn.util.List(p[1], p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_otherwise_list(p):
     '''otherwise_list : empty
@@ -791,13 +798,12 @@ def p_vector(p):
 
 def p_vector_list(p):
     '''vector_list : vector
-                   | vector vector_list'''
-    me = whoami()
-    #rpn.globl.lnwriteln("{}: len={}".format(me, len(p)))
+                   | vector_list vector'''
     if len(p) == 2:
         p[0] = rpn.util.List(p[1])
     elif len(p) == 3:
-        p[0] = rpn.util.List(p[1], p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_word(p):
     '''word : IDENTIFIER'''
@@ -809,9 +815,33 @@ def p_word(p):
     if word is None:
         rpn.globl.lnwriteln("Word '{}' not found".format(name))
         raise SyntaxError
+    # Built-in binary numeric words get an inline cache
+    if word.typ == "python" and name in rpn.word.binop_unit_rule:
+        word = rpn.exe.CallSite(word, rpn.word.binop_table, rpn.word.binop_raw_table)
     p[0] = word
 
 
 def initialize_parser():
     #rpn.globl.rpn_parser = yacc.yacc(start='evaluate') # , errorlog=yacc.NullLogger())
     rpn.globl.rpn_parser = yacc.yacc(start='evaluate', errorlog=yacc.NullLogger())
+
+
+# Idle (lexer, parser) pairs.  Building them costs more than most
+# evaluations, so they are reused; eval_string can nest, so each level
+# takes its own pair.
+idle_parsers = []
+
+def acquire_parser():
+    if idle_parsers:
+        (lexer, parser) = idle_parsers.pop()
+        lexer.lineno = 1
+        rpn.globl.lexer = lexer
+        rpn.globl.rpn_parser = parser
+    else:
+        initialize_lexer()
+        initialize_parser()
+    return (rpn.globl.lexer, rpn.globl.rpn_parser)
+
+
+def release_parser(pair):
+    idle_parsers.append(pair)
@@ -0,0 +1,152 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'evaluateABORT_QUOTE AGAIN ASCII AT_SIGN BEGIN CASE CATCH CLOSE_BRACKET CLOSE_PAREN COLON COMMA CONSTANT DO DOC_STR DOT_QUOTE ELSE ENDCASE ENDOF EXCLAM FLOAT FORGET HELP HIDE IDENTIFIER IF INTEGER LOOP OF OPEN_BRACKET OPEN_PAREN OTHERWISE PLUS_LOOP RATIONAL RECURSE REPEAT SEMICOLON SHOW STRING SYMBOL THEN UNDEF UNTIL VARIABLE VBAR WHILE WSabort_quote : ABORT_QUOTEascii : ASCIIbegin_again : BEGIN sequence AGAINbegin_until : BEGIN sequence UNTILbegin_while : BEGIN sequence WHILE sequence REPEATcase : CASE case_scope_push case_clause_list otherwise_list ENDCASE case_scope_popcase_clause : integer OF sequence ENDOFcase_clause_list : case_clause\n                        | case_clause_list case_clausecase_scope_push : emptycase_scope_pop : emptycatch : CATCH IDENTIFIERcmd :  executable  executecolon : COLON IDENTIFIER docstring sequence SEMICOLON colon_define_wordcolon_define_word : emptycolon : COLON IDENTIFIER docstring error SEMICOLON complex : OPEN_PAREN real COMMA real CLOSE_PAREN constant : CONSTANT IDENTIFIERdo_loop : DO sequence LOOPdo_plusloop : DO sequence PLUS_LOOPdocstring : empty\n                 | DOC_STRdot_quote : DOT_QUOTEempty :evaluate : cmd\n                | cmd evaluateexecutable : abort_quote\n                  | ascii\n                  | begin_again\n                  | begin_until\n                  | begin_while\n                  | case\n                  | catch\n                  | colon\n                  | constant\n                  | do_loop\n                  | do_plusloop\n                  | dot_quote\n                  | fetch_var\n                  | forget\n                  | help\n                  | hide\n                  | if_then\n                  | if_else_then\n                  | matrix\n                  | number\n                  | recurse\n                  | show\n                  | store_var\n                  | string\n                  | symbol\n                  | undef\n                  | variable\n                  | vector\n                  | wordexecutable_list : empty\n                       | executable_list executableexecute : emptyfetch_var : AT_SIGN IDENTIFIERfloat : FLOATforget : FORGET IDENTIFIERhelp : HELP AGAIN\n            | HELP ASCII\n            | HELP BEGIN\n            | HELP CASE\n            | HELP CATCH\n            | HELP COLON\n            | HELP CONSTANT\n            | HELP DO\n            | HELP DOT_QUOTE\n            | HELP ELSE\n            | HELP ENDCASE\n            | HELP ENDOF\n            | HELP FORGET\n            | HELP HELP\n            | HELP HIDE\n            | HELP IDENTIFIER\n            | HELP IF\n            | HELP LOOP\n            | HELP OF\n            | HELP OTHERWISE\n            | HELP PLUS_LOOP\n            | HELP RECURSE\n            | HELP REPEAT\n            | HELP SEMICOLON\n            | HELP SHOW\n            | HELP THEN\n            | HELP UNDEF\n            | HELP UNTIL\n            | HELP VARIABLE\n            | HELP WHILEhide : HIDE IDENTIFIERidentifier_list : empty\n                       | identifier_list IDENTIFIERif_else_then : IF sequence ELSE sequence THENif_then : IF sequence THENinteger : INTEGERlocals : empty\n              | VBAR identifier_list VBARmatrix : OPEN_BRACKET vector_list CLOSE_BRACKETnumber : real\n              | rational\n              | complexnumber_list : empty\n                   | number_list numberotherwise_list : empty\n                      | OTHERWISE sequencerational : RATIONALreal : integer\n            | floatrecurse : RECURSEsequence : locals executable_listshow : SHOW IDENTIFIERstore_var : EXCLAM IDENTIFIERstring : STRINGsymbol : SYMBOLundef : UNDEF IDENTIFIERvariable :  VARIABLE IDENTIFIERvector : OPEN_BRACKET number_list CLOSE_BRACKETvector_list : vector\n                   | vector_list vectorword : IDENTIFIER'
+    
+_lr_action_items = {'ABORT_QUOTE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[33,33,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,33,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'ASCII':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[34,34,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,82,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,34,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'BEGIN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[35,35,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,83,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,35,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'CASE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[36,36,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,84,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,36,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'CATCH':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[37,37,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,85,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,37,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'COLON':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[39,39,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,86,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,39,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'CONSTANT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[40,40,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,87,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,40,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'DO':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[41,41,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,88,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,41,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'DOT_QUOTE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[42,42,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,89,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,42,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'AT_SIGN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[43,43,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,43,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'FORGET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[44,44,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,93,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,44,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'HELP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[45,45,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,80,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,45,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'HIDE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[46,46,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,94,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,46,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[47,47,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,96,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,47,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'OPEN_BRACKET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,52,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,116,118,120,122,123,124,125,126,132,133,134,135,136,137,138,139,140,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[52,52,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,115,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,115,-120,-114,-3,-4,-24,52,-56,-24,-21,-22,-19,-20,-96,-24,-100,-121,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'RECURSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[48,48,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,101,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,48,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'SHOW':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[49,49,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,104,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,49,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'EXCLAM':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[56,56,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,56,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[57,57,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,57,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'SYMBOL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[58,58,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,58,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'UNDEF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[50,50,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,106,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,50,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'VARIABLE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,45,47,48,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[51,51,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,108,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,51,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,53,54,55,56,57,58,59,60,61,63,64,66,67,69,70,71,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,127,128,132,133,134,135,136,137,138,139,141,145,146,147,151,152,157,158,161,162,163,164,165,166,168,169,],[38,38,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,74,-122,75,76,-24,-23,78,79,95,110,-24,-111,112,113,114,-101,-102,-103,120,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-24,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,38,-56,147,-93,-24,-21,-22,-19,-20,-96,-24,-100,-119,-57,-99,-94,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'RATIONAL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,52,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,115,117,119,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,142,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[61,61,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,-24,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-24,61,-104,-114,-3,-4,-24,61,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-105,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'OPEN_PAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,52,53,54,55,57,58,59,60,61,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,115,117,119,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,142,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[62,62,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,-24,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-24,62,-104,-114,-3,-4,-24,62,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-105,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'INTEGER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,38,41,42,47,48,52,53,54,55,57,58,59,60,61,62,63,64,66,67,69,70,72,73,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,115,117,119,120,122,123,124,125,126,129,130,132,133,134,135,136,137,138,139,141,142,143,145,146,149,151,152,157,158,161,162,163,164,165,166,167,168,169,],[63,63,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-24,-122,-24,-23,-24,-111,-24,-101,-102,-103,-115,-116,-109,-110,-108,63,-97,-60,-13,-58,-24,-98,63,-10,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-24,63,-104,-114,-3,-4,-24,63,-56,63,-8,-24,-21,-22,-19,-20,-96,-24,-100,-119,-105,63,-57,-99,-9,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-7,-14,-15,]),'FLOAT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,47,48,52,53,54,55,57,58,59,60,61,62,63,64,66,67,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,115,117,119,120,122,123,124,125,126,132,133,134,135,136,137,138,139,141,142,143,145,146,151,152,157,158,161,162,163,164,165,166,168,169,],[64,64,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-24,-23,-24,-111,-24,-101,-102,-103,-115,-116,-109,-110,-108,64,-97,-60,-13,-58,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-24,64,-104,-114,-3,-4,-24,64,-56,-24,-21,-22,-19,-20,-96,-24,-100,-119,-105,64,-57,-99,-24,-24,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,42,48,53,54,55,57,58,59,60,61,63,64,65,66,67,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,135,136,137,139,141,157,158,161,162,163,164,165,166,168,169,],[0,-25,-24,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-23,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-26,-13,-58,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-19,-20,-96,-100,-119,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'AGAIN':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,42,45,48,53,54,55,57,58,59,60,61,63,64,68,69,70,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,125,126,135,136,137,139,141,145,146,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-23,81,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,122,-24,-98,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-112,-56,-19,-20,-96,-100,-119,-57,-99,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'UNTIL':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,42,45,48,53,54,55,57,58,59,60,61,63,64,68,69,70,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,125,126,135,136,137,139,141,145,146,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-23,107,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,123,-24,-98,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-112,-56,-19,-20,-96,-100,-119,-57,-99,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'WHILE':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,42,45,48,53,54,55,57,58,59,60,61,63,64,68,69,70,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,125,126,135,136,137,139,141,145,146,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-24,-122,-23,109,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,124,-24,-98,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-112,-56,-19,-20,-96,-100,-119,-57,-99,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'LOOP':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,41,42,45,48,53,54,55,57,58,59,60,61,63,64,69,70,74,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,125,126,135,136,137,139,141,145,146,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-24,-23,97,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-24,-98,-12,-18,135,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-112,-56,-19,-20,-96,-100,-119,-57,-99,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'PLUS_LOOP':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,41,42,45,48,53,54,55,57,58,59,60,61,63,64,69,70,74,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,125,126,135,136,137,139,141,145,146,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-24,-23,100,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-24,-98,-12,-18,136,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-112,-56,-19,-20,-96,-100,-119,-57,-99,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'THEN':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,42,45,47,48,53,54,55,57,58,59,60,61,63,64,69,70,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,120,122,123,125,126,135,136,137,138,139,141,145,146,155,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-23,105,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-24,-98,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,137,-113,-117,-118,-114,-3,-4,-112,-56,-19,-20,-96,-24,-100,-119,-57,-99,163,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'ELSE':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,42,45,47,48,53,54,55,57,58,59,60,61,63,64,69,70,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,120,122,123,125,126,135,136,137,139,141,145,146,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-23,90,-24,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-24,-98,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,138,-113,-117,-118,-114,-3,-4,-112,-56,-19,-20,-96,-100,-119,-57,-99,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'REPEAT':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,42,45,48,53,54,55,57,58,59,60,61,63,64,69,70,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,124,125,126,135,136,137,139,141,144,145,146,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-23,102,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-24,-98,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-24,-112,-56,-19,-20,-96,-100,-119,157,-57,-99,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'SEMICOLON':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,42,45,48,53,54,55,57,58,59,60,61,63,64,69,70,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,125,126,132,133,134,135,136,137,139,141,145,146,153,154,157,158,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-23,103,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-24,-98,-12,-24,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-112,-56,-24,-21,-22,-19,-20,-96,-100,-119,-57,-99,161,162,-5,-24,-24,-16,-95,-17,-6,-11,-14,-15,]),'ENDCASE':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,42,45,48,53,54,55,57,58,59,60,61,63,64,69,70,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,125,126,129,130,135,136,137,139,141,145,146,148,149,150,151,157,158,159,161,162,163,164,165,166,167,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-23,91,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-24,-98,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-112,-56,-24,-8,-19,-20,-96,-100,-119,-57,-99,158,-9,-106,-24,-5,-24,-107,-24,-16,-95,-17,-6,-11,-7,-14,-15,]),'ENDOF':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,38,42,45,48,53,54,55,57,58,59,60,61,63,64,69,70,74,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,120,122,123,125,126,135,136,137,139,141,145,146,152,157,158,160,161,162,163,164,165,166,168,169,],[-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-1,-2,-122,-23,92,-111,-101,-102,-103,-115,-116,-109,-110,-108,-97,-60,-24,-98,-12,-18,-59,-61,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-113,-117,-118,-114,-3,-4,-112,-56,-19,-20,-96,-100,-119,-57,-99,-24,-5,-24,167,-24,-16,-95,-17,-6,-11,-14,-15,]),'VBAR':([35,41,47,71,75,124,127,128,132,133,134,138,147,151,152,],[71,71,71,-24,-24,71,146,-93,71,-21,-22,71,-94,71,71,]),'OF':([45,63,131,],[98,-97,152,]),'OTHERWISE':([45,129,130,149,167,],[99,151,-8,-9,-7,]),'CLOSE_BRACKET':([52,53,54,55,59,60,61,63,64,115,116,117,118,119,140,141,142,164,],[-24,-101,-102,-103,-109,-110,-108,-97,-60,-24,139,141,-120,-104,-121,-119,-105,-17,]),'COMMA':([59,60,63,64,121,],[-109,-110,-97,-60,143,]),'CLOSE_PAREN':([59,60,63,64,156,],[-109,-110,-97,-60,164,]),'DOC_STR':([75,],[134,]),'error':([75,132,133,134,],[-24,154,-21,-22,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'evaluate':([0,2,],[1,65,]),'cmd':([0,2,],[2,2,]),'executable':([0,2,125,],[3,3,145,]),'abort_quote':([0,2,125,],[4,4,4,]),'ascii':([0,2,125,],[5,5,5,]),'begin_again':([0,2,125,],[6,6,6,]),'begin_until':([0,2,125,],[7,7,7,]),'begin_while':([0,2,125,],[8,8,8,]),'case':([0,2,125,],[9,9,9,]),'catch':([0,2,125,],[10,10,10,]),'colon':([0,2,125,],[11,11,11,]),'constant':([0,2,125,],[12,12,12,]),'do_loop':([0,2,125,],[13,13,13,]),'do_plusloop':([0,2,125,],[14,14,14,]),'dot_quote':([0,2,125,],[15,15,15,]),'fetch_var':([0,2,125,],[16,16,16,]),'forget':([0,2,125,],[17,17,17,]),'help':([0,2,125,],[18,18,18,]),'hide':([0,2,125,],[19,19,19,]),'if_then':([0,2,125,],[20,20,20,]),'if_else_then':([0,2,125,],[21,21,21,]),'matrix':([0,2,125,],[22,22,22,]),'number':([0,2,117,125,],[23,23,142,23,]),'recurse':([0,2,125,],[24,24,24,]),'show':([0,2,125,],[25,25,25,]),'store_var':([0,2,125,],[26,26,26,]),'string':([0,2,125,],[27,27,27,]),'symbol':([0,2,125,],[28,28,28,]),'undef':([0,2,125,],[29,29,29,]),'variable':([0,2,125,],[30,30,30,]),'vector':([0,2,52,116,125,],[31,31,118,140,31,]),'word':([0,2,125,],[32,32,32,]),'real':([0,2,62,117,125,143,],[53,53,121,53,53,156,]),'rational':([0,2,117,125,],[54,54,54,54,]),'complex':([0,2,117,125,],[55,55,55,55,]),'integer':([0,2,62,72,117,125,129,143,],[59,59,59,131,59,59,131,59,]),'float':([0,2,62,117,125,143,],[60,60,60,60,60,60,]),'execute':([3,],[66,]),'empty':([3,35,36,41,47,52,69,71,75,115,124,129,132,138,151,152,158,161,],[67,70,73,70,70,119,126,128,133,119,70,150,70,70,70,70,166,169,]),'sequence':([35,41,47,124,132,138,151,152,],[68,77,111,144,153,155,159,160,]),'locals':([35,41,47,124,132,138,151,152,],[69,69,69,69,69,69,69,69,]),'case_scope_push':([36,],[72,]),'vector_list':([52,],[116,]),'number_list':([52,115,],[117,117,]),'executable_list':([69,],[125,]),'identifier_list':([71,],[127,]),'case_clause_list':([72,],[129,]),'case_clause':([72,129,],[130,149,]),'docstring':([75,],[132,]),'otherwise_list':([129,],[148,]),'case_scope_pop':([158,],[165,]),'colon_define_word':([161,],[168,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> evaluate","S'",1,None,None,None),
+  ('abort_quote -> ABORT_QUOTE','abort_quote',1,'p_abort_quote','parser.py',280),
+  ('ascii -> ASCII','ascii',1,'p_ascii','parser.py',284),
+  ('begin_again -> BEGIN sequence AGAIN','begin_again',3,'p_begin_again','parser.py',288),
+  ('begin_until -> BEGIN sequence UNTIL','begin_until',3,'p_begin_until','parser.py',292),
+  ('begin_while -> BEGIN sequence WHILE sequence REPEAT','begin_while',5,'p_begin_while','parser.py',296),
+  ('case -> CASE case_scope_push case_clause_list otherwise_list ENDCASE case_scope_pop','case',6,'p_case','parser.py',300),
+  ('case_clause -> integer OF sequence ENDOF','case_clause',4,'p_case_clause','parser.py',305),
+  ('case_clause_list -> case_clause','case_clause_list',1,'p_case_clause_list','parser.py',309),
+  ('case_clause_list -> case_clause_list case_clause','case_clause_list',2,'p_case_clause_list','parser.py',310),
+  ('case_scope_push -> empty','case_scope_push',1,'p_case_scope_push','parser.py',318),
+  ('case_scope_pop -> empty','case_scope_pop',1,'p_case_scope_pop','parser.py',325),
+  ('catch -> CATCH IDENTIFIER','catch',2,'p_catch','parser.py',329),
+  ('cmd -> executable execute','cmd',2,'p_cmd','parser.py',340),
+  ('colon -> COLON IDENTIFIER docstring sequence SEMICOLON colon_define_word','colon',6,'p_colon','parser.py',343),
+  ('colon_define_word -> empty','colon_define_word',1,'p_colon_define_word','parser.py',348),
+  ('colon -> COLON IDENTIFIER docstring error SEMICOLON','colon',5,'p_colon_error','parser.py',375),
+  ('complex -> OPEN_PAREN real COMMA real CLOSE_PAREN','complex',5,'p_complex','parser.py',380),
+  ('constant -> CONSTANT IDENTIFIER','constant',2,'p_constant','parser.py',384),
+  ('do_loop -> DO sequence LOOP','do_loop',3,'p_do_loop','parser.py',405),
+  ('do_plusloop -> DO sequence PLUS_LOOP','do_plusloop',3,'p_do_plusloop','parser.py',409),
+  ('docstring -> empty','docstring',1,'p_docstring','parser.py',413),
+  ('docstring -> DOC_STR','docstring',1,'p_docstring','parser.py',414),
+  ('dot_quote -> DOT_QUOTE','dot_quote',1,'p_dot_quote','parser.py',418),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',422),
+  ('evaluate -> cmd','evaluate',1,'p_evaluate','parser.py',428),
+  ('evaluate -> cmd evaluate','evaluate',2,'p_evaluate','parser.py',429),
+  ('executable -> abort_quote','executable',1,'p_executable','parser.py',432),
+  ('executable -> ascii','executable',1,'p_executable','parser.py',433),
+  ('executable -> begin_again','executable',1,'p_executable','parser.py',434),
+  ('executable -> begin_until','executable',1,'p_executable','parser.py',435),
+  ('executable -> begin_while','executable',1,'p_executable','parser.py',436),
+  ('executable -> case','executable',1,'p_executable','parser.py',437),
+  ('executable -> catch','executable',1,'p_executable','parser.py',438),
+  ('executable -> colon','executable',1,'p_executable','parser.py',439),
+  ('executable -> constant','executable',1,'p_executable','parser.py',440),
+  ('executable -> do_loop','executable',1,'p_executable','parser.py',441),
+  ('executable -> do_plusloop','executable',1,'p_executable','parser.py',442),
+  ('executable -> dot_quote','executable',1,'p_executable','parser.py',443),
+  ('executable -> fetch_var','executable',1,'p_executable','parser.py',444),
+  ('executable -> forget','executable',1,'p_executable','parser.py',445),
+  ('executable -> help','executable',1,'p_executable','parser.py',446),
+  ('executable -> hide','executable',1,'p_executable','parser.py',447),
+  ('executable -> if_then','executable',1,'p_executable','parser.py',448),
+  ('executable -> if_else_then','executable',1,'p_executable','parser.py',449),
+  ('executable -> matrix','executable',1,'p_executable','parser.py',450),
+  ('executable -> number','executable',1,'p_executable','parser.py',451),
+  ('executable -> recurse','executable',1,'p_executable','parser.py',452),
+  ('executable -> show','executable',1,'p_executable','parser.py',453),
+  ('executable -> store_var','executable',1,'p_executable','parser.py',454),
+  ('executable -> string','executable',1,'p_executable','parser.py',455),
+  ('executable -> symbol','executable',1,'p_executable','parser.py',456),
+  ('executable -> undef','executable',1,'p_executable','parser.py',457),
+  ('executable -> variable','executable',1,'p_executable','parser.py',458),
+  ('executable -> vector','executable',1,'p_executable','parser.py',459),
+  ('executable -> word','executable',1,'p_executable','parser.py',460),
+  ('executable_list -> empty','executable_list',1,'p_executable_list','parser.py',465),
+  ('executable_list -> executable_list executable','executable_list',2,'p_executable_list','parser.py',466),
+  ('execute -> empty','execute',1,'p_execute','parser.py',478),
+  ('fetch_var -> AT_SIGN IDENTIFIER','fetch_var',2,'p_fetch_var','parser.py',486),
+  ('float -> FLOAT','float',1,'p_float','parser.py',505),
+  ('forget -> FORGET IDENTIFIER','forget',2,'p_forget','parser.py',509),
+  ('help -> HELP AGAIN','help',2,'p_help','parser.py',518),
+  ('help -> HELP ASCII','help',2,'p_help','parser.py',519),
+  ('help -> HELP BEGIN','help',2,'p_help','parser.py',520),
+  ('help -> HELP CASE','help',2,'p_help','parser.py',521),
+  ('help -> HELP CATCH','help',2,'p_help','parser.py',522),
+  ('help -> HELP COLON','help',2,'p_help','parser.py',523),
+  ('help -> HELP CONSTANT','help',2,'p_help','parser.py',524),
+  ('help -> HELP DO','help',2,'p_help','parser.py',525),
+  ('help -> HELP DOT_QUOTE','help',2,'p_help','parser.py',526),
+  ('help -> HELP ELSE','help',2,'p_help','parser.py',527),
+  ('help -> HELP ENDCASE','help',2,'p_help','parser.py',528),
+  ('help -> HELP ENDOF','help',2,'p_help','parser.py',529),
+  ('help -> HELP FORGET','help',2,'p_help','parser.py',530),
+  ('help -> HELP HELP','help',2,'p_help','parser.py',531),
+  ('help -> HELP HIDE','help',2,'p_help','parser.py',532),
+  ('help -> HELP IDENTIFIER','help',2,'p_help','parser.py',533),
+  ('help -> HELP IF','help',2,'p_help','parser.py',534),
+  ('help -> HELP LOOP','help',2,'p_help','parser.py',535),
+  ('help -> HELP OF','help',2,'p_help','parser.py',536),
+  ('help -> HELP OTHERWISE','help',2,'p_help','parser.py',537),
+  ('help -> HELP PLUS_LOOP','help',2,'p_help','parser.py',538),
+  ('help -> HELP RECURSE','help',2,'p_help','parser.py',539),
+  ('help -> HELP REPEAT','help',2,'p_help','parser.py',540),
+  ('help -> HELP SEMICOLON','help',2,'p_help','parser.py',541),
+  ('help -> HELP SHOW','help',2,'p_help','parser.py',542),
+  ('help -> HELP THEN','help',2,'p_help','parser.py',543),
+  ('help -> HELP UNDEF','help',2,'p_help','parser.py',544),
+  ('help -> HELP UNTIL','help',2,'p_help','parser.py',545),
+  ('help -> HELP VARIABLE','help',2,'p_help','parser.py',546),
+  ('help -> HELP WHILE','help',2,'p_help','parser.py',547),
+  ('hide -> HIDE IDENTIFIER','hide',2,'p_hide','parser.py',558),
+  ('identifier_list -> empty','identifier_list',1,'p_identifier_list','parser.py',567),
+  ('identifier_list -> identifier_list IDENTIFIER','identifier_list',2,'p_identifier_list','parser.py',568),
+  ('if_else_then -> IF sequence ELSE sequence THEN','if_else_then',5,'p_if_else_then','parser.py',584),
+  ('if_then -> IF sequence THEN','if_then',3,'p_if_then','parser.py',588),
+  ('integer -> INTEGER','integer',1,'p_integer','parser.py',592),
+  ('locals -> empty','locals',1,'p_locals','parser.py',596),
+  ('locals -> VBAR identifier_list VBAR','locals',3,'p_locals','parser.py',597),
+  ('matrix -> OPEN_BRACKET vector_list CLOSE_BRACKET','matrix',3,'p_matrix','parser.py',641),
+  ('number -> real','number',1,'p_number','parser.py',647),
+  ('number -> rational','number',1,'p_number','parser.py',648),
+  ('number -> complex','number',1,'p_number','parser.py',649),
+  ('number_list -> empty','number_list',1,'p_number_list','parser.py',653),
+  ('number_list -> number_list number','number_list',2,'p_number_list','parser.py',654),
+  ('otherwise_list -> empty','otherwise_list',1,'p_otherwise_list','parser.py',662),
+  ('otherwise_list -> OTHERWISE sequence','otherwise_list',2,'p_otherwise_list','parser.py',663),
+  ('rational -> RATIONAL','rational',1,'p_rational','parser.py',670),
+  ('real -> integer','real',1,'p_real','parser.py',674),
+  ('real -> float','real',1,'p_real','parser.py',675),
+  ('recurse -> RECURSE','recurse',1,'p_recurse','parser.py',679),
+  ('sequence -> locals executable_list','sequence',2,'p_sequence','parser.py',683),
+  ('show -> SHOW IDENTIFIER','show',2,'p_show','parser.py',690),
+  ('store_var -> EXCLAM IDENTIFIER','store_var',2,'p_store_var','parser.py',699),
+  ('string -> STRING','string',1,'p_string','parser.py',724),
+  ('symbol -> SYMBOL','symbol',1,'p_symbol','parser.py',732),
+  ('undef -> UNDEF IDENTIFIER','undef',2,'p_undef','parser.py',745),
+  ('variable -> VARIABLE IDENTIFIER','variable',2,'p_variable','parser.py',775),
+  ('vector -> OPEN_BRACKET number_list CLOSE_BRACKET','vector',3,'p_vector','parser.py',794),
+  ('vector_list -> vector','vector_list',1,'p_vector_list','parser.py',800),
+  ('vector_list -> vector_list vector','vector_list',2,'p_vector_list','parser.py',801),
+  ('word -> IDENTIFIER','word',1,'p_word','parser.py',809),
+]
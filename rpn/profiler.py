@@ -0,0 +1,235 @@
+'''
+#############################################################################
+#
+#       P R O F I L E R
+#
+#       Per-word call counts and inclusive/exclusive times, collected by
+#       before/after/throw hooks (see rpn.hook).  While the profiler is
+#       off no hooks are registered, so there is no cost when disabled.
+#
+#       The sampling profiler instead takes a snapshot of the colon stack
+#       and the innermost executing word on every SIGPROF, which does not
+#       perturb tight loops the way per-call timing does.
+#
+#############################################################################
+'''
+
+import json
+import signal
+import time
+
+from   rpn.exception import *   # pylint: disable=wildcard-import
+import rpn.exe
+import rpn.globl
+import rpn.hook
+import rpn.util
+
+
+clock    = time.perf_counter
+enabled  = False
+frames   = []           # Active calls: [word, path, child_time, start]
+active   = dict()       # name -> number of activations on frames
+stats    = dict()       # name -> [calls, inclusive, exclusive]
+stacks   = dict()       # "outer;...;inner" -> exclusive time
+
+sampling = False
+samples  = dict()       # ("outer", ..., "inner") -> sample count
+old_sigprof = None
+_call_codes = (rpn.util.Word.__call__.__code__, rpn.exe.CallSite.__call__.__code__)
+
+
+def _account(frame, elapsed):
+    name = frame[0].name
+    s = stats.get(name)
+    if s is None:
+        s = stats[name] = [0, 0.0, 0.0]
+    exclusive = elapsed - frame[2]
+    s[0] += 1
+    s[2] += exclusive
+    # Recursive activations are already inside the outermost one
+    depth = active[name] - 1
+    active[name] = depth
+    if depth == 0:
+        s[1] += elapsed
+    stacks[frame[1]] = stacks.get(frame[1], 0.0) + exclusive
+    if frames:
+        frames[-1][2] += elapsed
+
+
+def _before(word):
+    name = word.name
+    path = frames[-1][1] + ";" + name if frames else name
+    active[name] = active.get(name, 0) + 1
+    frames.append([word, path, 0.0, clock()])
+
+
+def _after(word):
+    now = clock()
+    # Unwind frames abandoned by non-RuntimeErr exceptions
+    while frames:
+        frame = frames.pop()
+        _account(frame, now - frame[3])
+        if frame[0] is word:
+            break
+
+
+def _throw(word, _err):
+    _after(word)
+
+
+def profile_on():
+    global enabled              # pylint: disable=global-statement
+    if enabled:
+        return
+    frames.clear()
+    active.clear()
+    rpn.hook.add("before", _before)
+    rpn.hook.add("after",  _after)
+    rpn.hook.add("throw",  _throw)
+    enabled = True
+
+
+def profile_off():
+    global enabled              # pylint: disable=global-statement
+    if not enabled:
+        return
+    rpn.hook.remove("before", _before)
+    rpn.hook.remove("after",  _after)
+    rpn.hook.remove("throw",  _throw)
+    enabled = False
+
+
+def reset():
+    stats.clear()
+    stacks.clear()
+
+
+def report(limit=0):
+    """Return report lines sorted by exclusive time.  LIMIT > 0 keeps
+    only that many words."""
+    total = sum([s[2] for s in stats.values()])
+    rows = sorted(stats.items(), key=lambda kv: kv[1][2], reverse=True)
+    if limit > 0:
+        rows = rows[:limit]
+    lines = ["{:<20} {:>10} {:>12} {:>12} {:>6}".format("Word", "Calls", "Incl (s)", "Excl (s)", "Excl%")]
+    for (name, (calls, incl, excl)) in rows:
+        pct = 100.0 * excl / total if total > 0 else 0.0
+        lines.append("{:<20} {:>10} {:>12.6f} {:>12.6f} {:>6.1f}".format(name, calls, incl, excl, pct))
+    return lines
+
+
+def as_json():
+    return json.dumps({ "words" : { name : { "calls"     : calls,
+                                              "inclusive" : incl,
+                                              "exclusive" : excl }
+                                     for (name, (calls, incl, excl)) in stats.items() },
+                        "stacks": stacks }, indent=2)
+
+
+def as_collapsed():
+    """Collapsed stacks for flamegraph.pl: one "a;b;c usec" per line."""
+    return "".join(["{} {}\n".format(path, int(t * 1e6))
+                    for (path, t) in sorted(stacks.items())])
+
+
+def write_file(filename):
+    """Write the profile to FILENAME: JSON for *.json, collapsed stacks
+    for *.folded or *.collapsed, otherwise the text report."""
+    if filename.endswith(".json"):
+        text = as_json()
+    elif filename.endswith(".folded") or filename.endswith(".collapsed"):
+        text = as_collapsed()
+    else:
+        text = "\n".join(report()) + "\n"
+    try:
+        with open(filename, "w") as file:
+            file.write(text)
+    except OSError as e:
+        throw(X_FILE_IO, "profile", "Cannot write file '{}': {}".format(filename, e.strerror))
+
+
+def _sigprof_handler(_signum, frame):
+    # Runs between bytecodes: just record, no I/O.
+    leaf = None
+    while frame is not None:
+        if frame.f_code in _call_codes:
+            leaf = frame.f_locals.get("self")
+            break
+        frame = frame.f_back
+    path = tuple([w.name for w in rpn.globl.colon_stack._stack])
+    if leaf is not None:
+        if type(leaf) is rpn.exe.CallSite:
+            leaf = leaf._word
+        # A colon word is already on the colon stack (or about to be)
+        if leaf.typ != "colon":
+            path += (leaf.name,)
+    samples[path] = samples.get(path, 0) + 1
+
+
+def sample_on(interval):
+    """Sample every INTERVAL seconds of CPU time."""
+    global sampling             # pylint: disable=global-statement
+    global old_sigprof          # pylint: disable=global-statement
+    if sampling:
+        return
+    samples.clear()
+    old_sigprof = signal.signal(signal.SIGPROF, _sigprof_handler)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    sampling = True
+
+
+def sample_off():
+    global sampling             # pylint: disable=global-statement
+    if not sampling:
+        return
+    signal.setitimer(signal.ITIMER_PROF, 0)
+    signal.signal(signal.SIGPROF, old_sigprof)
+    sampling = False
+
+
+def sample_report(limit=0):
+    """Return report lines for the hottest words (by self and total
+    samples) and the hottest call paths.  LIMIT > 0 keeps only that
+    many of each."""
+    total = sum(samples.values())
+    own   = dict()
+    incl  = dict()
+    for (path, n) in samples.items():
+        if not path:
+            continue
+        own[path[-1]] = own.get(path[-1], 0) + n
+        for name in set(path):
+            incl[name] = incl.get(name, 0) + n
+    words = sorted(incl.items(), key=lambda kv: (own.get(kv[0], 0), kv[1]), reverse=True)
+    paths = sorted(samples.items(), key=lambda kv: kv[1], reverse=True)
+    if limit > 0:
+        words = words[:limit]
+        paths = paths[:limit]
+
+    def pct(n):
+        return 100.0 * n / total if total > 0 else 0.0
+
+    lines = ["{} samples".format(total),
+             "{:<20} {:>8} {:>6} {:>8} {:>6}".format("Word", "Self", "Self%", "Total", "Total%")]
+    for (name, n) in words:
+        o = own.get(name, 0)
+        lines.append("{:<20} {:>8} {:>6.1f} {:>8} {:>6.1f}".format(name, o, pct(o), n, pct(n)))
+    lines.append("")
+    lines.append("{:>8} {:>6}  {}".format("Samples", "%", "Path"))
+    for (path, n) in paths:
+        lines.append("{:>8} {:>6.1f}  {}".format(n, pct(n), " > ".join(path) if path else "[outside words]"))
+    return lines
+
+
+def sample_collapsed():
+    """Folded stacks for flamegraph.pl: one "a;b;c count" per line."""
+    return "".join(["{} {}\n".format(";".join(path) if path else "[outside words]", n)
+                    for (path, n) in sorted(samples.items())])
+
+
+def sample_write_file(filename):
+    try:
+        with open(filename, "w") as file:
+            file.write(sample_collapsed())
+    except OSError as e:
+        throw(X_FILE_IO, "sample", "Cannot write file '{}': {}".format(filename, e.strerror))
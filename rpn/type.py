@@ -43,7 +43,6 @@
 #############################################################################
 '''
 
-import copy
 import datetime
 from   fractions import Fraction
 import numbers
@@ -89,7 +88,13 @@ T_HAS_LABEL = 1 << 5
 
 
 class Stackable(rpn.exe.Executable):
+    __slots__ = ("name", "_value", "_label", "_type", "_uexpr")
+    # Objects created, for rpn.metrics.  Each subclass has its own cell,
+    # bumped in place so that counting never modifies the class.
+    _allocs = [0]
+
     def __init__(self):
+        type(self)._allocs[0] += 1
         self.name   = None
         self._value = None
         self._label = None
@@ -213,6 +218,9 @@ class Stackable(rpn.exe.Executable):
 #
 #############################################################################
 class Complex(Stackable):
+    __slots__ = ()
+    _allocs   = [0]
+
     def __init__(self, real, imag):
         if not isinstance(real, numbers.Number) or \
            not isinstance(imag, numbers.Number):
@@ -224,6 +232,18 @@ class Complex(Stackable):
         self._value = complex(float(real), float(imag))
         self._uexpr  = None
 
+    @classmethod
+    def _new(cls, cplx):
+        """Trusted constructor: CPLX must be a complex.  Not validated."""
+        obj = cls.__new__(cls)
+        cls._allocs[0] += 1
+        obj.name   = "Complex"
+        obj._type  = T_COMPLEX
+        obj._value = cplx
+        obj._label = None
+        obj._uexpr = None
+        return obj
+
     @classmethod
     def from_complex(cls, cplx):
         return cls(cplx.real, cplx.imag)
@@ -258,9 +278,12 @@ class Complex(Stackable):
 #
 #############################################################################
 class Float(Stackable):
+    __slots__ = ()
+    _allocs   = [0]
+
     def __init__(self, val, uexpr=None):
-        if    (rpn.globl.have_module('numpy') and not isinstance(val, (float, np.float64))) \
-           or                                    (not isinstance(val, (float))):
+        # numpy.float64 is a subclass of float
+        if type(val) is not float and not isinstance(val, float):
             traceback.print_stack()
             raise FatalErr("Float value '{}' is not a float, it's a {}".format(val, type(val)))
         super().__init__()
@@ -269,6 +292,18 @@ class Float(Stackable):
         self._value = float(val)
         self._uexpr = uexpr
 
+    @classmethod
+    def _new(cls, val):
+        """Trusted constructor: VAL must be a float.  Not validated."""
+        obj = cls.__new__(cls)
+        cls._allocs[0] += 1
+        obj.name   = "Float"
+        obj._type  = T_FLOAT
+        obj._value = val
+        obj._label = None
+        obj._uexpr = None
+        return obj
+
     @classmethod
     def from_string(cls, s):
         ue = None
@@ -353,6 +388,9 @@ Failure:  (False, None, None, None, None)"""
 #
 #############################################################################
 class Integer(Stackable):
+    __slots__ = ()
+    _allocs   = [0]
+
     def __init__(self, val, uexpr=None):
         if not isinstance(val, int):
             traceback.print_stack()
@@ -363,6 +401,18 @@ class Integer(Stackable):
         self._value = int(val)
         self._uexpr = uexpr
 
+    @classmethod
+    def _new(cls, val):
+        """Trusted constructor: VAL must be an int.  Not validated."""
+        obj = cls.__new__(cls)
+        cls._allocs[0] += 1
+        obj.name   = "Integer"
+        obj._type  = T_INTEGER
+        obj._value = val
+        obj._label = None
+        obj._uexpr = None
+        return obj
+
     @classmethod
     def from_string(cls, s):
         ue = None
@@ -403,6 +453,9 @@ class Integer(Stackable):
 #
 #############################################################################
 class Matrix(Stackable):
+    __slots__ = ("_nrows", "_ncols")
+    _allocs   = [0]
+
     def __init__(self):
         if not rpn.globl.have_module('numpy'):
             throw(X_UNSUPPORTED, "", "Matrices require 'numpy' library")
@@ -451,7 +504,8 @@ class Matrix(Stackable):
         return self._ncols
 
     def instfmt(self):          # XXX
-        return str(self.value)
+        return np.array2string(self.value, threshold=rpn.globl.disp_max.obj.value,
+                               edgeitems=rpn.globl.DISP_EDGE)
 
 
 #############################################################################
@@ -460,6 +514,9 @@ class Matrix(Stackable):
 #
 #############################################################################
 class Rational(Stackable):
+    __slots__ = ()
+    _allocs   = [0]
+
     def __init__(self, num, denom, uexpr=None):
         if type(num) is not int or type(denom) is not int:
             traceback.print_stack()
@@ -471,6 +528,18 @@ class Rational(Stackable):
         self.value = Fraction(num, denom)
         self._uexpr = uexpr
 
+    @classmethod
+    def _new(cls, frac):
+        """Trusted constructor: FRAC must be a Fraction.  Not validated."""
+        obj = cls.__new__(cls)
+        cls._allocs[0] += 1
+        obj.name   = "Rational"
+        obj._type  = T_RATIONAL
+        obj._value = frac
+        obj._label = None
+        obj._uexpr = None
+        return obj
+
     @classmethod
     def from_Fraction(cls, frac):
         return cls(frac.numerator, frac.denominator)
@@ -568,7 +637,7 @@ class Symbol(rpn.exe.Executable):
         self._type = T_SYMBOL
         self._name = name
         self._word = word
-        self._scope_stack = None
+        self._scope_frame = None
         self.value = name
 
     # @classmethod
@@ -579,29 +648,27 @@ class Symbol(rpn.exe.Executable):
         return self._type
 
     def __call__(self, name):
-        me = whoami()
         dbg("trace", 1, "trace({})".format(repr(self)))
-        dbg(me, 3, "{}: (parse_time) orig scope stack\n{}".format(me, repr(rpn.globl.scope_stack)))
-        copy_scope_stack = copy.deepcopy(rpn.globl.scope_stack)
-        dbg(me, 3, "{}: (parse_time) copy scope stack\n{}".format(me, repr(copy_scope_stack)))
-        self._scope_stack = copy_scope_stack
+        # Scope frames are immutable and shared, so capturing the
+        # current environment is just a reference.
+        self._scope_frame = rpn.globl.scope_stack.frame()
         rpn.globl.string_stack.push(self)
 
     def eval(self):
         me = whoami()
         dbg("trace", 1, "trace({})".format(repr(self)))
         dbg(me, 1, "{}: name={}, word={}".format(me, self._name, self._word))
-        if self._scope_stack is None:
+        if self._scope_frame is None:
             raise FatalErr("{}: Symbol {} has no scope stack".format(me, str(self)))
 
+        old_scope_frame = rpn.globl.scope_stack.frame()
         try:
-            old_scope_stack = rpn.globl.scope_stack
-            dbg(me, 3, "{}: (eval time) old scope stack\n{}".format(me, repr(old_scope_stack)))
-            rpn.globl.scope_stack = self._scope_stack
-            dbg(me, 3, "{}: (eval time) new scope stack\n{}".format(me, repr(rpn.globl.scope_stack)))
+            rpn.globl.scope_stack.set_frame(self._scope_frame)
+            if dbg(me, 3):
+                dbg(me, 3, "{}: (eval time) new scope stack\n{}".format(me, repr(rpn.globl.scope_stack)))
             self._word.__call__(self._name)
         finally:
-            rpn.globl.scope_stack = old_scope_stack
+            rpn.globl.scope_stack.set_frame(old_scope_frame)
 
     def __str__(self):
         return "'{}'".format(str(self._name))
@@ -616,6 +683,9 @@ class Symbol(rpn.exe.Executable):
 #
 #############################################################################
 class Vector(Stackable):
+    __slots__ = ()
+    _allocs   = [0]
+
     def __init__(self):
         if not rpn.globl.have_module('numpy'):
             throw(X_UNSUPPORTED, "", "Vectors require 'numpy' library")
@@ -676,4 +746,15 @@ class Vector(Stackable):
     def instfmt(self):
         if self.size() == 0:
             return "[]"
-        return "[ " + " ".join([str(rpn.globl.to_rpn_class(e)) for e in self.value]) +" ]"
+        dc = rpn.globl.disp_stack.top()
+        v = self.value
+        edge = rpn.globl.DISP_EDGE
+        if v.size > rpn.globl.disp_max.obj.value and v.size > 2 * edge:
+            # Summarize; only the elements shown are formatted
+            return "[ " + " ".join(dc.fmt_elements(v[:edge])) + " ... " \
+                        + " ".join(dc.fmt_elements(v[-edge:])) + " ]"
+        return "[ " + " ".join(dc.fmt_elements(v)) + " ]"
+
+    def as_definition(self):
+        # A definition must be re-readable, so never summarize
+        return "[ " + " ".join(rpn.globl.disp_stack.top().fmt_elements(self.value)) + " ]"
@@ -10,6 +10,7 @@ import collections
 import math
 import queue
 import readline                 # pylint: disable=unused-import
+import time
 
 from   rpn.debug     import dbg, typename, whoami
 from   rpn.exception import *   # pylint: disable=wildcard-import
@@ -50,6 +51,7 @@ class DisplayConfig:
     def __init__(self):
         self._style = None
         self._prec  = None
+        self._ffmt  = str       # Float formatter, rebuilt by compile()
 
     @property
     def style(self):
@@ -61,6 +63,7 @@ class DisplayConfig:
         if new_style not in ["std", "fix", "sci", "eng"]:
             raise FatalErr("{}: Invalid display style '{}'".format(me, new_style))
         self._style = new_style
+        self.compile()
 
     @property
     def prec(self):
@@ -73,6 +76,7 @@ class DisplayConfig:
             self._prec = new_prec
             for bit in range(4):
                 rpn.flag.clear_flag(39 - bit)
+            self.compile()
             return
 
         if new_prec < 0 or new_prec >= rpn.globl.PRECISION_MAX:
@@ -83,6 +87,19 @@ class DisplayConfig:
                 rpn.flag.set_flag(39 - bit)
             else:
                 rpn.flag.clear_flag(39 - bit)
+        self.compile()
+
+    def compile(self):
+        """Build the float formatter for the current style and precision,
+        so dcfmt() does not have to assemble a format spec per number."""
+        if self._prec is None or self._style in [None, "std"]:
+            self._ffmt = str
+        elif self._style == "fix":
+            self._ffmt = "{{:.{}f}}".format(self._prec).format
+        elif self._style == "sci":
+            self._ffmt = "{{:.{}e}}".format(self._prec).format
+        elif self._style == "eng":
+            self._ffmt = self.eng_notate
 
     def __str__(self):
         s = ""
@@ -97,59 +114,125 @@ class DisplayConfig:
         Convert a float to a string in engineering units, with specified
         significant figures
         :param x: float to convert
-        :param sf: number of significant figures
-        :return: string conversion of x in scientific notation
+        :return: string conversion of x in engineering notation
         """
 
-        sf = self.prec
+        sf = max(self.prec, 1)
         if x == 0:
             return "0." + "0"*(sf-1) + "e+00"
+        # Let format() round to sf significant figures, then move the
+        # decimal point so the exponent is a multiple of 3
+        (mant, exp) = "{:.{}e}".format(x, sf-1).split("e")
         mant_sign = ""
-        if x < 0.0:
+        if mant[0] == "-":
             mant_sign = "-"
-            x = -x
-        # Normalize the number and round to get sf significant figures
-        mant, exp = frexp10(x)
-        r = round(mant, sf-1)
-        # Convert back to original scale
-        x = r * math.pow(10.0, exp)
-        # Get integer exponent to group by factors of 1000
-        p = int(math.floor(math.log10(x)))
+            mant = mant[1:]
+        digits = mant.replace(".", "")
+        p = int(exp)
         p3 = p // 3
-        # Get root value string
-        value = x / math.pow(10.0, 3*p3)
-        num_str = "{:f}".format(value)
-        # Slice to length, avoid trailing "."
-        if num_str[sf] != ".":
-            num_str = num_str[0:sf+1]
+        int_len = p - 3*p3 + 1
+        if len(digits) <= int_len:
+            num_str = digits + "0"*(int_len - len(digits))
         else:
-            num_str = num_str[0:sf]
+            num_str = digits[:int_len] + "." + digits[int_len:]
         exp_sign = "-" if p3 < 0 else "+"
-        exp_str = "{:02d}".format(abs(3*p3))
-        return mant_sign + num_str + "e" + exp_sign + exp_str
+        return "{}{}e{}{:02d}".format(mant_sign, num_str, exp_sign, abs(3*p3))
 
     def dcfmt(self, x):
-        me = whoami()
-        if type(x) is int:
+        t = type(x)
+        if t is float:
+            return self._ffmt(x)
+        if t is int:
             return str(x)
 
-        if type(x) is float:
-            if self.style == "fix":
-                return "{:.{prec}{style}}".format(x, style="f", prec=self.prec)
-            if self.style == "sci":
-                return "{:.{prec}{style}}".format(x, style="e", prec=self.prec)
-            if self.style == "eng":
-                return self.eng_notate(x)
-            if self.style == "std":
-                return str(x)
-
-        if type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex]:
+        if t in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex]:
             return x.instfmt()
 
-        if type(x) is rpn.type.Vector:
+        if t is rpn.type.Vector:
             return "{}".format(x.value)
 
-        raise FatalErr("{}: Cannot handle type '{}' for object {}".format(me, typename(x), x))
+        raise FatalErr("dcfmt: Cannot handle type '{}' for object {}".format(typename(x), x))
+
+    def fmt_elements(self, arr):
+        """Format the elements of numpy array ARR as their scalar Rpn
+        equivalents would print, without boxing each one."""
+        ffmt = self._ffmt
+        result = []
+        for e in arr.tolist():
+            t = type(e)
+            if t is float:
+                result.append(ffmt(e))
+            elif t is int:
+                result.append(str(e))
+            elif t is complex:
+                result.append("({},{})".format(ffmt(e.real), ffmt(e.imag)))
+            else:
+                result.append(str(rpn.globl.to_rpn_class(e)))
+        return result
+
+
+#############################################################################
+#
+#       F L I G H T   R E C O R D E R
+#
+#############################################################################
+class FlightRecorder:
+    """Ring buffer of the most recently executed words, with parameter
+    and colon stack depths and a timestamp, kept in parallel lists so
+    that recording allocates nothing.  SIZE must be a power of two."""
+    __slots__ = ("_mask", "_pos", "_words", "_pdepth", "_cdepth", "_times")
+
+    def __init__(self, size):
+        self._mask   = size - 1
+        self._pos    = 0
+        self._words  = [None] * size
+        self._pdepth = [0] * size
+        self._cdepth = [0] * size
+        self._times  = [0] * size
+
+    def record(self, word):
+        # Hot path: called for every word executed
+        i = self._pos & self._mask
+        self._pos += 1
+        globl = rpn.globl
+        self._words[i]  = word
+        self._pdepth[i] = len(globl.param_stack._stack)
+        self._cdepth[i] = len(globl.colon_stack._stack)
+        self._times[i]  = time.perf_counter_ns()
+
+    def size(self):
+        return self._mask + 1
+
+    def steps(self):
+        """Total number of words recorded since startup."""
+        return self._pos
+
+    def entries(self, n=0):
+        """Return up to N (0 = all) of the most recent entries, oldest
+        first, as (step, word, param depth, colon depth, ns)."""
+        count = min(self._pos, self._mask + 1)
+        if 0 < n < count:
+            count = n
+        result = []
+        for step in range(self._pos - count, self._pos):
+            i = step & self._mask
+            result.append((step, self._words[i], self._pdepth[i], self._cdepth[i], self._times[i]))
+        return result
+
+    def dump(self, n=0):
+        """Return report lines for the last N (0 = all) entries."""
+        entries = self.entries(n)
+        lines = ["Flight recorder: last {} of {} steps".format(len(entries), self._pos)]
+        if entries:
+            t0 = entries[-1][4]
+            for (step, word, pdepth, cdepth, t) in entries:
+                if word.typ == "colon":
+                    cdepth -= 1     # Already on the colon stack when recorded
+                lines.append("{:>10} {:>12.3f} ms  [d{}]  {}{}".format(
+                    step, (t - t0) / 1e6, pdepth, "  " * cdepth, word.name))
+        colons = [w.name for (_, w) in rpn.globl.colon_stack.items_bottom_to_top()]
+        lines.append("Colon stack: {}".format(" > ".join(colons) if colons else "(empty)"))
+        return lines
 
 
 #############################################################################
@@ -257,10 +340,48 @@ class Queue:
 #
 #############################################################################
 class RegisterSet:
+    """Numbered registers R00..R(SIZE_MAX-1) held in a list, plus the
+    index register I.  `size' caches the current SIZE bound.  copy()
+    shares the register list; whichever set writes first takes a
+    private copy (copy-on-write)."""
+    __slots__ = ("_regs", "_shared", "I", "size", "sreg")
+
     def __init__(self):
-        self.register = dict()
-        self.size     = 0
-        self.sreg     = 0
+        self._regs   = [rpn.type.Float(0.0) for _ in range(rpn.globl.SIZE_MAX)]
+        self._shared = False
+        self.I       = rpn.type.Integer(0)
+        self.size    = 0
+        self.sreg    = 0
+
+    def copy(self):
+        reg = RegisterSet.__new__(RegisterSet)
+        reg._regs   = self._regs
+        reg._shared = self._shared = True
+        reg.I       = self.I
+        reg.size    = self.size
+        reg.sreg    = self.sreg
+        return reg
+
+    def valid_p(self, r):
+        return 0 <= r < self.size
+
+    def __getitem__(self, r):
+        return self._regs[r]
+
+    def __setitem__(self, r, val):
+        if self._shared:
+            self._regs = self._regs[:]
+            self._shared = False
+        self._regs[r] = val
+
+    def clear(self, lo=0, hi=None):
+        """Zero registers LO..HI-1 (default all of them)."""
+        if hi is None:
+            hi = rpn.globl.SIZE_MAX
+        if self._shared:
+            self._regs = self._regs[:]
+            self._shared = False
+        self._regs[lo:hi] = [rpn.type.Float(0.0) for _ in range(hi - lo)]
 
 
 #############################################################################
@@ -269,6 +390,8 @@ class RegisterSet:
 #
 #############################################################################
 class Scope:
+    __slots__ = ("name", "_words", "_variables", "_vnames")
+
     def __init__(self, name):
         self.name = name
         self._words = {}
@@ -353,7 +476,7 @@ class Scope:
 
     def define_variable(self, identifier, var):
         me = whoami()
-        if type(var) is not Variable:
+        if not isinstance(var, Variable):
             raise FatalErr("{}: '{}' is not a Variable".format(me, identifier))
         dbg(me, 1, "{}: Setting variable '{}' to {} in {}".format(me, identifier, repr(var), repr(self)))
         self._variables[identifier] = var
@@ -380,6 +503,85 @@ class Scope:
         return ident in [v.ident for v in self._vnames]
 
 
+#############################################################################
+#
+#       S C O P E   C H A I N
+#
+#############################################################################
+class ScopeFrame:
+    """One immutable link in a scope chain.  Frames are never modified
+    after creation, so any number of chains may share them."""
+    __slots__ = ("scope", "parent", "depth")
+
+    def __init__(self, scope, parent):
+        self.scope  = scope
+        self.parent = parent
+        self.depth  = 1 if parent is None else parent.depth + 1
+
+
+class ScopeChain:
+    """The scope stack, held as a linked list of ScopeFrames.  It offers
+    the same interface as Stack, plus frame()/set_frame() so a Symbol
+    can capture its environment in O(1) and reinstate it later."""
+
+    def __init__(self, name, min_size=0):
+        self._name = name
+        self._frame = None
+        self._min_size = min_size
+
+    def name(self):
+        return self._name
+
+    def frame(self):
+        return self._frame
+
+    def set_frame(self, frame):
+        self._frame = frame
+
+    def size(self):
+        return 0 if self._frame is None else self._frame.depth
+
+    def empty(self):
+        return self._frame is None
+
+    def push(self, scope):
+        rpn.globl.counters["scope.pushes"] += 1
+        self._frame = ScopeFrame(scope, self._frame)
+
+    def pop(self):
+        if self._frame is None:
+            raise FatalErr("ScopeChain#pop: {}: Empty stack".format(self.name()))
+        if self._frame.depth == self._min_size:
+            throw(X_STACK_UNDERFLOW, "ScopeChain#pop", "{} has min size={}".format(self.name(), self._min_size))
+        scope = self._frame.scope
+        self._frame = self._frame.parent
+        return scope
+
+    def top(self):
+        if self._frame is None:
+            raise FatalErr("ScopeChain#top: {}: Empty stack".format(self.name()))
+        return self._frame.scope
+
+    def items_top_to_bottom(self):
+        """Return scopes from top to bottom, with 1-based indices."""
+        i = 0
+        f = self._frame
+        while f is not None:
+            i += 1
+            yield (i, f.scope)
+            f = f.parent
+
+    def items_bottom_to_top(self):
+        """Return scopes from bottom to top, with 1-based indices."""
+        return reversed(list(self.items_top_to_bottom()))
+
+    def __str__(self):
+        return "\n".join(["{}: {}".format(i, str(scope)) for (i, scope) in self.items_bottom_to_top()])
+
+    def __repr__(self):
+        return "ScopeChain[{}]".format(", ".join(["{}: {}".format(i, repr(scope)) for (i, scope) in self.items_bottom_to_top()]))
+
+
 #############################################################################
 #
 #       S E Q U E N C E
@@ -396,6 +598,7 @@ class Sequence:
     def __call__(self, name):
         me = whoami()
         dbg("trace", 2, "trace({})".format(repr(self)))
+        rpn.globl.counters["words.colon"] += 1
 
         # Build a runtime scope populated with actual Variables.
         # We need to create a new empty scope, populate it with new
@@ -500,7 +703,6 @@ class Stack:
     def __init__(self, name, min_size=0, max_size=-1):
         self._name = name
         self._stack = []
-        self._nitems = 0
         self._min_size = min_size
         self._max_size = max_size
 
@@ -508,71 +710,118 @@ class Stack:
         return self._name
 
     def clear(self):
-        me = whoami()
         if self._min_size > 0:
-            throw(X_STACK_UNDERFLOW, me, "{} has min size={}".format(self.name(), self._min_size))
-        self._stack = []
-        self._nitems = 0
+            throw(X_STACK_UNDERFLOW, "Stack#clear", "{} has min size={}".format(self.name(), self._min_size))
+        self._stack.clear()
 
     def size(self):
-        return self._nitems
+        return len(self._stack)
 
     def empty(self):
-        return self.size() == 0
+        return len(self._stack) == 0
 
     def push(self, item):
-        me = whoami()
-        if self.size() == self._max_size:
-            throw(X_STACK_OVERFLOW, me, "{} exceeded max size={} when attempting to push {}".format(self.name(), self._max_size, item))
-        self._nitems += 1
+        if len(self._stack) == self._max_size:
+            throw(X_STACK_OVERFLOW, "Stack#push", "{} exceeded max size={} when attempting to push {}".format(self.name(), self._max_size, item))
         self._stack.append(item)
 
+    def push_many(self, items):
+        """Push ITEMS in order; the last item ends up on top."""
+        items = list(items)
+        if self._max_size >= 0 and len(self._stack) + len(items) > self._max_size:
+            throw(X_STACK_OVERFLOW, "Stack#push_many", "{} exceeded max size={} when attempting to push {} items".format(self.name(), self._max_size, len(items)))
+        self._stack.extend(items)
+
     def pop(self):
-        me = whoami()
-        if self.empty():
-            raise FatalErr("{}: {}: Empty stack".format(me, self.name()))
-        if self.size() == self._min_size:
-            throw(X_STACK_UNDERFLOW, me, "{} has min size={}".format(self.name(), self._min_size))
-        self._nitems -= 1
+        n = len(self._stack)
+        if n == 0:
+            raise FatalErr("Stack#pop: {}: Empty stack".format(self.name()))
+        if n == self._min_size:
+            throw(X_STACK_UNDERFLOW, "Stack#pop", "{} has min size={}".format(self.name(), self._min_size))
         return self._stack.pop()
 
+    def pop_many(self, n):
+        """Remove the top N items and return them bottom to top."""
+        if n < 0 or n > len(self._stack):
+            raise FatalErr("Stack#pop_many: {}: Bad count".format(self.name()))
+        if len(self._stack) - n < self._min_size:
+            throw(X_STACK_UNDERFLOW, "Stack#pop_many", "{} has min size={}".format(self.name(), self._min_size))
+        if n == 0:
+            return []
+        items = self._stack[-n:]
+        del self._stack[-n:]
+        return items
+
     def pick(self, n):
         '''n will be 1-based, so handle appropriately.'''
-        me = whoami()
-        if n < 1 or n > self.size():
-            raise FatalErr("{}: {}: Bad index".format(me, self.name()))
-        return self._stack[self.size() - n]
+        if n < 1 or n > len(self._stack):
+            raise FatalErr("Stack#pick: {}: Bad index".format(self.name()))
+        return self._stack[-n]
 
     def roll(self, n):
-        '''n will be 1-based, so handle appropriately.'''
-        me = whoami()
-        if n < 1 or n > self.size():
-            raise FatalErr("{}: {}: Bad index".format(me, self.name()))
-        # Prevent stack underflow in unlucky situations.  Temporarily
-        # increase the stack minimum size, because we're just going to
-        # push an item back again to restore the situation.
-        self._min_size += 1
-        item = self._stack.pop(self.size() - n)
-        self._nitems -= 1
-        self._min_size -= 1
-        self.push(item)
+        '''n will be 1-based, so handle appropriately.  Move the Nth item
+        to the top.  Only the N-1 items above it are shifted.'''
+        if n < 1 or n > len(self._stack):
+            raise FatalErr("Stack#roll: {}: Bad index".format(self.name()))
+        self._stack.append(self._stack.pop(-n))
+
+    def roll_down(self, n):
+        '''n will be 1-based, so handle appropriately.  Move the top item
+        down to position N; the inverse of roll(n).'''
+        if n < 1 or n > len(self._stack):
+            raise FatalErr("Stack#roll_down: {}: Bad index".format(self.name()))
+        if n > 1:
+            item = self._stack.pop()
+            self._stack.insert(len(self._stack) - n + 1, item)
+
+    def ndrop(self, n):
+        """Discard the top N items."""
+        if n < 0 or n > len(self._stack):
+            raise FatalErr("Stack#ndrop: {}: Bad count".format(self.name()))
+        if len(self._stack) - n < self._min_size:
+            throw(X_STACK_UNDERFLOW, "Stack#ndrop", "{} has min size={}".format(self.name(), self._min_size))
+        if n > 0:
+            del self._stack[-n:]
+
+    def ndup(self, n):
+        """Push copies of the top N items, preserving their order."""
+        if n < 0 or n > len(self._stack):
+            raise FatalErr("Stack#ndup: {}: Bad count".format(self.name()))
+        if n > 0:
+            self.push_many(self._stack[-n:])
+
+    def swap2(self):
+        """( d c b a -- b a d c )"""
+        if len(self._stack) < 4:
+            raise FatalErr("Stack#swap2: {}: Bad index".format(self.name()))
+        s = self._stack
+        (s[-4], s[-3], s[-2], s[-1]) = (s[-2], s[-1], s[-4], s[-3])
 
     def top(self):
-        me = whoami()
-        if self.empty():
-            raise FatalErr("{}: {}: Empty stack".format(me, self.name()))
-        return self._stack[self.size() - 1]
+        if len(self._stack) == 0:
+            raise FatalErr("Stack#top: {}: Empty stack".format(self.name()))
+        return self._stack[-1]
+
+    def snapshot(self):
+        """Return an opaque copy of the stack contents for restore()."""
+        return list(self._stack)
+
+    def restore(self, saved):
+        self._stack[:] = saved
 
     def items_bottom_to_top(self):
         """Return stack items from bottom to top."""
-        i = self._nitems + 1
+        i = len(self._stack) + 1
         for item in self._stack:
             i -= 1
             yield (i, item)     # This yields 1-based indices; use i-1 for 0-based
 
     def items_top_to_bottom(self):
         """Return stack items from top to bottom."""
-        return reversed(list(self.items_bottom_to_top()))
+        s = self._stack
+        n = len(s)
+        for i in range(1, n + 1):
+            yield (i, s[n - i])
 
     def __str__(self):
         sa = []
@@ -581,6 +830,17 @@ class Stack:
         #print(sa)
         return "\n".join(sa)
 
+    def window_str(self, n):
+        '''Like __str__, but only the top N items are formatted.  N <= 0
+        means show everything.'''
+        depth = len(self._stack)
+        if n <= 0 or depth <= n:
+            return str(self)
+        sa = ["... ({} more)".format(depth - n)]
+        for i in range(n, 0, -1):
+            sa.append("{}: {}".format(i, str(self.pick(i))))
+        return "\n".join(sa)
+
     def __repr__(self):
         sa = []
         for (i, item) in self.items_bottom_to_top():
@@ -589,6 +849,242 @@ class Stack:
         return "Stack[{}]".format(", ".join(sa))
 
 
+#############################################################################
+#
+#       P A R A M   S T A C K
+#
+#############################################################################
+class ParamStack(Stack):
+    '''The parameter stack.  Integers, floats and complex numbers with
+    no label and no unit are stored as bare Python int/float/complex
+    values, and are boxed into new rpn.type objects only when they leave
+    the stack through pop(), top(), pick() or iteration.  Stack shuffling
+    never touches them, and the *_raw() methods let hot paths (see
+    rpn.exe.CallSite) compute on bare values without allocating.
+
+    Because boxing creates a new object, code must not modify the result
+    of top() or pick() and expect the stack to change.  Pop it, modify
+    it, and push it back instead.'''
+
+    @staticmethod
+    def box(item):
+        t = type(item)
+        if t is int:
+            return rpn.type.Integer._new(item)
+        if t is float:
+            return rpn.type.Float._new(item)
+        if t is complex:
+            return rpn.type.Complex._new(item)
+        return item
+
+    @staticmethod
+    def unbox(item):
+        t = type(item)
+        if     (t is rpn.type.Integer or t is rpn.type.Float or t is rpn.type.Complex) \
+           and item._label is None and item._uexpr is None:
+            return item._value
+        return item
+
+    def push(self, item):
+        if len(self._stack) == self._max_size:
+            throw(X_STACK_OVERFLOW, "ParamStack#push", "{} exceeded max size={} when attempting to push {}".format(self.name(), self._max_size, item))
+        self._stack.append(self.unbox(item))
+
+    def push_many(self, items):
+        super().push_many([self.unbox(item) for item in items])
+
+    def push_raw(self, value):
+        """Push a bare int/float/complex, or an already unboxed item."""
+        if len(self._stack) == self._max_size:
+            throw(X_STACK_OVERFLOW, "ParamStack#push_raw", "{} exceeded max size={} when attempting to push {}".format(self.name(), self._max_size, value))
+        self._stack.append(value)
+
+    def pop(self):
+        return self.box(super().pop())
+
+    def pop_many(self, n):
+        return [self.box(item) for item in super().pop_many(n)]
+
+    def pop_raw(self):
+        """Pop the item as stored: either a bare number or an rpn object."""
+        return super().pop()
+
+    def pick(self, n):
+        return self.box(super().pick(n))
+
+    def pick_raw(self, n):
+        return super().pick(n)
+
+    def top(self):
+        return self.box(super().top())
+
+    def items_bottom_to_top(self):
+        for (i, item) in super().items_bottom_to_top():
+            yield (i, self.box(item))
+
+    def items_top_to_bottom(self):
+        for (i, item) in super().items_top_to_bottom():
+            yield (i, self.box(item))
+
+
+#############################################################################
+#
+#       S T A T I S T I C S   S U M S
+#
+#############################################################################
+class StatSums:
+    """Running sums over the statistics data, updated by S+ and S- so
+    that summary statistics need no pass over the data.  Every float is
+    an integer multiple of 2**-1074, so the sums are kept exactly as
+    integers scaled by powers of 2**1074: retracting a sample leaves no
+    rounding drift, and results agree with the statistics module.
+    Infinities and NaNs cannot be scaled; they are only counted, and
+    results involving them follow IEEE arithmetic."""
+    __slots__ = ("n", "s1", "s2", "s3", "log_sum", "recip_sum", "zeros", "negatives",
+                 "nans", "pos_inf", "neg_inf", "recip_inf")
+
+    SCALE = 1074
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.n         = 0
+        self.s1        = 0      # Sum of x   * 2**SCALE
+        self.s2        = 0      # Sum of x^2 * 2**(2*SCALE)
+        self.s3        = 0      # Sum of x^3 * 2**(3*SCALE)
+        self.log_sum   = 0      # Sum of log(x) * 2**SCALE, positive x only
+        self.recip_sum = 0      # Sum of 1/x    * 2**SCALE, positive x only
+        self.zeros     = 0
+        self.negatives = 0
+        self.nans      = 0
+        self.pos_inf   = 0
+        self.neg_inf   = 0
+        self.recip_inf = 0      # Positive x so small that 1/x overflows
+
+    @staticmethod
+    def _fixed(x):
+        (num, den) = x.as_integer_ratio()
+        return num << (StatSums.SCALE - den.bit_length() + 1)
+
+    @staticmethod
+    def _div(num, den):
+        """NUM/DEN for positive DEN, saturating to infinity on overflow."""
+        try:
+            return num / den
+        except OverflowError:
+            return math.inf if num > 0 else -math.inf
+
+    def _update(self, x, sign):
+        self.n += sign
+        if math.isnan(x):
+            self.nans += sign
+            return
+        if math.isinf(x):
+            if x > 0:
+                self.pos_inf   += sign  # 1/x is zero, log(x) is inf
+            else:
+                self.neg_inf   += sign
+                self.negatives += sign
+            return
+        f = self._fixed(x)
+        self.s1 += sign * f
+        f2 = f * f
+        self.s2 += sign * f2
+        self.s3 += sign * f2 * f
+        if x > 0:
+            self.log_sum += sign * self._fixed(math.log(x))
+            r = 1 / x
+            if math.isinf(r):
+                self.recip_inf += sign
+            else:
+                self.recip_sum += sign * self._fixed(r)
+        elif x == 0:
+            self.zeros += sign
+        else:
+            self.negatives += sign
+
+    def add(self, x):
+        self._update(x, 1)
+
+    def remove(self, x):
+        self._update(x, -1)
+
+    def nonfinite(self):
+        return self.nans + self.pos_inf + self.neg_inf
+
+    def mean(self):
+        if self.nans > 0 or (self.pos_inf > 0 and self.neg_inf > 0):
+            return math.nan
+        if self.pos_inf > 0:
+            return math.inf
+        if self.neg_inf > 0:
+            return -math.inf
+        return self._div(self.s1, self.n << self.SCALE)
+
+    def _variance(self, ddof):
+        """Exact variance as (numerator, denominator)."""
+        return (self.n * self.s2 - self.s1 * self.s1,
+                (self.n * (self.n - ddof)) << (2 * self.SCALE))
+
+    def variance(self, ddof=1):
+        if self.nonfinite() > 0:
+            return math.nan
+        return self._div(*self._variance(ddof))
+
+    @staticmethod
+    def _sqrt(num, den):
+        """Correctly rounded square root of NUM/DEN, as statistics.stdev()
+        computes it."""
+        if not hasattr(math, "isqrt"):
+            return math.sqrt(StatSums._div(num, den))
+        q = (num.bit_length() - den.bit_length() - 109) // 2
+        if q >= 0:
+            den <<= 2 * q
+        else:
+            num <<= -2 * q
+        a = math.isqrt(num // den)
+        a |= a * a * den != num     # Round to odd
+        try:
+            return float(a << q) if q >= 0 else a / (1 << -q)
+        except OverflowError:
+            return math.inf
+
+    def stdev(self, ddof=1):
+        if self.nonfinite() > 0:
+            return math.nan
+        return self._sqrt(*self._variance(ddof))
+
+    def skew(self):
+        """Sample skewness; requires n >= 3 and nonzero variance."""
+        if self.nonfinite() > 0:
+            return math.nan
+        n = self.n
+        m3 = n * n * self.s3 - 3 * n * self.s1 * self.s2 + 2 * self.s1 ** 3
+        v  = n * self.s2 - self.s1 * self.s1
+        # skew^2 = m3^2 n (n-1) / ((n-2)^2 v^3), the scale factors cancelling
+        skew = self._sqrt(m3 * m3 * n * (n - 1), (n - 2) ** 2 * v ** 3)
+        return -skew if m3 < 0 else skew
+
+    def geometric_mean(self):
+        if self.nans > 0:
+            return math.nan
+        if self.pos_inf > 0:
+            return math.inf
+        return math.exp((self.log_sum / (1 << self.SCALE)) / self.n)
+
+    def harmonic_mean(self):
+        if self.nans > 0:
+            return math.nan
+        if self.zeros > 0 or self.recip_inf > 0:
+            return 0.0
+        if self.pos_inf == self.n:
+            return math.inf
+        if self.n == 1:
+            return self.s1 / (1 << self.SCALE)
+        return self._div(self.n << self.SCALE, self.recip_sum)
+
+
 #############################################################################
 #
 #       T O K E N   M G R
@@ -611,9 +1107,10 @@ class TokenMgr:
             rpn.flag.clear_flag(rpn.flag.F_SHOW_X)
 
             rpn.globl.lnwrite()
-            rpn.globl.sharpout.obj = rpn.type.Integer(len(prompt))
+            rpn.globl.flush()
+            rpn.globl.out_col = len(prompt)
             data = input(prompt)
-            rpn.globl.sharpout.obj = rpn.type.Integer(0)
+            rpn.globl.out_col = 0
 
         # Get all the tokens
         rpn.globl.lexer.input(data)
@@ -672,6 +1169,9 @@ class TokenMgr:
 #
 #############################################################################
 class Variable:
+    __slots__ = ("name", "_constant", "_doc", "_hidden", "_noshadow",
+                 "_protected", "_readonly", "_rpnobj", "_pre_hooks", "_post_hooks")
+
     def __init__(self, name, obj=None, **kwargs):
         if not Variable.name_valid_p(name):
             raise FatalErr("Invalid variable name '{}'".format(name))
@@ -812,16 +1312,33 @@ class Variable:
         return f"Variable['{self.name}'={self.addr()},value={repr(self.obj)}]"
 
 
+class OutColumnVariable(Variable):
+    """#OUT.  The output layer keeps the column in the plain int
+    rpn.globl.out_col; an Integer is only made when #OUT is fetched."""
+    __slots__ = ()
+
+    @property
+    def obj(self):
+        return rpn.type.Integer(rpn.globl.out_col)
+
+    @obj.setter
+    def obj(self, new_obj):
+        rpn.globl.out_col = new_obj.value
+
+
 #############################################################################
 #
 #       V N A M E
 #
 #############################################################################
 class VName:
+    __slots__ = ("ident", "in_p", "out_p", "referenced")
+
     def __init__(self, ident):
         self.ident = ident
         self.in_p = False
         self.out_p = False
+        self.referenced = False         # Set when parsed code looks it up
 
     def decorated(self):
         dec = ""
@@ -846,6 +1363,9 @@ class VName:
 #
 #############################################################################
 class Word:
+    __slots__ = ("name", "_args", "_defn", "_doc", "_hidden", "_immediate",
+                 "_protected", "_smudge", "_str_args", "typ")
+
     def __init__(self, name, typ, defn, **kwargs):
         self.name       = name
         self._args      = 0
@@ -938,6 +1458,7 @@ class Word:
         self._defn.__call__(arg)
 
     def __call__(self, name):
+        rpn.globl.flight.record(self)
         dbg("trace", 1, "trace({})".format(repr(self)))
         if rpn.globl.param_stack.size() < self.args():
             throw(X_INSUFF_PARAMS, self.name, "({} required)".format(self.args()))
@@ -946,6 +1467,15 @@ class Word:
 
         self._defn.__call__(self.name)
 
+    def run(self, name):
+        """__call__ without the flight recorder entry, for a CallSite
+        that has already recorded the step."""
+        if rpn.globl.param_stack.size() < self.args():
+            throw(X_INSUFF_PARAMS, self.name, "({} required)".format(self.args()))
+        if rpn.globl.string_stack.size() < self.str_args():
+            throw(X_INSUFF_STR_PARAMS, self.name, "({} required)".format(self.str_args()))
+        self._defn.__call__(name)
+
     def args(self):
         return self._args
 
@@ -1008,16 +1538,6 @@ class Word:
 
 
 
-def frexp10(x):
-    """
-    Return mantissa and exponent (base 10), similar to base-2 frexp()
-    :param x: floating point number
-    :return: tuple (mantissa, exponent)
-    """
-    exp = math.floor(math.log10(x))
-    return x/10**exp, exp
-
-
 def prompt_string():
     if not rpn.globl.interactive or \
        not rpn.flag.flag_set_p(rpn.flag.F_SHOW_PROMPT):
@@ -0,0 +1,81 @@
+'''
+#############################################################################
+#
+#       W A R M   S T A R T
+#
+#       With -W FILE, per-word call counts and the operand types seen by
+#       binop call sites are saved to FILE at exit.  On the next start
+#       the profile is applied before any file is loaded: call sites are
+#       created already specialized on their most common type pair.  The
+#       call counts are not used on load; they are kept in the profile
+#       for inspection.  Each save describes that run only.  Counting
+#       calls uses a before hook (rpn.hook), so it costs only when -W is
+#       given.
+#
+#############################################################################
+'''
+
+import collections
+import json
+
+from   rpn.exception import *   # pylint: disable=wildcard-import
+import rpn.exe
+import rpn.hook
+import rpn.word
+
+
+calls = collections.Counter()   # Word name -> calls this run
+
+
+def _count(word):
+    calls[word.name] += 1
+
+
+def _type_names():
+    """Map type name -> type for every operand type the binop tables know."""
+    names = dict()
+    for table in [rpn.word.binop_table, rpn.word.binop_raw_table]:
+        for (ytype, xtype, _) in table:
+            names[ytype.__name__] = ytype
+            names[xtype.__name__] = xtype
+    return names
+
+
+def load(filename):
+    """Apply the profile in FILENAME, if it exists."""
+    try:
+        with open(filename, "r") as file:
+            profile = json.load(file)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        throw(X_FILE_IO, "warm", "Cannot read profile '{}': {}".format(filename, e))
+
+    types = _type_names()
+    for (name, pairs) in profile.get("binops", {}).items():
+        # Most frequently observed pair first
+        for (yname, xname, _) in pairs:
+            if yname in types and xname in types:
+                rpn.exe.CallSite.warm[name] = (types[yname], types[xname])
+                break
+
+
+def start():
+    rpn.hook.add("before", _count)
+
+
+def save(filename):
+    rpn.hook.remove("before", _count)
+    # Call sites created pre-specialized count that as one observation,
+    # so the pairs they were warmed with carry over
+    by_word = collections.defaultdict(list)
+    for ((name, ytype, xtype), n) in rpn.exe.CallSite.observed.most_common():
+        by_word[name].append([ytype.__name__, xtype.__name__, n])
+    profile = { "calls"  : dict(calls.most_common()),
+                "binops" : by_word }
+    try:
+        with open(filename, "w") as file:
+            json.dump(profile, file, indent=2)
+            file.write("\n")
+    except OSError as e:
+        throw(X_FILE_IO, "warm", "Cannot write profile '{}': {}".format(filename, e.strerror))
@@ -12,6 +12,7 @@ import datetime
 import fcntl
 from   fractions import Fraction
 import functools
+import io
 import math
 import os
 import readline                 # pylint: disable=unused-import
@@ -22,6 +23,7 @@ import sys
 import tempfile                 # edit
 import termios
 import time
+import tracemalloc
 import tty
 
 
@@ -48,6 +50,10 @@ from   rpn.exception import *   # pylint: disable=wildcard-import
 from   rpn.debug import dbg, typename
 import rpn.flag
 import rpn.globl
+import rpn.hook
+import rpn.mem
+import rpn.metrics
+import rpn.profiler
 import rpn.tvm
 import rpn.util
 
@@ -99,12 +105,13 @@ def w_number_in(name):
     x = ""
     while len(x) == 0:
         try:
+            rpn.globl.flush()
             x = input()
             dbg(name, 1, f"#in: '{x}'")
         except EOFError:
             throw(X_EOF, name)
         else:
-            rpn.globl.sharpout.obj = rpn.type.Integer(0)
+            rpn.globl.out_col = 0
 
     newlexer = rpn.globl.lexer.clone()
     newlexer.input(x)
@@ -139,12 +146,13 @@ def w_dollar_in(name):
     x = ""
     while len(x) == 0:
         try:
+            rpn.globl.flush()
             x = input()
             dbg(name, 1, f"$in: '{x}'")
         except EOFError:
             throw(X_EOF, name)
         finally:
-            rpn.globl.sharpout.obj = rpn.type.Integer(0)
+            rpn.globl.out_col = 0
 
     rpn.globl.string_stack.push(rpn.type.String(x))
 
@@ -155,7 +163,7 @@ $.s
 Display string stack.""")
 def w_dollar_dot_s(name):       # pylint: disable=unused-argument
     if not rpn.globl.string_stack.empty():
-        rpn.globl.lnwriteln(rpn.globl.string_stack)
+        rpn.globl.lnwriteln(rpn.globl.string_stack.window_str(stack_window_rows()))
 
 
 @defword(name='$.s!', print_x=rpn.globl.PX_IO, hidden=True)
@@ -431,46 +439,7 @@ def w_star(name):
 | Matrix   |          |         |          |         |        |        |
 |----------+----------+---------+----------+---------+--------+--------|
 | ^Y    X> | Integer  | Float   | Rational | Complex | Vector | Matrix |"""
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-    if type(x) is rpn.type.Integer and type(y) is rpn.type.Integer:
-        result = rpn.type.Integer(y.value * x.value)
-    elif    type(x) is rpn.type.Float and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational] \
-         or type(y) is rpn.type.Float and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational]:
-        result = rpn.type.Float(float(y.value) * float(x.value))
-    elif    type(x) is rpn.type.Rational and type(y) in [rpn.type.Integer, rpn.type.Rational] \
-         or type(y) is rpn.type.Rational and type(x) in [rpn.type.Integer, rpn.type.Rational]:
-        result = rpn.type.Rational.from_Fraction(y.value * x.value)
-    elif    type(x) is rpn.type.Complex and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex] \
-         or type(y) is rpn.type.Complex and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex]:
-        result = rpn.type.Complex.from_complex(complex(y.value) * complex(x.value))
-    elif type(x) in [rpn.type.Vector, rpn.type.Matrix] or \
-         type(y) in [rpn.type.Vector, rpn.type.Matrix]:
-        if not rpn.globl.have_module('numpy'):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_UNSUPPORTED, name, "Vector/Matrix operation requires 'numpy' library")
-        try:
-            r = np.multiply(y.value, x.value)
-        except ValueError:
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name, f"Y={y}, X={x}")
-        dbg(name, 3, "{}: r={}, type(r)={}, r.dtype={}, r.shape={}, r.ndim={}" \
-                     .format(name, type(r), r, r.dtype, r.shape, r.ndim))
-        result = rpn.globl.to_rpn_class(r)
-    else:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-
-    if x.has_uexpr_p() and not y.has_uexpr_p():
-        result.uexpr = x.uexpr
-    elif not x.has_uexpr_p() and y.has_uexpr_p():
-        result.uexpr = y.uexpr
-    elif x.has_uexpr_p() and y.has_uexpr_p():
-        result.uexpr = rpn.unit.UProd(y.uexpr, x.uexpr)
-    rpn.globl.param_stack.push(result)
+    binop(name, '*')
 
 
 @defword(name='*/', args=3, print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -514,57 +483,7 @@ def w_plus(name):
 | Matrix   | Matrix   | Matrix  | Matrix   | Matrix  |        | Matrix |
 |----------+----------+---------+----------+---------+--------+--------|
 | ^Y    X> | Integer  | Float   | Rational | Complex | Vector | Matrix |"""
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-
-    if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
-       (y.has_uexpr_p() and not x.has_uexpr_p()):
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_INCONSISTENT_UNITS, name)
-    if x.has_uexpr_p() and y.has_uexpr_p():
-        if not rpn.unit.units_conform(x.uexpr, y.uexpr):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name)
-        # Convert Y to the units of X
-        new_ustr = str(x.uexpr)
-        y = y.uexpr_convert(new_ustr, name)
-
-    if type(x) is rpn.type.Integer and type(y) is rpn.type.Integer:
-        result = rpn.type.Integer(y.value + x.value)
-    elif    type(x) is rpn.type.Float and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational] \
-         or type(y) is rpn.type.Float and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational]:
-        result = rpn.type.Float(float(y.value) + float(x.value))
-    elif    type(x) is rpn.type.Rational and type(y) in [rpn.type.Integer, rpn.type.Rational] \
-         or type(y) is rpn.type.Rational and type(x) in [rpn.type.Integer, rpn.type.Rational]:
-        result = rpn.type.Rational.from_Fraction(y.value + x.value)
-    elif    type(x) is rpn.type.Complex and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex] \
-         or type(y) is rpn.type.Complex and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex]:
-        result = rpn.type.Complex.from_complex(complex(y.value) + complex(x.value))
-    elif type(x) in [rpn.type.Vector, rpn.type.Matrix] or \
-         type(y) in [rpn.type.Vector, rpn.type.Matrix]:
-        if not rpn.globl.have_module('numpy'):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_UNSUPPORTED, name, "Vector/Matrix operation requires 'numpy' library")
-        try:
-            r = np.add(y.value, x.value)
-        except ValueError:
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name, f"Y={y}, X={x}")
-        dbg(name, 3, "{}: r={}, type(r)={}, r.dtype={}, r.shape={}, r.ndim={}" \
-                     .format(name, type(r), r, r.dtype, r.shape, r.ndim))
-        result = rpn.globl.to_rpn_class(r)
-    else:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-
-    if x.has_uexpr_p():
-        result.uexpr = x.uexpr
-    rpn.globl.param_stack.push(result)
+    binop(name, '+')
 
 
 @defword(name='+loop', print_x=rpn.globl.PX_CONTROL, doc="""\
@@ -587,57 +506,33 @@ def w_plusloop(name):           # pylint: disable=unused-argument
 -   ( y x -- y-x )
 Subtraction.""")
 def w_minus(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
+    binop(name, '-')
 
-    if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
-       (y.has_uexpr_p() and not x.has_uexpr_p()):
-        rpn.globl.param_stack.push(y)
+
+@defword(name='-roll', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
+-roll   ( ... x -- ... )
+Roll stack elements in the opposite direction: move the top element down
+to position X.  This is the inverse of roll.
+2 -roll is equivalent to swap.
+3 -roll is equivalent to -rot.
+
+See also: roll""")
+def w_minus_roll(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) is not rpn.type.Integer:
         rpn.globl.param_stack.push(x)
-        throw(X_INCONSISTENT_UNITS, name)
-    if x.has_uexpr_p() and y.has_uexpr_p():
-        if not rpn.unit.units_conform(x.uexpr, y.uexpr):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name)
-        # Convert Y to the units of X
-        new_ustr = str(x.uexpr)
-        y = y.uexpr_convert(new_ustr, name)
-
-    if type(x) is rpn.type.Integer and type(y) is rpn.type.Integer:
-        result = rpn.type.Integer(y.value - x.value)
-    elif    type(x) is rpn.type.Float and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational] \
-         or type(y) is rpn.type.Float and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational]:
-        result = rpn.type.Float(float(y.value) - float(x.value))
-    elif    type(x) is rpn.type.Rational and type(y) in [rpn.type.Integer, rpn.type.Rational] \
-         or type(y) is rpn.type.Rational and type(x) in [rpn.type.Integer, rpn.type.Rational]:
-        result = rpn.type.Rational.from_Fraction(y.value - x.value)
-    elif    type(x) is rpn.type.Complex and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex] \
-         or type(y) is rpn.type.Complex and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex]:
-        result = rpn.type.Complex.from_complex(complex(y.value) - complex(x.value))
-    elif type(x) in [rpn.type.Vector, rpn.type.Matrix] or \
-         type(y) in [rpn.type.Vector, rpn.type.Matrix]:
-        if not rpn.globl.have_module('numpy'):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_UNSUPPORTED, name, "Vector/Matrix operation requires 'numpy' library")
-        try:
-            r = np.subtract(y.value, x.value)
-        except ValueError:
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name, f"Y={y}, X={x}")
-        dbg(name, 3, "{}: r={}, type(r)={}, r.dtype={}, r.shape={}, r.ndim={}" \
-                     .format(name, type(r), r, r.dtype, r.shape, r.ndim))
-        result = rpn.globl.to_rpn_class(r)
-    else:
-        rpn.globl.param_stack.push(y)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+
+    if x.value == 0:
+        return
+    if x.value < 0 or x.value > rpn.globl.param_stack.size():
+        msg = "Stack index out of range"
+        if not rpn.globl.param_stack.empty():
+            msg += " (1..{} expected)".format(rpn.globl.param_stack.size())
         rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
+        throw(X_INVALID_MEMORY, name, msg)
 
-    if x.has_uexpr_p():
-        result.uexpr = x.uexpr
-    rpn.globl.param_stack.push(result)
+    rpn.globl.param_stack.roll_down(x.value)
 
 
 @defword(name='.', args=1, print_x=rpn.globl.PX_IO, doc="""\
@@ -887,7 +782,7 @@ def w_dot_r(name):
 Print stack non-destructively.""")
 def w_dot_s(name):              # pylint: disable=unused-argument
     if not rpn.globl.param_stack.empty():
-        rpn.globl.lnwriteln(rpn.globl.param_stack)
+        rpn.globl.lnwriteln(rpn.globl.param_stack.window_str(stack_window_rows()))
 
 
 @defword(name='.s!', hidden=True, print_x=rpn.globl.PX_IO, doc="""\
@@ -912,57 +807,7 @@ def w_slash(name):
 | Matrix   |          |         |          |         |        |        |
 |----------+----------+---------+----------+---------+--------+--------|
 | ^Y    X> | Integer  | Float   | Rational | Complex | Vector | Matrix |"""
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-
-    if     type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex] \
-       and x.zerop():
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_FP_DIVISION_BY_ZERO, name, "X cannot be zero")
-
-    if    type(x) is rpn.type.Rational and type(y) in [rpn.type.Integer, rpn.type.Rational] \
-       or type(y) is rpn.type.Rational and type(x) in [rpn.type.Integer, rpn.type.Rational]:
-        result = rpn.type.Rational.from_Fraction(y.value / x.value)
-    elif    type(x) in [rpn.type.Integer, rpn.type.Float] and type(y) in [rpn.type.Integer, rpn.type.Float] \
-         or type(x) is rpn.type.Rational and type(y) is rpn.type.Float \
-         or type(y) is rpn.type.Rational and type(x) is rpn.type.Float:
-        r = float(y.value) / float(x.value)
-        if type(x) is rpn.type.Integer and type(y) is rpn.type.Integer and r.is_integer():
-            result = rpn.type.Integer(int(r))
-        else:
-            result = rpn.type.Float(float(r))
-    elif    type(x) is rpn.type.Complex and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex] \
-         or type(y) is rpn.type.Complex and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex]:
-        result = rpn.type.Complex.from_complex(complex(y.value) / complex(x.value))
-    elif type(x) in [rpn.type.Vector, rpn.type.Matrix] or \
-         type(y) in [rpn.type.Vector, rpn.type.Matrix]:
-        if not rpn.globl.have_module('numpy'):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_UNSUPPORTED, name, "Vector/Matrix operation requires 'numpy' library")
-        try:
-            r = np.divide(y.value, x.value)
-        except ValueError:
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name, f"Y={y}, X={x}")
-        dbg(name, 3, "{}: r={}, type(r)={}, r.dtype={}, r.shape={}, r.ndim={}" \
-                     .format(name, type(r), r, r.dtype, r.shape, r.ndim))
-        result = rpn.globl.to_rpn_class(r)
-    else:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-
-    if x.has_uexpr_p() and not y.has_uexpr_p():
-        result.uexpr = x.uexpr.invert()
-    elif not x.has_uexpr_p() and y.has_uexpr_p():
-        result.uexpr = y.uexpr
-    elif x.has_uexpr_p() and y.has_uexpr_p():
-        result.uexpr = rpn.unit.UQuot(y.uexpr, x.uexpr)
-
-    rpn.globl.param_stack.push(result)
+    binop(name, '/')
 
 
 # FORTH:        : /mod  1 -rot */mod  ;
@@ -1013,30 +858,7 @@ def w_semicolon(name):          # pylint: disable=unused-argument
 <   ( y x -- flag )
 Test if Y is less than X.""")
 def w_less_than(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-
-    if    type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
-       or type(y) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-    if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
-       (y.has_uexpr_p() and not x.has_uexpr_p()):
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_INCONSISTENT_UNITS, name)
-    if x.has_uexpr_p() and y.has_uexpr_p():
-        if not rpn.unit.units_conform(x.uexpr, y.uexpr):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name)
-        x = x.ubase_convert(name)
-        y = y.ubase_convert(name)
-
-    yval = float(y.value)
-    xval = float(x.value)
-    rpn.globl.param_stack.push(rpn.type.Integer(rpn.globl.bool_to_int(yval < xval)))
+    binop(name, '<')
 
 
 @defword(name='<<', args=2, print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -1062,162 +884,35 @@ def w_leftshift(name):
 <=   ( y x -- flag )
 Test if Y is less than or equal to X.""")
 def w_less_than_or_equal(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-
-    if    type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
-       or type(y) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-    if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
-       (y.has_uexpr_p() and not x.has_uexpr_p()):
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_INCONSISTENT_UNITS, name)
-    if x.has_uexpr_p() and y.has_uexpr_p():
-        if not rpn.unit.units_conform(x.uexpr, y.uexpr):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name)
-        y = y.ubase_convert(name)
-        x = x.ubase_convert(name)
-
-    yval = float(y.value)
-    xval = float(x.value)
-    rpn.globl.param_stack.push(rpn.type.Integer(rpn.globl.bool_to_int(yval <= xval)))
+    binop(name, '<=')
 
 
 @defword(name='<>', args=2, print_x=rpn.globl.PX_PREDICATE, doc="""\
 <>   ( y x -- flag )
 Test if Y is not equal to X.""")
 def w_not_equal(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-
-    if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
-       (y.has_uexpr_p() and not x.has_uexpr_p()):
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_INCONSISTENT_UNITS, name)
-    if x.has_uexpr_p() and y.has_uexpr_p():
-        if not rpn.unit.units_conform(x.uexpr, y.uexpr):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name)
-        cvt_x = x.ubase_convert(name)
-        cvt_y = y.ubase_convert(name)
-        (equal, reason) = equal_helper(cvt_x, cvt_y)
-    else:
-        (equal, reason) = equal_helper(x, y)
-
-    if equal == -1:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        if reason == X_ARG_TYPE_MISMATCH:
-            throw(reason, name, f"({typename(y)} {typename(x)})")
-        elif reason == X_UNSUPPORTED:
-            throw(reason, name, "Matrix/Vector comparison requires 'numpy' library")
-        else:
-            throw(reason, name, "Comparison failed")
-
-    rpn.globl.param_stack.push(rpn.type.Integer(0 if equal else 1))
+    binop(name, '<>')
 
 
 @defword(name='=', args=2, print_x=rpn.globl.PX_PREDICATE, doc="""\
 =   ( y x -- flag )
 Test if Y is equal to X.""")
 def w_equal(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-
-    if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
-       (y.has_uexpr_p() and not x.has_uexpr_p()):
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_INCONSISTENT_UNITS, name)
-    if x.has_uexpr_p() and y.has_uexpr_p():
-        if not rpn.unit.units_conform(x.uexpr, y.uexpr):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name)
-        cvt_x = x.ubase_convert(name)
-        cvt_y = y.ubase_convert(name)
-        (equal, reason) = equal_helper(cvt_x, cvt_y)
-    else:
-        (equal, reason) = equal_helper(x, y)
-
-    if equal == -1:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        if reason == X_ARG_TYPE_MISMATCH:
-            throw(reason, name, f"({typename(y)} {typename(x)})")
-        elif reason == X_UNSUPPORTED:
-            throw(reason, name, "Matrix/Vector comparison requires 'numpy' library")
-        else:
-            throw(reason, name, "Comparison failed")
-
-    rpn.globl.param_stack.push(rpn.type.Integer(equal))
+    binop(name, '=')
 
 
 @defword(name='>', args=2, print_x=rpn.globl.PX_PREDICATE, doc="""\
 >   ( y x -- flag )
 Test if Y is greater than X.""")
 def w_greater_than(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-
-    if    type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
-       or type(y) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-    if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
-       (y.has_uexpr_p() and not x.has_uexpr_p()):
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_INCONSISTENT_UNITS, name)
-    if x.has_uexpr_p() and y.has_uexpr_p():
-        if not rpn.unit.units_conform(x.uexpr, y.uexpr):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name)
-        y = y.ubase_convert(name)
-        x = x.ubase_convert(name)
-
-    yval = float(y.value)
-    xval = float(x.value)
-    rpn.globl.param_stack.push(rpn.type.Integer(rpn.globl.bool_to_int(yval > xval)))
+    binop(name, '>')
 
 
 @defword(name='>=', args=2, print_x=rpn.globl.PX_PREDICATE, doc="""\
 >=   ( y x -- flag )
 Test if Y is greater than or equal to X.""")
 def w_greater_than_or_equal(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-
-    if    type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
-       or type(y) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-    if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
-       (y.has_uexpr_p() and not x.has_uexpr_p()):
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_INCONSISTENT_UNITS, name)
-    if x.has_uexpr_p() and y.has_uexpr_p():
-        if not rpn.unit.units_conform(x.uexpr, y.uexpr):
-            rpn.globl.param_stack.push(y)
-            rpn.globl.param_stack.push(x)
-            throw(X_CONFORMABILITY, name)
-        y = y.ubase_convert(name)
-        x = x.ubase_convert(name)
-
-    yval = float(y.value)
-    xval = float(x.value)
-    rpn.globl.param_stack.push(rpn.type.Integer(rpn.globl.bool_to_int(yval >= xval)))
+    binop(name, '>=')
 
 
 @defword(name='>>', args=2, print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -1289,9 +984,10 @@ def w_to_disp(name):            # pylint: disable=unused-argument
 >label   ( x -- x )  [ "label" -- ]
 Set label of X.""")
 def w_to_label(name):           # pylint: disable=unused-argument
-    x = rpn.globl.param_stack.top()
+    x = rpn.globl.param_stack.pop()
     label = rpn.globl.string_stack.pop().value
     x.label = label
+    rpn.globl.param_stack.push(x)
 
 
 @defword(name='>r', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
@@ -1305,15 +1001,10 @@ def w_to_r(name):               # pylint: disable=unused-argument
 >reg   ( -- )
 Push current register set.""")
 def w_to_reg(name):            # pylint: disable=unused-argument
-    (size_var, _) = rpn.globl.lookup_variable("SIZE")
     (sreg_var, _) = rpn.globl.lookup_variable("SREG")
-    reg = rpn.util.RegisterSet()
-    reg.register = rpn.globl.reg_stack.top().register.copy()
-    reg.size     = size_var.obj.value
-    print(f"setting reg.size to {size_var.obj.value}")
-    reg.sreg     = sreg_var.obj.value
+    reg = rpn.globl.reg_stack.top().copy()      # Copy-on-write; O(1) until stored into
+    reg.sreg = sreg_var.obj.value
     rpn.globl.reg_stack.push(reg)
-    print(f"Pushing reg set {reg}")
 
 
 @defword(name='>unit', args=1, str_args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
@@ -1326,7 +1017,9 @@ def w_to_unit(name):            # pylint: disable=unused-argument
     if ue is None:
         rpn.globl.string_stack.push(strobj)
         throw(X_INVALID_UNIT, name, ustr)
-    rpn.globl.param_stack.top().uexpr = ue
+    x = rpn.globl.param_stack.pop()
+    x.uexpr = ue
+    rpn.globl.param_stack.push(x)
 
 
 if rpn.globl.have_module('numpy'):
@@ -1413,7 +1106,7 @@ def w_query_dup(name):
         rpn.globl.param_stack.push(x)
         throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
     if not x.zerop():
-        rpn.globl.eval_string("dup")
+        rpn.globl.call_primitive("dup")
 
 
 @defword(name='?flags', print_x=rpn.globl.PX_IO, hidden=True, doc="")
@@ -1464,6 +1157,7 @@ EXAMPLE:
 
 See also: key""")
 def w_query_key(name):     # pylint: disable=unused-argument
+    rpn.globl.flush()
     # Input that is not a tty doesn't get to play
     if not sys.stdin.isatty():
         rpn.globl.param_stack.push(rpn.type.Integer(-1))
@@ -1522,37 +1216,7 @@ variable is either findable by the system through its name, or it is not.""")
 ^   ( y x -- y^x )
 Exponentiation.""")
 def w_caret(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-    if    type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float, rpn.type.Complex] \
-       or type(y) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float, rpn.type.Complex]:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-
-    try:
-        r = pow(y.value, x.value)
-    except OverflowError:
-        rpn.globl.param_stack.push(x)
-        throw(X_FP_RESULT_OO_RANGE, name)
-
-    if type(r) is int:
-        result = rpn.type.Integer(r)
-    elif type(r) is float:
-        result = rpn.type.Float(r)
-    elif type(r) is complex:
-        result = rpn.type.Complex.from_complex(r)
-    else:
-        raise FatalErr("{}: pow() returned a strange type '{}'".format(name, type(r)))
-
-    if x.has_uexpr_p():
-        throw(X_INCONSISTENT_UNITS, name, "X cannot have unit expression")
-    if y.has_uexpr_p():
-        result.uexpr = rpn.unit.UPow(y.uexpr, x.value)
-        if isinstance(result.uexpr, rpn.unit.UNull):
-            result.uexpr = None
-
-    rpn.globl.param_stack.push(result)
+    binop(name, '^')
 
 
 @defword(name='abort', print_x=rpn.globl.PX_CONTROL, doc="""\
@@ -1912,6 +1576,93 @@ def w_begin(name):              # pylint: disable=unused-argument
     pass                        # Grammar rules handle this word
 
 
+@defword(name='bench', args=1, str_args=1, print_x=rpn.globl.PX_IO, doc="""\
+bench   ( n -- bytes iqr median )  [ sym -- ]
+Run a word N times and report its cost per call.  SYM may be a Symbol
+('word') or a String of commands; a String is re-parsed on every run.
+After a short warmup, each run is timed separately and both stacks are
+restored between runs.  Memory use is measured in a separate pass with
+tracemalloc.  Pushes the median and interquartile range of the run
+times in nanoseconds (labelled "ns/op" and "IQR ns/op"), and the median
+peak bytes allocated per run ("B/op").""")
+def w_bench(name):
+    x = rpn.globl.param_stack.pop()
+    s = rpn.globl.string_stack.pop()
+    if type(x) is not rpn.type.Integer or type(s) not in [rpn.type.Symbol, rpn.type.String]:
+        rpn.globl.string_stack.push(s)
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)}, {typename(s)})")
+    n = x.value
+    if n <= 0:
+        rpn.globl.string_stack.push(s)
+        rpn.globl.param_stack.push(x)
+        throw(X_INVALID_ARG, name, "Count must be positive")
+
+    if type(s) is rpn.type.Symbol:
+        run = s.eval
+    else:
+        def run():
+            rpn.globl.eval_string(s.value, catch=False)
+
+    clock = time.perf_counter_ns
+    params  = rpn.globl.param_stack.snapshot()
+    strings = rpn.globl.string_stack.snapshot()
+    times = []
+    peaks = []
+    try:
+        for _ in range(max(1, min(n // 10, 100))):
+            run()
+            rpn.globl.param_stack.restore(params)
+            rpn.globl.string_stack.restore(strings)
+
+        for _ in range(n):
+            start = clock()
+            run()
+            times.append(clock() - start)
+            rpn.globl.param_stack.restore(params)
+            rpn.globl.string_stack.restore(strings)
+
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            for _ in range(min(n, 100)):
+                base = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                run()
+                peaks.append(tracemalloc.get_traced_memory()[1] - base)
+                rpn.globl.param_stack.restore(params)
+                rpn.globl.string_stack.restore(strings)
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+    except Exception:
+        rpn.globl.param_stack.restore(params)
+        rpn.globl.string_stack.restore(strings)
+        rpn.globl.string_stack.push(s)
+        rpn.globl.param_stack.push(x)
+        raise
+
+    median = statistics.median(times)
+    if n >= 2:
+        q = statistics.quantiles(times, n=4)
+        iqr = q[2] - q[0]
+    else:
+        iqr = 0
+    alloc = statistics.median(peaks)
+    rpn.globl.lnwriteln("{}: {} runs, {:.0f} ns/op (IQR {:.0f}), {:.0f} B/op".format(s, n, median, iqr, alloc))
+
+    result = rpn.type.Float(float(alloc))
+    result.label = "B/op"
+    rpn.globl.param_stack.push(result)
+    result = rpn.type.Float(float(iqr))
+    result.label = "IQR ns/op"
+    rpn.globl.param_stack.push(result)
+    result = rpn.type.Float(float(median))
+    result.label = "ns/op"
+    rpn.globl.param_stack.push(result)
+
+
 @defword(name='binom', args=3, print_x=rpn.globl.PX_COMPUTE, doc="""\
 binom   ( n k p -- prob )
 Binomial probability.  Return the probability of an event occurring exactly
@@ -2193,10 +1944,8 @@ def w_clflag(name):             # pylint: disable=unused-argument
 clreg   ( -- )
 Clear all registers.""")
 def w_clreg(name):              # pylint: disable=unused-argument
-    rpn.globl.reg_stack.top().register = dict()
-    for i in range(rpn.globl.SIZE_MAX):
-        rpn.globl.reg_stack.top().register[i] = rpn.type.Float(0.0)
-    rpn.globl.reg_stack.top().register['I'] = rpn.type.Integer(0)
+    rpn.globl.reg_stack.top().clear()
+    rpn.globl.reg_stack.top().I = rpn.type.Integer(0)
 
 
 @defword(name='clrst', print_x=rpn.globl.PX_CONFIG, doc="""\
@@ -2223,10 +1972,10 @@ clstat   ( -- )
 Clear the statistics data.""")
 def w_clstat(name):             # pylint: disable=unused-argument
     rpn.globl.stat_data = []
+    rpn.globl.stat_sums.clear()
     (sreg_var, _) = rpn.globl.lookup_variable("SREG")
     sreg = sreg_var.obj.value
-    for i in range(6):
-        rpn.globl.reg_stack.top().register[sreg + i] = rpn.type.Float(0.0)
+    rpn.globl.reg_stack.top().clear(sreg, sreg + 6)
 
 
 @defword(name='clvar', print_x=rpn.globl.PX_CONFIG, doc="""\
@@ -2404,6 +2153,8 @@ cr   ( -- )
 Print a newline.""")
 def w_cr(name):                 # pylint: disable=unused-argument
     rpn.globl.writeln()
+    if rpn.globl.out_tty:
+        rpn.globl.flush()
 
 
 if rpn.globl.have_module('numpy'):
@@ -2620,7 +2371,7 @@ def w_deg(name):                # pylint: disable=unused-argument
 depth   ( -- n )
 Current number of elements on stack.""")
 def w_depth(name):              # pylint: disable=unused-argument
-    rpn.globl.param_stack.push(rpn.type.Integer(rpn.globl.param_stack.size()))
+    rpn.globl.param_stack.push_raw(rpn.globl.param_stack.size())
 
 
 @defword(name='dim', args=1, print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -2750,7 +2501,7 @@ def w_dow_dollar(name):
 drop   ( x -- )
 Remove top stack element.""")
 def w_drop(name):               # pylint: disable=unused-argument
-    rpn.globl.param_stack.pop()
+    rpn.globl.param_stack.pop_raw()
 
 
 @defword(name='dsp', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
@@ -2796,6 +2547,7 @@ def w_edit(name):               # pylint: disable=unused-argument
     with tempfile.NamedTemporaryFile(suffix=".tmp") as tf:
         tf.write(initial_value)
         tf.flush()
+        rpn.globl.flush()
         subprocess.call([editor, tf.name])
         tf.seek(0)
         edited_message = tf.read()
@@ -2813,6 +2565,21 @@ def w_else(name):               # pylint: disable=unused-argument
     pass                        # Grammar rules handle this word
 
 
+@defword(name='elapsed', args=1, print_x=rpn.globl.PX_COMPUTE, doc="""\
+elapsed   ( t -- secs )
+Seconds elapsed since T, a value returned by ticks.
+
+See also: ticks""")
+def w_elapsed(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) is not rpn.type.Integer:
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+    result = rpn.type.Float((time.perf_counter_ns() - x.value) / 1e9)
+    result.label = "s"
+    rpn.globl.param_stack.push(result)
+
+
 @defword(name='emit', args=1, print_x=rpn.globl.PX_IO, doc="""\
 emit   ( x -- )
 Print a single ASCII character.  No space or newline is appended.""")
@@ -3209,6 +2976,23 @@ def w_fix(name):
     rpn.flag.clear_flag(rpn.flag.F_DISP_ENG)
 
 
+@defword(name='flight.', args=1, print_x=rpn.globl.PX_IO, doc="""\
+flight.   ( n -- )
+Show the last N (0 = all) words executed, from the always-on flight
+recorder.  Each line shows the step number, time relative to the most
+recent step, stack depth, and the word indented by colon nesting.  The
+recorder is also dumped to stderr on SIGQUIT, on a fatal or uncaught
+error, and on excessive recursion when not interactive.  Errors caught
+and reported at the top level do not dump it.""")
+def w_flight_dot(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) is not rpn.type.Integer:
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+    for line in rpn.globl.flight.dump(x.value):
+        rpn.globl.lnwriteln(line)
+
+
 @defword(name='floor', args=1, print_x=rpn.globl.PX_COMPUTE, doc="""\
 floor   ( x -- floor )
 Floor.  Largest integer not greater than X.""")
@@ -3235,19 +3019,7 @@ fmod   ( y x -- rem )
 Floating point remainder.  Return the remainder of dividing y by x.  This is
 preferred for floats, while mod is preferred for integers.""")
 def w_fmod(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-    if    type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
-       or type(y) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-    if x.zerop():
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_FP_DIVISION_BY_ZERO, name, "X cannot be zero")
-    r = math.fmod(float(y.value), float(x.value))
-    rpn.globl.param_stack.push(rpn.type.Float(r))
+    binop(name, 'fmod')
 
 
 @defword(name='hide', print_x=rpn.globl.PX_CONFIG, doc="""\
@@ -3380,29 +3152,27 @@ EXAMPLE:
     7 "myfunc" fzero
 3.0 \ fzero""")
     def w_fzero(name):
-        func_to_solve = rpn.globl.string_stack.pop().value
-        (word, _) = rpn.globl.lookup_word(func_to_solve)
+        s = rpn.globl.string_stack.pop()
+        (word, _) = rpn.globl.lookup_word(s.value)
         if word is None:
-            throw(X_UNDEFINED_WORD, name, "'{}'".format(func_to_solve))
+            rpn.globl.string_stack.push(s)
+            throw(X_UNDEFINED_WORD, name, "'{}'".format(s.value))
 
         x = rpn.globl.param_stack.pop()
         if    type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
+            rpn.globl.string_stack.push(s)
             rpn.globl.param_stack.push(x)
             throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
         init_guess = float(x.value)
 
-        # XXX There are probably error conditions/exceptions I need to catch
-        def func(x):
-            if type(x) is np.ndarray and x.ndim == 1 and x.size == 1:
-                x = rpn.globl.to_python_class(x[0])
-            else:
-                raise FatalErr("{}: func: x is not ndarray".format(name))
-            rpn.globl.param_stack.push(rpn.type.Float(x))
-            rpn.globl.eval_string(func_to_solve)
-            return rpn.globl.param_stack.pop().value
-
-        #r = scipy.optimize.fsolve(func, 3)
-        r = scipy.optimize.fsolve(func, [init_guess])
+        func = word_callable(name, word)
+        try:
+            # fsolve() passes x as an ndarray of length 1
+            r = scipy.optimize.fsolve(lambda x: func(x[0]), [init_guess])
+        except RuntimeErr:
+            rpn.globl.string_stack.push(s)
+            rpn.globl.param_stack.push(x)
+            raise
         # The return value of fsolve is a numpy array of length n for a root
         # finding problem with n variables.
         result = rpn.type.Float(r[0])
@@ -3481,19 +3251,70 @@ def w_gcd(name):
         rpn.globl.param_stack.push(rpn.type.Integer(r))
 
 
-if sys.version_info >= (3, 8):
-    @defword(name='gmean', print_x=rpn.globl.PX_COMPUTE, doc="""\
+@defword(name='gmean', print_x=rpn.globl.PX_COMPUTE, doc="""\
 gmean   ( -- gmean )
 Calculate the geometric mean of the statistics data.""")
-    def w_gmean(name):
-        if len(rpn.globl.stat_data) == 0:
-            throw(X_BAD_DATA, name, "No statistics data")
+def w_gmean(name):
+    if rpn.globl.stat_sums.n == 0:
+        throw(X_BAD_DATA, name, "No statistics data")
+    if rpn.globl.stat_sums.zeros > 0 or rpn.globl.stat_sums.negatives > 0:
+        throw(X_BAD_DATA, name, "geometric mean requires a non-empty dataset containing positive numbers")
+    m = rpn.globl.stat_sums.geometric_mean()
+    result = rpn.type.Float(m)
+    result.label = "gmean"
+    rpn.globl.param_stack.push(result)
+
+
+if rpn.globl.have_module('scipy'):
+    @defword(name='gquad', args=3, str_args=1, print_x=rpn.globl.PX_COMPUTE, doc=r"""\
+gquad   ( lower upper n -- integral )  [ FN -- ]
+Numerical integration by N-point Gaussian quadrature, which is exact for
+polynomials of degree 2N-1 or less.  Name of function must be on string
+stack.  If FN accepts a Vector and returns a Vector, it is called only
+once.  Implemented via scipy.integrate.fixed_quad()
+
+EXAMPLE:
+    : cube  dup dup * * ;
+    0 2 5 "cube" gquad
+3.999999999999999 \ gquad
+
+See also: quad""")
+    def w_gquad(name):
+        s = rpn.globl.string_stack.pop()
+        (word, _) = rpn.globl.lookup_word(s.value)
+        if word is None:
+            rpn.globl.string_stack.push(s)
+            throw(X_UNDEFINED_WORD, name, "'{}'".format(s.value))
+
+        n = rpn.globl.param_stack.pop()
+        x = rpn.globl.param_stack.pop()
+        y = rpn.globl.param_stack.pop()
+        if    type(n) is not rpn.type.Integer \
+           or type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
+           or type(y) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
+            rpn.globl.string_stack.push(s)
+            rpn.globl.param_stack.push(y)
+            rpn.globl.param_stack.push(x)
+            rpn.globl.param_stack.push(n)
+            throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)} {typename(n)})")
+        if n.value < 1:
+            rpn.globl.string_stack.push(s)
+            rpn.globl.param_stack.push(y)
+            rpn.globl.param_stack.push(x)
+            rpn.globl.param_stack.push(n)
+            throw(X_INVALID_ARG, name, "N must be positive")
+
         try:
-            m = statistics.geometric_mean(rpn.globl.stat_data)
-        except statistics.StatisticsError as e:
-            throw(X_BAD_DATA, name, "{}".format(str(e)))
-        result = rpn.type.Float(m)
-        result.label = "gmean"
+            (res, _) = scipy.integrate.fixed_quad(word_callable(name, word, vectorized=True),
+                                                  float(y.value), float(x.value), n=n.value)
+        except RuntimeErr:
+            rpn.globl.string_stack.push(s)
+            rpn.globl.param_stack.push(y)
+            rpn.globl.param_stack.push(x)
+            rpn.globl.param_stack.push(n)
+            raise
+        result = rpn.type.Float(res)
+        result.label = "gquad"
         rpn.globl.param_stack.push(result)
 
 
@@ -3512,20 +3333,18 @@ def w_help(name):               # pylint: disable=unused-argument
     pass                        # Grammar rules handle this word
 
 
-if sys.version_info >= (3, 6):
-    @defword(name='hmean', print_x=rpn.globl.PX_COMPUTE, doc="""\
+@defword(name='hmean', print_x=rpn.globl.PX_COMPUTE, doc="""\
 hmean   ( -- hmean )
 Return the harmonic mean of the statistics data.""")
-    def w_hmean(name):
-        if len(rpn.globl.stat_data) == 0:
-            throw(X_BAD_DATA, name, "No statistics data")
-        try:
-            m = statistics.harmonic_mean(rpn.globl.stat_data)
-        except statistics.StatisticsError as e:
-            throw(X_BAD_DATA, name, "{}".format(str(e)))
-        result = rpn.type.Float(m)
-        result.label = "hmean"
-        rpn.globl.param_stack.push(result)
+def w_hmean(name):
+    if rpn.globl.stat_sums.n == 0:
+        throw(X_BAD_DATA, name, "No statistics data")
+    if rpn.globl.stat_sums.negatives > 0:
+        throw(X_BAD_DATA, name, "harmonic mean does not support negative values")
+    m = rpn.globl.stat_sums.harmonic_mean()
+    result = rpn.type.Float(m)
+    result.label = "hmean"
+    rpn.globl.param_stack.push(result)
 
 
 @defword(name='hms', args=1, print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -3626,6 +3445,36 @@ def w_hms_minus(name):
     rpn.globl.param_stack.push(result)
 
 
+@defword(name='hook-add', str_args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
+hook-add   ( -- )  [ sym -- ]
+Run the word named by SYM before every word.  The name of the word about
+to run is pushed on the string stack first.  Words run by a hook are not
+themselves hooked.  Example:
+    : tr  $. space ;
+    'tr' hook-add
+
+See also: hook-remove""")
+def w_hook_add(name):
+    s = rpn.globl.string_stack.pop()
+    if type(s) is not rpn.type.Symbol:
+        rpn.globl.string_stack.push(s)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(s)})")
+    rpn.hook.add("before", rpn.hook.SymbolHook(s))
+
+
+@defword(name='hook-remove', str_args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
+hook-remove   ( -- )  [ sym -- ]
+Stop running the word named by SYM before every word.
+
+See also: hook-add""")
+def w_hook_remove(name):
+    s = rpn.globl.string_stack.pop()
+    if type(s) is not rpn.type.Symbol:
+        rpn.globl.string_stack.push(s)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(s)})")
+    rpn.hook.remove("before", rpn.hook.SymbolHook(s))
+
+
 @defword(name='hr', args=1, print_x=rpn.globl.PX_COMPUTE, doc="""\
 hr   ( HH.MMSS -- HH.nnn )
 Convert hours/minutes/seconds to decimal hours.""")
@@ -3917,6 +3766,7 @@ Keystroke is not echoed.
 
 See also: ?key""")
 def w_key(name):                # pylint: disable=unused-argument
+    rpn.globl.flush()
     try:
         k = _Getch()()
     except termios.error as e:
@@ -4145,29 +3995,16 @@ def w_loop(name):               # pylint: disable=unused-argument
 max   ( y x -- max )
 Larger of X or Y.""")
 def w_max(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-    if     type(x) in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
-       and type(y) in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
-        yval = float(y.value)
-        xval = float(x.value)
-        rpn.globl.param_stack.push(x if xval > yval else y)
-    else:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
+    binop(name, 'max')
 
 
 @defword(name='mean', print_x=rpn.globl.PX_COMPUTE, doc="""\
 mean   ( -- mean )
 Return the arithmetic mean of the statistics data.""")
 def w_mean(name):
-    if len(rpn.globl.stat_data) == 0:
+    if rpn.globl.stat_sums.n == 0:
         throw(X_BAD_DATA, name, "No statistics data")
-    try:
-        m = statistics.mean(rpn.globl.stat_data)
-    except statistics.StatisticsError as e:
-        throw(X_BAD_DATA, name, "{}".format(str(e)))
+    m = rpn.globl.stat_sums.mean()
     result = rpn.type.Float(m)
     result.label = "mean"
     rpn.globl.param_stack.push(result)
@@ -4188,21 +4025,55 @@ def w_median(name):
     rpn.globl.param_stack.push(result)
 
 
+@defword(name='mem-trace-off', print_x=rpn.globl.PX_CONFIG, doc="""\
+mem-trace-off   ( -- )
+Stop tracing allocations.
+
+See also: mem-trace-on, mem.""")
+def w_mem_trace_off(name):      # pylint: disable=unused-argument
+    rpn.mem.trace_off()
+
+
+@defword(name='mem-trace-on', print_x=rpn.globl.PX_CONFIG, doc="""\
+mem-trace-on   ( -- )
+Start tracing allocations with tracemalloc, so that mem. also shows which
+source lines allocated the most since the previous mem.  Tracing makes
+everything run several times slower; stop it with mem-trace-off.
+
+See also: mem-trace-off, mem.""")
+def w_mem_trace_on(name):       # pylint: disable=unused-argument
+    rpn.mem.trace_on()
+
+
+@defword(name='mem.', print_x=rpn.globl.PX_IO, doc="""\
+mem.   ( -- )
+Show memory held by the stacks, statistics data, registers, each scope's
+words and variables, unit tables and internal caches, with counts and
+sizes by type.  After mem-trace-on, also show which source lines
+allocated the most since the previous mem.
+
+See also: mem?, mem-trace-on""")
+def w_mem_dot(name):            # pylint: disable=unused-argument
+    for line in rpn.mem.report():
+        rpn.globl.lnwriteln(line)
+
+
+@defword(name='mem?', print_x=rpn.globl.PX_COMPUTE, doc="""\
+mem?   ( -- bytes )
+Total bytes held by the areas that mem. reports.
+
+See also: mem.""")
+def w_mem_query(name):          # pylint: disable=unused-argument
+    result = rpn.type.Integer(rpn.mem.total())
+    result.label = "bytes"
+    rpn.globl.param_stack.push(result)
+
+
 @defword(name='min', args=2, print_x=rpn.globl.PX_COMPUTE, doc="""\
 min   ( y x -- min )
 Smaller of X or Y.""")
 def w_min(name):
-    x = rpn.globl.param_stack.pop()
-    y = rpn.globl.param_stack.pop()
-    if     type(x) in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
-       and type(y) in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
-        yval = float(y.value)
-        xval = float(x.value)
-        rpn.globl.param_stack.push(x if xval < yval else y)
-    else:
-        rpn.globl.param_stack.push(y)
-        rpn.globl.param_stack.push(x)
-        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
+    binop(name, 'min')
 
 
 @defword(name='N', print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -4232,6 +4103,46 @@ def w_N(name):
     rpn.globl.param_stack.push(result)
 
 
+@defword(name='ndrop', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
+ndrop   ( ... n -- )
+Remove the top N stack elements.
+1 ndrop is equivalent to drop.""")
+def w_ndrop(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) is not rpn.type.Integer:
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+
+    if x.value < 0:
+        rpn.globl.param_stack.push(x)
+        throw(X_INVALID_ARG, name, "X cannot be negative")
+    if x.value > rpn.globl.param_stack.size():
+        rpn.globl.param_stack.push(x)
+        throw(X_INSUFF_PARAMS, name, "({} required)".format(x.value + 1))
+
+    rpn.globl.param_stack.ndrop(x.value)
+
+
+@defword(name='ndup', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
+ndup   ( ... n -- ... ... )
+Duplicate the top N stack elements, preserving their order.
+1 ndup is equivalent to dup.""")
+def w_ndup(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) is not rpn.type.Integer:
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+
+    if x.value < 0:
+        rpn.globl.param_stack.push(x)
+        throw(X_INVALID_ARG, name, "X cannot be negative")
+    if x.value > rpn.globl.param_stack.size():
+        rpn.globl.param_stack.push(x)
+        throw(X_INSUFF_PARAMS, name, "({} required)".format(x.value + 1))
+
+    rpn.globl.param_stack.ndup(x.value)
+
+
 @defword(name='not', args=1, print_x=rpn.globl.PX_PREDICATE, doc="""\
 not   ( flag -- !flag )
 Logical not.  Invert a flag: return TRUE (1) if x is zero, otherwise FALSE (0).
@@ -4405,8 +4316,8 @@ def w_pick(name):
         rpn.globl.param_stack.push(x)
         throw(X_INVALID_MEMORY, name, msg)
 
-    result = rpn.globl.param_stack.pick(x.value)
-    rpn.globl.param_stack.push(result)
+    result = rpn.globl.param_stack.pick_raw(x.value)
+    rpn.globl.param_stack.push_raw(result)
 
 
 @defword(name='plot', args=2, str_args=1, print_x=rpn.globl.PX_IO, doc="""\
@@ -4414,6 +4325,15 @@ plot   ( xlow xhigh -- ) [ FN -- ]
 Simple ASCII function plot.  FN is the (string) name of a function which
 implements ( x -- y ).  Y-axis is autoscaled.
 
+FN may name several functions separated by spaces; they share the same
+axes and are marked * o x # % @ in turn.  PLOTMODE selects the rendering:
+0 for ASCII, 1 for half blocks (twice the vertical resolution), 2 for
+braille (twice the horizontal and four times the vertical resolution).
+In the denser modes all functions are drawn with the same dots.
+
+If FN accepts a Vector and returns a Vector, it is called only once for
+all x values; otherwise it is called once per point.
+
 EXAMPLE:
     rad  80 !COLS  24 !ROWS
     TAU chs TAU "sin"  plot
@@ -4447,18 +4367,35 @@ def w_plot(name):
         rpn.globl.param_stack.push(y)
         rpn.globl.param_stack.push(x)
         throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
-    func_to_plot = rpn.globl.string_stack.pop().value
-    # XXX - look up func_to_plot, error if not defined
+    if x.value == y.value:
+        rpn.globl.param_stack.push(y)
+        rpn.globl.param_stack.push(x)
+        throw(X_INVALID_ARG, name, "Empty x range")
+    s = rpn.globl.string_stack.pop()
+    words = []
+    for func_name in s.value.split():
+        (word, _) = rpn.globl.lookup_word(func_name)
+        if word is None:
+            rpn.globl.string_stack.push(s)
+            rpn.globl.param_stack.push(y)
+            rpn.globl.param_stack.push(x)
+            throw(X_UNDEFINED_WORD, name, "'{}'".format(func_name))
+        words.append(word)
+    if len(words) == 0:
+        rpn.globl.string_stack.push(s)
+        rpn.globl.param_stack.push(y)
+        rpn.globl.param_stack.push(x)
+        throw(X_INVALID_ARG, name, "No function to plot")
     x_high = float(x.value)
     x_low  = float(y.value)
 
-    # XXX There are probably error conditions/exceptions I need to catch
-    def func(x):
-        rpn.globl.param_stack.push(rpn.type.Float(x))
-        rpn.globl.eval_string(func_to_plot)
-        return rpn.globl.param_stack.pop().value
-
-    plot_helper(func, x_low, x_high)
+    try:
+        plot_helper(name, words, x_low, x_high)
+    except RuntimeErr:
+        rpn.globl.string_stack.push(s)
+        rpn.globl.param_stack.push(y)
+        rpn.globl.param_stack.push(x)
+        raise
 
 
 @defword(name='PMT', print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -4536,16 +4473,58 @@ def w_prime_query(name):
     rpn.globl.param_stack.push(rpn.type.Integer(rpn.globl.bool_to_int(prime_helper(n))))
 
 
+@defword(name='profile-off', print_x=rpn.globl.PX_CONFIG, doc="""\
+profile-off   ( -- )
+Stop profiling.  Collected data is kept until profile-on.
+
+See also: profile-on, profile., profile>file""")
+def w_profile_off(name):        # pylint: disable=unused-argument
+    rpn.profiler.profile_off()
+
+
+@defword(name='profile-on', print_x=rpn.globl.PX_CONFIG, doc="""\
+profile-on   ( -- )
+Discard any previous profile and start recording call counts and
+inclusive and exclusive times for every word.
+
+See also: profile-off, profile., profile>file""")
+def w_profile_on(name):         # pylint: disable=unused-argument
+    rpn.profiler.reset()
+    rpn.profiler.profile_on()
+
+
+@defword(name='profile.', args=1, print_x=rpn.globl.PX_IO, doc="""\
+profile.   ( n -- )
+Print the N most expensive words by exclusive time.  N=0 prints all.
+
+See also: profile-on, profile-off, profile>file""")
+def w_profile_dot(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) is not rpn.type.Integer:
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+    for line in rpn.profiler.report(x.value):
+        rpn.globl.lnwriteln(line)
+
+
+@defword(name='profile>file', str_args=1, print_x=rpn.globl.PX_IO, doc="""\
+profile>file   ( -- )  [ filename -- ]
+Write the profile to a file: JSON if the name ends in .json, collapsed
+stacks for flamegraph.pl if it ends in .folded or .collapsed, otherwise
+the text report.
+
+See also: profile-on, profile-off, profile.""")
+def w_profile_to_file(name):    # pylint: disable=unused-argument
+    rpn.profiler.write_file(rpn.globl.string_stack.pop().value)
+
+
 @defword(name='pstdev', print_x=rpn.globl.PX_COMPUTE, doc="""\
 pstdev   ( -- pop_stdev )
 Return the population standard deviation of the statistics data.""")
 def w_pstdev(name):
-    if len(rpn.globl.stat_data) < 2:
+    if rpn.globl.stat_sums.n < 2:
         throw(X_BAD_DATA, name, "Insufficient statistics data (2 required)")
-    try:
-        s = statistics.pstdev(rpn.globl.stat_data)
-    except statistics.StatisticsError as e:
-        throw(X_BAD_DATA, name, "{}".format(str(e)))
+    s = rpn.globl.stat_sums.stdev(0)
     result = rpn.type.Float(s)
     result.label = "pstdev"
     rpn.globl.param_stack.push(result)
@@ -4582,12 +4561,9 @@ def w_PV(name):
 pvar   ( -- pop_var )
 Return the population variance of the statistics data.""")
 def w_pvar(name):
-    if len(rpn.globl.stat_data) < 2:
+    if rpn.globl.stat_sums.n < 2:
         throw(X_BAD_DATA, name, "Insufficient statistics data (2 required)")
-    try:
-        v = statistics.pvariance(rpn.globl.stat_data)
-    except statistics.StatisticsError as e:
-        throw(X_BAD_DATA, name, "{}".format(str(e)))
+    v = rpn.globl.stat_sums.variance(0)
     result = rpn.type.Float(v)
     result.label = "pvar"
     rpn.globl.param_stack.push(result)
@@ -4603,30 +4579,34 @@ EXAMPLE: Integrate a bessel function jv(2.5, x) along the interval [0,4.5]:
     : J2.5  2.5 swap Jv ;
     0 4.5 "J2.5" quad .s
 1: 7.866317216380692e-09 \ error
-0: 1.1178179380783249 \ quad""")
+0: 1.1178179380783249 \ quad
+
+See also: gquad""")
     def w_quad(name):
-        func_to_integrate = rpn.globl.string_stack.pop().value
-        (word, _) = rpn.globl.lookup_word(func_to_integrate)
+        s = rpn.globl.string_stack.pop()
+        (word, _) = rpn.globl.lookup_word(s.value)
         if word is None:
-            throw(X_UNDEFINED_WORD, name, "'{}'".format(func_to_integrate))
+            rpn.globl.string_stack.push(s)
+            throw(X_UNDEFINED_WORD, name, "'{}'".format(s.value))
 
         x = rpn.globl.param_stack.pop()
         y = rpn.globl.param_stack.pop()
         if    type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float] \
            or type(y) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
+            rpn.globl.string_stack.push(s)
             rpn.globl.param_stack.push(y)
             rpn.globl.param_stack.push(x)
             throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
         lower = float(y.value)
         upper = float(x.value)
 
-        # XXX There are probably error conditions/exceptions I need to catch
-        def func(x):
-            rpn.globl.param_stack.push(rpn.type.Float(x))
-            rpn.globl.eval_string(func_to_integrate)
-            return rpn.globl.param_stack.pop().value
-
-        (res, err) = scipy.integrate.quad(func, lower, upper)
+        try:
+            (res, err) = scipy.integrate.quad(word_callable(name, word), lower, upper)
+        except RuntimeErr:
+            rpn.globl.string_stack.push(s)
+            rpn.globl.param_stack.push(y)
+            rpn.globl.param_stack.push(x)
+            raise
         err_obj = rpn.type.Float(err)
         err_obj.label = "error"
         rpn.globl.param_stack.push(err_obj)
@@ -4810,7 +4790,7 @@ def w_rcl(name):
         rpn.globl.param_stack.push(x)
         throw(X_INVALID_MEMORY, name, "Register {} out of range (0..{} expected)".format(reg, size-1))
 
-    rpn.globl.param_stack.push(rpn.globl.reg_stack.top().register[reg])
+    rpn.globl.param_stack.push(rpn.globl.reg_stack.top()[reg])
 
 
 @defword(name='rclI', print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -4818,7 +4798,7 @@ rclI   ( -- reg[I] )
 Recall value of register I.  Do not confuse this with rcli, which recalls
 the contents of the register referenced by I.""")
 def w_rclI(name):               # pylint: disable=unused-argument
-    rpn.globl.param_stack.push(rpn.globl.reg_stack.top().register['I'])
+    rpn.globl.param_stack.push(rpn.globl.reg_stack.top().I)
 
 
 @defword(name='rcli', print_x=rpn.globl.PX_CONFIG, doc="""\
@@ -4826,12 +4806,12 @@ rcli   ( -- reg[(i)] )
 Recall contents of the register referenced by I.  Do not confuse this with
 rclI, which recalls the value of register I directly.""")
 def w_rcli(name):
-    Ival = rpn.globl.reg_stack.top().register['I'].value
+    Ival = rpn.globl.reg_stack.top().I.value
     (valid, size) = rpn.globl.register_valid_p(Ival)
     if not valid:
         throw(X_INVALID_MEMORY, name, "Register I={} out of range (0..{} expected)".format(Ival, size - 1))
 
-    rpn.globl.param_stack.push(rpn.globl.reg_stack.top().register[Ival])
+    rpn.globl.param_stack.push(rpn.globl.reg_stack.top()[Ival])
 
 
 @defword(name='rct->sph', args=3, print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -4919,13 +4899,10 @@ def w_reg_from(name):          # pylint: disable=unused-argument
             throw(X_STACK_UNDERFLOW, name, "{} has no register set".format(rpn.globl.reg_stack.name()))
         else:
             raise
-    print("reg_stack.top now {}".format(rpn.globl.reg_stack.top()))
     new_size = rpn.globl.reg_stack.top().size
-    print("new_size={}".format(new_size))
-    new_sreg     = rpn.globl.reg_stack.top().sreg
+    new_sreg = rpn.globl.reg_stack.top().sreg
     if new_size > old_size:
-        for r in range(new_size - old_size):
-            rpn.globl.reg_stack.top().register[old_size + r] = rpn.type.Float(0.0)
+        rpn.globl.reg_stack.top().clear(old_size, new_size)
     size_var.obj = rpn.type.Integer(new_size)
     sreg_var.obj = rpn.type.Integer(new_sreg)
 
@@ -5033,7 +5010,9 @@ def w_rnd(name):
 roll   ( ... x -- ... )
 Roll stack elements.
 2 roll is equivalent to swap.
-3 roll is equivalent to rot.""")
+3 roll is equivalent to rot.
+
+See also: -roll""")
 def w_roll(name):
     x = rpn.globl.param_stack.pop()
     if type(x) is not rpn.type.Integer:
@@ -5062,9 +5041,82 @@ def w_s_plus(name):
         throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
 
     val = float(x.value)
+    rpn.globl.stat_sums.add(val)
     rpn.globl.stat_data.append(val)
 
 
+@defword(name='S-', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
+S-   ( n -- )
+Remove an element from the statistics list.""")
+def w_s_minus(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) not in [rpn.type.Integer, rpn.type.Rational, rpn.type.Float]:
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+
+    val = float(x.value)
+    if math.isnan(val):
+        # NaN equals nothing, not even itself, so look for any NaN
+        i = next((i for (i, v) in enumerate(rpn.globl.stat_data) if math.isnan(v)), None)
+    else:
+        i = rpn.globl.stat_data.index(val) if val in rpn.globl.stat_data else None
+    if i is None:
+        rpn.globl.param_stack.push(x)
+        throw(X_BAD_DATA, name, "{} is not in the statistics data".format(val))
+    rpn.globl.stat_sums.remove(val)
+    del rpn.globl.stat_data[i]
+
+
+@defword(name='sample-off', print_x=rpn.globl.PX_CONFIG, doc="""\
+sample-off   ( -- )
+Stop the sampling profiler.  Samples are kept until sample-on.
+
+See also: sample-on, sample., sample>file""")
+def w_sample_off(name):         # pylint: disable=unused-argument
+    rpn.profiler.sample_off()
+
+
+@defword(name='sample-on', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
+sample-on   ( usec -- )
+Discard previous samples and start sampling the RPN call stack every
+USEC microseconds of CPU time.  Unlike profile-on, this adds no cost to
+each word call.
+
+See also: sample-off, sample., sample>file, profile-on""")
+def w_sample_on(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) is not rpn.type.Integer:
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+    if x.value <= 0:
+        rpn.globl.param_stack.push(x)
+        throw(X_INVALID_ARG, name, "Interval must be positive")
+    rpn.profiler.sample_on(x.value / 1e6)
+
+
+@defword(name='sample.', args=1, print_x=rpn.globl.PX_IO, doc="""\
+sample.   ( n -- )
+Print the N hottest words and call paths.  N=0 prints all.
+
+See also: sample-on, sample-off, sample>file""")
+def w_sample_dot(name):
+    x = rpn.globl.param_stack.pop()
+    if type(x) is not rpn.type.Integer:
+        rpn.globl.param_stack.push(x)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
+    for line in rpn.profiler.sample_report(x.value):
+        rpn.globl.lnwriteln(line)
+
+
+@defword(name='sample>file', str_args=1, print_x=rpn.globl.PX_IO, doc="""\
+sample>file   ( -- )  [ filename -- ]
+Write the samples as folded stacks for flamegraph.pl.
+
+See also: sample-on, sample-off, sample.""")
+def w_sample_to_file(name):     # pylint: disable=unused-argument
+    rpn.profiler.sample_write_file(rpn.globl.string_stack.pop().value)
+
+
 @defword(name='sci', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
 sci   ( n -- )
 Set scientific display.  N specifies the number of digits after
@@ -5207,11 +5259,11 @@ def w_show(name):               # pylint: disable=unused-argument
 shreg   ( -- )
 Show status of all registers.""")
 def w_shreg(name):              # pylint: disable=unused-argument
-    (size_var, _) = rpn.globl.lookup_variable("SIZE")
+    reg_set = rpn.globl.reg_stack.top()
     regs = []
-    regs.append("I=%s" % rpn.globl.gfmt(rpn.globl.reg_stack.top().register['I']))
-    for r in range(size_var.obj.value):
-        regs.append("R%02d=%s" % (r, rpn.globl.gfmt(rpn.globl.reg_stack.top().register[r])))
+    regs.append("I=%s" % rpn.globl.gfmt(reg_set.I))
+    for r in range(reg_set.size):
+        regs.append("R%02d=%s" % (r, rpn.globl.gfmt(reg_set[r])))
 
     rpn.globl.list_in_columns(regs, rpn.globl.scr_cols.obj.value - 1)
 
@@ -5356,27 +5408,20 @@ def w_size(name):
     (size_var, _) = rpn.globl.lookup_variable("SIZE")
     old_size = size_var.obj.value
     if new_size > old_size:
-        for r in range(new_size - old_size):
-            rpn.globl.reg_stack.top().register[old_size + r] = rpn.type.Float(0.0)
+        rpn.globl.reg_stack.top().clear(old_size, new_size)
+    rpn.globl.reg_stack.top().size = new_size
     size_var.obj = x
 
 
 @defword(name='skew', print_x=rpn.globl.PX_COMPUTE, doc="""\
 Compute skewness in statistical data.""")
 def w_skew(name):
-    n = len(rpn.globl.stat_data)
-    if n < 2:
-        throw(X_BAD_DATA, name, "Insufficient statistics data (2 required)")
-    try:
-        mean = statistics.mean(rpn.globl.stat_data)
-    except statistics.StatisticsError as e:
-        throw(X_BAD_DATA, name, "{} (mean)".format(str(e)))
-    try:
-        std = statistics.stdev(rpn.globl.stat_data)
-    except statistics.StatisticsError as e:
-        throw(X_BAD_DATA, name, "{} (std)".format(str(e)))
+    if rpn.globl.stat_sums.n < 3:
+        throw(X_BAD_DATA, name, "Insufficient statistics data (3 required)")
+    if rpn.globl.stat_sums.variance() == 0:
+        throw(X_BAD_DATA, name, "Statistics data has no variance")
 
-    skew = sum((item - mean)**3 for item in rpn.globl.stat_data) * n / ((n-1) * (n-2) * std**3)
+    skew = rpn.globl.stat_sums.skew()
     result = rpn.type.Float(skew)
     result.label = "skew"
     rpn.globl.param_stack.push(result)
@@ -5391,6 +5436,7 @@ def w_sleep(name):
         rpn.globl.param_stack.push(x)
         throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
     sleep_time = float(x.value)
+    rpn.globl.flush()
     time.sleep(sleep_time)
 
 
@@ -5500,6 +5546,36 @@ def w_srand(name):
     random.seed(x.value)
 
 
+@defword(name='stats.', print_x=rpn.globl.PX_IO, doc="""\
+stats.   ( -- )
+Show interpreter counters: words executed (built-in and colon), parses
+and lexer builds, scope pushes, variable lookups, exceptions thrown and
+caught, objects created per type, output bytes, and cache hit rates.
+Counters only ever increase.
+
+See also: stats>file""")
+def w_stats_dot(name):          # pylint: disable=unused-argument
+    for line in rpn.metrics.report():
+        rpn.globl.lnwriteln(line)
+
+
+@defword(name='stats>file', str_args=1, print_x=rpn.globl.PX_IO, doc="""\
+stats>file   ( -- )  [ filename -- ]
+Write the interpreter counters to a file as JSON.
+
+See also: stats.""")
+def w_stats_to_file(name):
+    s = rpn.globl.string_stack.pop()
+    if type(s) is not rpn.type.String:
+        rpn.globl.string_stack.push(s)
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(s)})")
+    try:
+        rpn.metrics.write_file(name, s.value)
+    except RuntimeErr:
+        rpn.globl.string_stack.push(s)
+        raise
+
+
 @defword(name='std', print_x=rpn.globl.rpn.globl.PX_CONFIG, doc="""\
 std   ( -- )
 Set display mode to standard.""")
@@ -5515,12 +5591,9 @@ def w_std(name):                # pylint: disable=unused-argument
 stdev   ( -- samp_stdev )
 Return the sample standard deviation of the statistics data.""")
 def w_stdev(name):
-    if len(rpn.globl.stat_data) < 2:
+    if rpn.globl.stat_sums.n < 2:
         throw(X_BAD_DATA, name, "Insufficient statistics data (2 required)")
-    try:
-        s = statistics.stdev(rpn.globl.stat_data)
-    except statistics.StatisticsError as e:
-        throw(X_BAD_DATA, name, "{}".format(str(e)))
+    s = rpn.globl.stat_sums.stdev(1)
     result = rpn.type.Float(s)
     result.label = "stdev"
     rpn.globl.param_stack.push(result)
@@ -5543,7 +5616,7 @@ def w_sto(name):
         rpn.globl.param_stack.push(x)
         throw(X_INVALID_MEMORY, name, "Register {} out of range (0..{} expected)".format(reg, size-1))
 
-    rpn.globl.reg_stack.top().register[reg] = y
+    rpn.globl.reg_stack.top()[reg] = y
 
 
 @defword(name='stoI', args=1, print_x=rpn.globl.PX_CONFIG, doc="""\
@@ -5553,9 +5626,9 @@ stores X into the register referenced by I.""")
 def w_stoI(name):               # pylint: disable=unused-argument
     x = rpn.globl.param_stack.pop()
     if type(x) is rpn.type.Integer:
-        rpn.globl.reg_stack.top().register['I'] = x
+        rpn.globl.reg_stack.top().I = x
     elif type(x) in [rpn.type.Float, rpn.type.Rational]:
-        rpn.globl.reg_stack.top().register['I'] = rpn.type.Integer(int(x.value))
+        rpn.globl.reg_stack.top().I = rpn.type.Integer(int(x.value))
     else:
         rpn.globl.param_stack.push(x)
         throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
@@ -5566,11 +5639,18 @@ stoi   ( x -- )
 Store X into the register referenced by I.  Do not confuse this with
 stoI, which stores X directly into the I register.""")
 def w_stoi(name):
-    Ival = rpn.globl.reg_stack.top().register['I'].value
+    Ival = rpn.globl.reg_stack.top().I.value
     (valid, size) = rpn.globl.register_valid_p(Ival)
     if not valid:
         throw(X_INVALID_MEMORY, name, "Register I={} out of range (0..{} expected)".format(Ival, size-1))
-    rpn.globl.reg_stack.top().register[Ival] = rpn.globl.param_stack.pop()
+    rpn.globl.reg_stack.top()[Ival] = rpn.globl.param_stack.pop()
+
+
+@defword(name='swap2', args=4, print_x=rpn.globl.PX_CONFIG, doc="""\
+swap2   ( d c b a -- b a d c )
+Exchange the top two pairs of stack elements.  This is Forth's 2SWAP.""")
+def w_swap2(name):              # pylint: disable=unused-argument
+    rpn.globl.param_stack.swap2()
 
 
 @defword(name='T_COMPLEX', hidden=True, print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -5761,6 +5841,16 @@ def w_throw(name):
     throw(x.value, thrown_from)
 
 
+@defword(name='ticks', print_x=rpn.globl.PX_COMPUTE, doc="""\
+ticks   ( -- t )
+Monotonic clock in nanoseconds, for measuring intervals with elapsed.
+The zero point is arbitrary.
+
+See also: elapsed""")
+def w_ticks(name):              # pylint: disable=unused-argument
+    rpn.globl.param_stack.push(rpn.type.Integer(time.perf_counter_ns()))
+
+
 @defword(name='time', print_x=rpn.globl.PX_COMPUTE, doc="""\
 time   ( -- HH.MMSS )
 Current time.""")
@@ -5999,12 +6089,9 @@ Decompose a vector into stack elements.""")
 var   ( -- samp_var )
 Return the sample variance of the statistics data.""")
 def w_var(name):
-    if len(rpn.globl.stat_data) < 2:
+    if rpn.globl.stat_sums.n < 2:
         throw(X_BAD_DATA, name, "Insufficient statistics data (2 required)")
-    try:
-        v = statistics.variance(rpn.globl.stat_data)
-    except statistics.StatisticsError as e:
-        throw(X_BAD_DATA, name, "{}".format(str(e)))
+    v = rpn.globl.stat_sums.variance(1)
     result = rpn.type.Float(v)
     result.label = "var"
     rpn.globl.param_stack.push(result)
@@ -6186,11 +6273,11 @@ which exchanges X with the contents of the register referenced by I.""")
 def w_x_exchange_I(name):       # pylint: disable=unused-argument
     x = rpn.globl.param_stack.pop()
     if type(x) is rpn.type.Integer:
-        rpn.globl.param_stack.push(rpn.globl.reg_stack.top().register['I'])
-        rpn.globl.reg_stack.top().register['I'] = x
+        rpn.globl.param_stack.push(rpn.globl.reg_stack.top().I)
+        rpn.globl.reg_stack.top().I = x
     elif type(x) in [rpn.type.Float, rpn.type.Rational]:
-        rpn.globl.param_stack.push(rpn.globl.reg_stack.top().register['I'])
-        rpn.globl.reg_stack.top().register['I'] = rpn.type.Integer(int(x.value))
+        rpn.globl.param_stack.push(rpn.globl.reg_stack.top().I)
+        rpn.globl.reg_stack.top().I = rpn.type.Integer(int(x.value))
     else:
         rpn.globl.param_stack.push(x)
         throw(X_ARG_TYPE_MISMATCH, name, f"({typename(x)})")
@@ -6201,14 +6288,14 @@ x<>i   ( x -- reg[(i)] )
 Exchange X with contents of the register referenced by I.
 Do not confuse this with x<>I, which exchanges X with I directly.""")
 def w_x_exchange_indirect_i(name):
-    Ival = rpn.globl.reg_stack.top().register['I'].value
+    Ival = rpn.globl.reg_stack.top().I.value
     (valid, size) = rpn.globl.register_valid_p(Ival)
     if not valid:
         throw(X_INVALID_MEMORY, name, "Register I={} out of range (0..{} expected)".format(Ival, size-1))
 
     x = rpn.globl.param_stack.pop()
-    rpn.globl.param_stack.push(rpn.globl.reg_stack.top().register[Ival])
-    rpn.globl.reg_stack.top().register[Ival] = x
+    rpn.globl.param_stack.push(rpn.globl.reg_stack.top()[Ival])
+    rpn.globl.reg_stack.top()[Ival] = x
 
 
 @defword(name='X_ABORT', hidden=True, print_x=rpn.globl.PX_COMPUTE, doc="""\
@@ -6627,6 +6714,7 @@ def memoize(f):
         if x not in memoized:
             memoized[x] = f(x)
         return memoized[x]
+    helper.memoized = memoized
     return helper
 
 
@@ -6666,69 +6754,6 @@ def comb_helper(n, r):
     return int(result)
 
 
-def equal_helper(x, y):
-    """\
-# Parameters are Rpn objects, not values.  Uexprs are *not* considered.
-# Returns a tuple of integers: (FLAG, REASON) where FLAG is:
-#    1 : Values are equal
-#    0 : Values are not equal
-#   -1 : Failure/Type error
-#
-# When FLAG is -1, REASON is the X_ exception code for why the
-# comparison failed.  If FLAG is 1 or 0, REASON shall be zero.
-# Useful values for REASON are:
-#    X_ARG_TYPE_MISMATCH : type(x)/type(y) comparison not implemented
-#    X_UNSUPPORTED       : Numpy not available
-#
-# IMPORTANT: This routine must *not* throw() an exception because
-# callers are not generally prepared to catch them.
-
-|----------+----------+---------+----------+---------+--------+--------|
-| Integer  |   xxxx   |  xxx    |  xxxx    | xxxx    |        |        |
-| Float    |   xxxxx  |  xxx    |   xxxx   | xxx     |        |        |
-| Rational |   xxxx   |  xxx    |  xxxxx   | xxxx    |        |        |
-| Complex  |    xxxx  |  xxx    |   xxx    | xxx     |        |        |
-| Vector   |          |         |          |         | xxxx   |        |
-| Matrix   |          |         |          |         |        |        |
-|----------+----------+---------+----------+---------+--------+--------|
-| ^Y    X> | Integer  | Float   | Rational | Complex | Vector | Matrix |
-
-    """
-    equal = None
-    if type(x) is rpn.type.Integer and type(y) is rpn.type.Integer:
-        equal = y.value == x.value
-    elif type(x) is rpn.type.Float and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational] \
-      or type(y) is rpn.type.Float and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational]:
-        if rpn.flag.flag_set_p(rpn.flag.F_EQUAL_ISCLOSE):
-            equal = math.isclose(float(y.value), float(x.value))
-        else:
-            equal = float(y.value) == float(x.value)
-    elif type(x) is rpn.type.Rational and type(y) in [rpn.type.Integer, rpn.type.Rational] \
-      or type(y) is rpn.type.Rational and type(x) in [rpn.type.Integer, rpn.type.Rational]:
-        equal = Fraction(y.value) == Fraction(x.value)
-    elif type(x) is rpn.type.Complex and type(y) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex] \
-      or type(y) is rpn.type.Complex and type(x) in [rpn.type.Integer, rpn.type.Float, rpn.type.Rational, rpn.type.Complex]:
-        if rpn.flag.flag_set_p(rpn.flag.F_EQUAL_ISCLOSE):
-            equal = cmath.isclose(complex(y.value), complex(x.value))
-        else:
-            equal = complex(y.value) == complex(x.value)
-    elif type(x) is rpn.type.Vector and type(y) is rpn.type.Vector:
-        if x.size() != y.size():
-            equal = False
-        else:
-            r = functools.reduce(lambda i, j: i and j,
-                                 map(lambda m, k: m == k, x.value, y.value), True)
-            equal = bool(r) # True if r else False
-    elif type(x) is rpn.type.Matrix and type(y) is rpn.type.Matrix:
-        if not rpn.globl.have_module('numpy'):
-            return (-1, X_UNSUPPORTED)
-        equal = np.array_equal(x.value, y.value)
-
-    if equal is None:
-        return (-1, X_ARG_TYPE_MISMATCH)
-    return (rpn.globl.bool_to_int(equal), 0)
-
-
 @memoize
 def fact_helper(x):
     result = 1
@@ -6753,13 +6778,22 @@ def gcd_helper(x, y):
     return y
 
 
-def plot_helper(func, x_low, x_high):
+def plot_sample(name, word, xs):
+    """Return WORD ( x -- y ) evaluated at each of XS, as floats."""
+    if rpn.globl.have_module('numpy'):
+        return [float(y) for y in word_callable(name, word, vectorized=True)(xs)]
+    func = word_callable(name, word)
+    return [func(x) for x in xs]
+
+
+def plot_helper(name, words, x_low, x_high):
     cols = rpn.globl.scr_cols.obj.value
     rows = rpn.globl.scr_rows.obj.value
+    mode = rpn.globl.plot_mode.obj.value
 
     BLANK  = ' '
     HFRAME = '-'
-    MARK   = '*'
+    MARKS  = "*ox#%@"
     ORIGIN = '+'
     VFRAME = '|'
     X_AXIS = '.'
@@ -6767,67 +6801,515 @@ def plot_helper(func, x_low, x_high):
 
     ISCR   = cols - 20
     JSCR   = rows -  3
-    scr = [[BLANK for i in range(1,JSCR+2)] for j in range(1,ISCR+2)]
-
-    # Build frame
-    for j in range(1, JSCR+1):
-        scr[1][j] = VFRAME
-        scr[ISCR][j] = VFRAME
-    for i in range(2, ISCR):
-        scr[i][1] = HFRAME
-        scr[i][JSCR] = HFRAME
-        for j in range(2, JSCR):
-            scr[i][j] = BLANK
+
+    # Dots per character cell, horizontally and vertically
+    (SX, SY) = [(1, 1), (1, 2), (2, 4)][mode]
 
     if x_low > x_high:
         x_low, x_high = x_high, x_low
+    npts = ISCR * SX
+    xs = []
     x = x_low
-    dx = (x_high - x_low) / (ISCR - 1)
+    dx = (x_high - x_low) / (npts - 1)
+    for _ in range(npts):
+        xs.append(x)
+        x += dx
     dxi = (ISCR - 1) / (x_high - x_low)
     iz = 1 - int(x_low * dxi)
 
-    y = [0.0] * (ISCR+1)
-    ysml, ybig = 0.0, 0.0
-    for i in range(1, ISCR+1):
-        y[i] = func(x)
-        ysml = min(ysml, y[i])
-        ybig = max(ybig, y[i])
-        x += dx
+    curves = [plot_sample(name, word, xs) for word in words]
+    finite = [v for ys in curves for v in ys if math.isfinite(v)]
+    ysml = min([0.0] + finite)
+    ybig = max([0.0] + finite)
 
     if ybig == ysml:
         ybig = ysml + 1.0
     dyj = (JSCR - 1) / (ybig - ysml)
     jz = 1 - int(ysml * dyj)
 
-    # Build axes
-    for i in range(2, ISCR):
-        for j in range(2, JSCR):
-            if i == iz:
-                scr[i][j] = Y_AXIS
-            if j == jz:
-                scr[i][j] = X_AXIS
-            if i == iz and j == jz:
-                scr[i][j] = ORIGIN
-
-    # Populate data points
-    for i in range(1, ISCR+1):
-        j = 1 + int((y[i] - ysml) * dyj)
-        scr[i][j] = MARK
+    # Build frame and axes, one row at a time; scr[j][i] is column I of
+    # row J, both 1-based from the bottom left
+    border = [None] + list(VFRAME + HFRAME * (ISCR - 2) + VFRAME)
+    scr = [None, border]
+    for j in range(2, JSCR):
+        row = [None] + [X_AXIS if j == jz else BLANK] * ISCR
+        row[1] = VFRAME
+        row[ISCR] = VFRAME
+        if 1 < iz < ISCR:
+            row[iz] = ORIGIN if j == jz else Y_AXIS
+        scr.append(row)
+    scr.append(list(border))
+
+    # Populate data points.  In the dense modes each cell collects a
+    # bit mask of dots which becomes one half block or braille glyph.
+    dots = dict()
+    ddy = (JSCR * SY - 1) / (ybig - ysml)
+    for (n, ys) in enumerate(curves):
+        for (k, yk) in enumerate(ys):
+            if not math.isfinite(yk):
+                continue
+            i = 1 + k // SX
+            if mode == 0:
+                scr[1 + int((yk - ysml) * dyj)][i] = MARKS[n % len(MARKS)]
+                continue
+            d = int((yk - ysml) * ddy)
+            j = 1 + d // SY
+            (col, row) = (k % SX, SY - 1 - d % SY) # row counts down from the top
+            if mode == 1:
+                bit = 1 << row
+            else:
+                bit = [[0x01, 0x02, 0x04, 0x40], [0x08, 0x10, 0x20, 0x80]][col][row]
+            dots[(i, j)] = dots.get((i, j), 0) | bit
+    for ((i, j), bits) in dots.items():
+        scr[j][i] = " \u2580\u2584\u2588"[bits] if mode == 1 else chr(0x2800 + bits)
 
     # Display plot
-    rpn.globl.write(" {:10.3f} ".format(ybig))
-    for i in range(1, ISCR+1):
-        rpn.globl.write(scr[i][JSCR])
-    rpn.globl.writeln()
+    lines = [" {:10.3f} ".format(ybig) + "".join(scr[JSCR][1:])]
     for j in range(JSCR-1, 1, -1):
-        rpn.globl.write(" " * 12)
-        for i in range(1, ISCR+1):
-            rpn.globl.write(scr[i][j])
-        rpn.globl.writeln()
-    rpn.globl.write(" {:10.3f} ".format(ysml))
-    for i in range(1, ISCR+1):
-        rpn.globl.write(scr[i][1])
-    rpn.globl.lnwriteln("         {:10.3f} {} {:10.3f}".format(x_low, " "*(cols-36), x_high))
+        lines.append(" " * 12 + "".join(scr[j][1:]))
+    lines.append(" {:10.3f} ".format(ysml) + "".join(scr[1][1:]))
+    lines.append("         {:10.3f} {} {:10.3f}".format(x_low, " "*(cols-36), x_high))
+    if len(words) > 1 and mode == 0:
+        lines.append(" " * 12 + "   ".join(["{} {}".format(MARKS[n % len(MARKS)], word.name)
+                                            for (n, word) in enumerate(words)]))
+    rpn.globl.write("\n".join(lines) + "\n")
+
+
+def stack_window_rows():
+    """Number of stack items .s shows interactively (0 means all); leave
+    room on the screen for the prompt."""
+    if not rpn.globl.interactive:
+        return 0
+    return max(rpn.globl.scr_rows.obj.value - 3, 1)
+
+
+def word_callable(name, word, vectorized=False):
+    """Resolve WORD ( x -- y ) once into a Python function for numerical
+    routines.  f(x) pushes X as a Float, runs WORD directly (without
+    re-parsing), and returns Y as a float.  If WORD throws or does not
+    leave exactly one result, the stacks are restored and the RuntimeErr
+    propagates to whoever called f.
+
+    If VECTORIZED, f takes and returns an ndarray.  WORD is called once
+    on a Vector of all the x values if, on the first call, that agrees
+    with per-point calls at both ends and the middle; otherwise it is
+    called once per point.  Any error from the Vector trial just means
+    WORD is not vectorizable.  Output written during the trial is
+    discarded, and a word that writes output is called per point, so it
+    prints exactly as before; other side effects (e.g., storing to
+    variables) do happen for the extra trial calls."""
+    colon = word.typ == "colon"
+    vector_ok = None
+
+    def call(x, box):
+        params  = rpn.globl.param_stack.snapshot()
+        strings = rpn.globl.string_stack.snapshot()
+        try:
+            rpn.globl.param_stack.push(box(x))
+            if colon:
+                rpn.globl.colon_stack.push(word)
+            try:
+                word.__call__(word.name)
+            finally:
+                if colon:
+                    rpn.globl.colon_stack.pop()
+            if rpn.globl.param_stack.size() != len(params) + 1:
+                throw(X_INVALID_ARG, name, "'{}' must be ( x -- y )".format(word.name))
+            return rpn.globl.param_stack.pop().value
+        except Exception:
+            rpn.globl.param_stack.restore(params)
+            rpn.globl.string_stack.restore(strings)
+            raise
+
+    def func(x):
+        v = call(float(x), rpn.type.Float)
+        if type(v) not in [int, float, Fraction]:
+            throw(X_ARG_TYPE_MISMATCH, name, "'{}' returned a non-real value".format(word.name))
+        return float(v)
+
+    def vector_trial(xs):
+        """Return WORD's result on a Vector of XS, or None."""
+        nonlocal vector_ok
+        saved = (sys.stdout, rpn.globl.out_col)
+        sys.stdout = io.StringIO()
+        try:
+            r = call(xs, rpn.type.Vector.from_ndarray)
+            ok = type(r) is np.ndarray and r.shape == xs.shape and r.dtype.kind in "biuf"
+            if ok and vector_ok is None:
+                ok = all([math.isclose(float(r[k]), func(xs[k]), rel_tol=1e-9, abs_tol=1e-12)
+                          for k in [0, xs.size // 2, xs.size - 1]])
+        except Exception:           # pylint: disable=broad-except
+            ok = False
+        finally:
+            wrote = sys.stdout.getvalue() != ""
+            (sys.stdout, rpn.globl.out_col) = saved
+        if wrote:
+            ok = False
+        if vector_ok is None or not ok:
+            vector_ok = ok
+        return r.astype(float) if ok else None
+
+    def vector_func(xs):
+        xs = np.asarray(xs, dtype=float)
+        if vector_ok is not False and xs.ndim == 1 and xs.size > 2:
+            r = vector_trial(xs)
+            if r is not None:
+                return r
+        return np.array([func(x) for x in xs.ravel()]).reshape(xs.shape)
+
+    return vector_func if vectorized else func
+
+
+#############################################################################
+#
+#       N U M E R I C   D I S P A T C H
+#
+#       Binary numeric words look up a handler in binop_table, keyed by
+#       (type(y), type(x), op).  The table is built once from
+#       binop_promote(), which picks the type the operation is computed
+#       in, and binop_kind_fns, which says how each op is computed for
+#       each such type.  Handlers are called as handler(name, y, x),
+#       return a new Rpn object, and may throw(); binop_eval() deals
+#       with units before and after, and binop() restores the stack on
+#       error.  rpn.exe.CallSite calls handlers directly when neither
+#       operand has units.
+#
+#############################################################################
+def binop_promote(ytype, xtype):
+    """Return the type in which Y op X is computed: the higher of the
+two on the numeric tower, or "numpy" if either is a Vector or Matrix.
+Return None if either type is not numeric."""
+    if ytype not in binop_types or xtype not in binop_types:
+        return None
+    if ytype in [rpn.type.Vector, rpn.type.Matrix] or \
+       xtype in [rpn.type.Vector, rpn.type.Matrix]:
+        return "numpy"
+    return ytype if binop_tower.index(ytype) > binop_tower.index(xtype) else xtype
+
+
+def binop_eval(name, op, y, x):
+    """Compute Y op X, including unit checks and conversions.  Y and X
+are not on the stack; the caller is responsible for restoring them if
+this throws."""
+    rule = binop_unit_rule[op]
+    if rule in ["convert", "base"]:
+        if (x.has_uexpr_p() and not y.has_uexpr_p()) or \
+           (y.has_uexpr_p() and not x.has_uexpr_p()):
+            throw(X_INCONSISTENT_UNITS, name)
+        if x.has_uexpr_p() and y.has_uexpr_p():
+            if not rpn.unit.units_conform(x.uexpr, y.uexpr):
+                throw(X_CONFORMABILITY, name)
+            if rule == "convert":
+                # Convert Y to the units of X
+                y = y.uexpr_convert(str(x.uexpr), name)
+            else:
+                y = y.ubase_convert(name)
+                x = x.ubase_convert(name)
+    elif rule == "power":
+        if x.has_uexpr_p():
+            throw(X_INCONSISTENT_UNITS, name, "X cannot have unit expression")
+
+    handler = binop_table.get((type(y), type(x), op))
+    if handler is None:
+        throw(X_ARG_TYPE_MISMATCH, name, f"({typename(y)} {typename(x)})")
+    result = handler(name, y, x)
+
+    if rule == "convert":
+        if x.has_uexpr_p():
+            result.uexpr = x.uexpr
+    elif rule == "product":
+        if x.has_uexpr_p() and not y.has_uexpr_p():
+            result.uexpr = x.uexpr
+        elif not x.has_uexpr_p() and y.has_uexpr_p():
+            result.uexpr = y.uexpr
+        elif x.has_uexpr_p() and y.has_uexpr_p():
+            result.uexpr = rpn.unit.UProd(y.uexpr, x.uexpr)
+    elif rule == "quotient":
+        if x.has_uexpr_p() and not y.has_uexpr_p():
+            result.uexpr = x.uexpr.invert()
+        elif not x.has_uexpr_p() and y.has_uexpr_p():
+            result.uexpr = y.uexpr
+        elif x.has_uexpr_p() and y.has_uexpr_p():
+            result.uexpr = rpn.unit.UQuot(y.uexpr, x.uexpr)
+    elif rule == "power":
+        if y.has_uexpr_p():
+            result.uexpr = rpn.unit.UPow(y.uexpr, x.value)
+            if isinstance(result.uexpr, rpn.unit.UNull):
+                result.uexpr = None
+    return result
+
+
+def binop(name, op):
+    """Pop X and Y, push Y op X.  On error, X and Y are left on the stack."""
+    x = rpn.globl.param_stack.pop()
+    y = rpn.globl.param_stack.pop()
+    try:
+        result = binop_eval(name, op, y, x)
+    except RuntimeErr:
+        rpn.globl.param_stack.push(y)
+        rpn.globl.param_stack.push(x)
+        raise
+    rpn.globl.param_stack.push(result)
+
+
+def binop_numpy(fname):
+    def handler(name, y, x):
+        if not rpn.globl.have_module('numpy'):
+            throw(X_UNSUPPORTED, name, "Vector/Matrix operation requires 'numpy' library")
+        try:
+            r = getattr(np, fname)(y.value, x.value)
+        except ValueError:
+            throw(X_CONFORMABILITY, name, f"Y={y}, X={x}")
+        dbg(name, 3, "{}: r={}, type(r)={}, r.dtype={}, r.shape={}, r.ndim={}" \
+                     .format(name, type(r), r, r.dtype, r.shape, r.ndim))
+        return rpn.globl.to_rpn_class(r)
+    return handler
+
+
+def binop_nonzero(handler):
+    """Wrap a division handler to reject a scalar zero X."""
+    def checked(name, y, x):
+        if type(x) in binop_tower and x.zerop():
+            throw(X_FP_DIVISION_BY_ZERO, name, "X cannot be zero")
+        return handler(name, y, x)
+    return checked
+
+
+def binop_int_slash(name, y, x):      # pylint: disable=unused-argument
+    r = float(y.value) / float(x.value)
+    if r.is_integer():
+        return rpn.type.Integer._new(int(r))
+    return rpn.type.Float._new(r)
+
+
+def binop_caret(name, y, x):
+    try:
+        r = pow(y.value, x.value)
+    except OverflowError:
+        throw(X_FP_RESULT_OO_RANGE, name)
+    except ZeroDivisionError:
+        throw(X_FP_DIVISION_BY_ZERO, name, "Y cannot be zero")
+
+    if type(r) is int:
+        return rpn.type.Integer._new(r)
+    if type(r) is float:
+        return rpn.type.Float._new(r)
+    if type(r) is complex:
+        return rpn.type.Complex.from_complex(r)
+    if type(r) is Fraction:
+        return rpn.type.Rational._new(r)
+    raise FatalErr("{}: pow() returned a strange type '{}'".format(name, type(r)))
+
+
+def binop_fmod(name, y, x):
+    if x.zerop():
+        throw(X_FP_DIVISION_BY_ZERO, name, "X cannot be zero")
+    return rpn.type.Float._new(math.fmod(float(y.value), float(x.value)))
+
+
+def binop_float_equal(name, y, x):    # pylint: disable=unused-argument
+    if rpn.flag.flag_set_p(rpn.flag.F_EQUAL_ISCLOSE):
+        return rpn.type.Integer._new(rpn.globl.bool_to_int(math.isclose(float(y.value), float(x.value))))
+    return rpn.type.Integer._new(rpn.globl.bool_to_int(float(y.value) == float(x.value)))
+
+
+def binop_complex_equal(name, y, x):  # pylint: disable=unused-argument
+    if rpn.flag.flag_set_p(rpn.flag.F_EQUAL_ISCLOSE):
+        return rpn.type.Integer._new(rpn.globl.bool_to_int(cmath.isclose(complex(y.value), complex(x.value))))
+    return rpn.type.Integer._new(rpn.globl.bool_to_int(complex(y.value) == complex(x.value)))
+
+
+def binop_vector_equal(name, y, x):   # pylint: disable=unused-argument
+    if x.size() != y.size():
+        return rpn.type.Integer._new(0)
+    r = functools.reduce(lambda i, j: i and j,
+                         map(lambda m, k: m == k, x.value, y.value), True)
+    return rpn.type.Integer._new(rpn.globl.bool_to_int(bool(r)))
+
+
+def binop_matrix_equal(name, y, x):
+    if not rpn.globl.have_module('numpy'):
+        throw(X_UNSUPPORTED, name, "Matrix/Vector comparison requires 'numpy' library")
+    return rpn.type.Integer._new(rpn.globl.bool_to_int(bool(np.array_equal(x.value, y.value))))
+
+
+def binop_not(handler):
+    """Invert the flag returned by a predicate handler."""
+    def inverted(name, y, x):
+        return rpn.type.Integer._new(1 - handler(name, y, x).value)
+    return inverted
+
+
+def binop_compare(cmp):
+    def handler(name, y, x):          # pylint: disable=unused-argument
+        return rpn.type.Integer._new(rpn.globl.bool_to_int(cmp(float(y.value), float(x.value))))
+    return { rpn.type.Integer  : handler,
+             rpn.type.Rational : handler,
+             rpn.type.Float    : handler }
+
+
+def binop_select(pick_x):
+    def handler(name, y, x):          # pylint: disable=unused-argument
+        return x if pick_x(float(y.value), float(x.value)) else y
+    return { rpn.type.Integer  : handler,
+             rpn.type.Rational : handler,
+             rpn.type.Float    : handler }
+
+
+binop_tower = [rpn.type.Integer, rpn.type.Rational, rpn.type.Float, rpn.type.Complex]
+binop_types = binop_tower + [rpn.type.Vector, rpn.type.Matrix]
+
+# How the units of Y and X are checked and combined; see binop_eval()
+binop_unit_rule = {
+    '+'    : "convert",
+    '-'    : "convert",
+    '*'    : "product",
+    '/'    : "quotient",
+    '^'    : "power",
+    '<'    : "base",
+    '<='   : "base",
+    '<>'   : "base",
+    '='    : "base",
+    '>'    : "base",
+    '>='   : "base",
+    'fmod' : None,
+    'max'  : None,
+    'min'  : None,
+}
+
+# For each op, the handler to use given the result of binop_promote()
+binop_kind_fns = {
+    '+' : {
+        rpn.type.Integer  : lambda name, y, x: rpn.type.Integer._new(y.value + x.value),
+        rpn.type.Rational : lambda name, y, x: rpn.type.Rational._new(y.value + x.value),
+        rpn.type.Float    : lambda name, y, x: rpn.type.Float._new(float(y.value) + float(x.value)),
+        rpn.type.Complex  : lambda name, y, x: rpn.type.Complex._new(complex(y.value) + complex(x.value)),
+        "numpy"           : binop_numpy("add"),
+    },
+    '-' : {
+        rpn.type.Integer  : lambda name, y, x: rpn.type.Integer._new(y.value - x.value),
+        rpn.type.Rational : lambda name, y, x: rpn.type.Rational._new(y.value - x.value),
+        rpn.type.Float    : lambda name, y, x: rpn.type.Float._new(float(y.value) - float(x.value)),
+        rpn.type.Complex  : lambda name, y, x: rpn.type.Complex._new(complex(y.value) - complex(x.value)),
+        "numpy"           : binop_numpy("subtract"),
+    },
+    '*' : {
+        rpn.type.Integer  : lambda name, y, x: rpn.type.Integer._new(y.value * x.value),
+        rpn.type.Rational : lambda name, y, x: rpn.type.Rational._new(y.value * x.value),
+        rpn.type.Float    : lambda name, y, x: rpn.type.Float._new(float(y.value) * float(x.value)),
+        rpn.type.Complex  : lambda name, y, x: rpn.type.Complex._new(complex(y.value) * complex(x.value)),
+        "numpy"           : binop_numpy("multiply"),
+    },
+    '/' : {
+        rpn.type.Integer  : binop_nonzero(binop_int_slash),
+        rpn.type.Rational : binop_nonzero(lambda name, y, x: rpn.type.Rational._new(y.value / x.value)),
+        rpn.type.Float    : binop_nonzero(lambda name, y, x: rpn.type.Float._new(float(y.value) / float(x.value))),
+        rpn.type.Complex  : binop_nonzero(lambda name, y, x: rpn.type.Complex._new(complex(y.value) / complex(x.value))),
+        "numpy"           : binop_nonzero(binop_numpy("divide")),
+    },
+    '^' : {
+        rpn.type.Integer  : binop_caret,
+        rpn.type.Rational : binop_caret,
+        rpn.type.Float    : binop_caret,
+        rpn.type.Complex  : binop_caret,
+    },
+    '<'    : binop_compare(lambda y, x: y <  x),
+    '<='   : binop_compare(lambda y, x: y <= x),
+    '>'    : binop_compare(lambda y, x: y >  x),
+    '>='   : binop_compare(lambda y, x: y >= x),
+    '=' : {
+        rpn.type.Integer  : lambda name, y, x: rpn.type.Integer._new(rpn.globl.bool_to_int(y.value == x.value)),
+        rpn.type.Rational : lambda name, y, x: rpn.type.Integer._new(rpn.globl.bool_to_int(Fraction(y.value) == Fraction(x.value))),
+        rpn.type.Float    : binop_float_equal,
+        rpn.type.Complex  : binop_complex_equal,
+    },
+    'fmod' : {
+        rpn.type.Integer  : binop_fmod,
+        rpn.type.Rational : binop_fmod,
+        rpn.type.Float    : binop_fmod,
+    },
+    'max'  : binop_select(lambda y, x: x > y),
+    'min'  : binop_select(lambda y, x: x < y),
+}
+binop_kind_fns['<>'] = { kind: binop_not(fn) for (kind, fn) in binop_kind_fns['='].items() }
+
+binop_table = {}
+for (_op, _fns) in binop_kind_fns.items():
+    for _ytype in binop_types:
+        for _xtype in binop_types:
+            _kind = binop_promote(_ytype, _xtype)
+            if _kind in _fns:
+                binop_table[(_ytype, _xtype, _op)] = _fns[_kind]
+binop_table[(rpn.type.Vector, rpn.type.Vector, '=')]  = binop_vector_equal
+binop_table[(rpn.type.Matrix, rpn.type.Matrix, '=')]  = binop_matrix_equal
+binop_table[(rpn.type.Vector, rpn.type.Vector, '<>')] = binop_not(binop_vector_equal)
+binop_table[(rpn.type.Matrix, rpn.type.Matrix, '<>')] = binop_not(binop_matrix_equal)
+
+
+# Handlers for bare int/float/complex operands held unboxed on the
+# parameter stack (see rpn.util.ParamStack).  They are called as
+# handler(y, x), return a bare value, and must agree exactly with
+# binop_table.  Returning None sends the call site down the generic path,
+# which reports the error.
+def binop_raw_int_slash(y, x):
+    if x == 0:
+        return None
+    r = float(y) / float(x)
+    return int(r) if r.is_integer() else r
+
+
+def binop_raw_float_equal(y, x):
+    if rpn.flag.flag_set_p(rpn.flag.F_EQUAL_ISCLOSE):
+        return rpn.globl.bool_to_int(math.isclose(float(y), float(x)))
+    return rpn.globl.bool_to_int(float(y) == float(x))
+
+
+binop_raw_kind_fns = {
+    '+' : {
+        int     : lambda y, x: y + x,
+        float   : lambda y, x: float(y) + float(x),
+        complex : lambda y, x: complex(y) + complex(x),
+    },
+    '-' : {
+        int     : lambda y, x: y - x,
+        float   : lambda y, x: float(y) - float(x),
+        complex : lambda y, x: complex(y) - complex(x),
+    },
+    '*' : {
+        int     : lambda y, x: y * x,
+        float   : lambda y, x: float(y) * float(x),
+        complex : lambda y, x: complex(y) * complex(x),
+    },
+    '/' : {
+        int     : binop_raw_int_slash,
+        float   : lambda y, x: None if x == 0 else float(y) / float(x),
+        complex : lambda y, x: None if x == 0 else complex(y) / complex(x),
+    },
+    '<'    : dict.fromkeys([int, float], lambda y, x: rpn.globl.bool_to_int(float(y) <  float(x))),
+    '<='   : dict.fromkeys([int, float], lambda y, x: rpn.globl.bool_to_int(float(y) <= float(x))),
+    '>'    : dict.fromkeys([int, float], lambda y, x: rpn.globl.bool_to_int(float(y) >  float(x))),
+    '>='   : dict.fromkeys([int, float], lambda y, x: rpn.globl.bool_to_int(float(y) >= float(x))),
+    '=' : {
+        int     : lambda y, x: rpn.globl.bool_to_int(y == x),
+        float   : binop_raw_float_equal,
+    },
+    '<>' : {
+        int     : lambda y, x: rpn.globl.bool_to_int(y != x),
+        float   : lambda y, x: 1 - binop_raw_float_equal(y, x),
+    },
+    'fmod' : dict.fromkeys([int, float], lambda y, x: None if x == 0 else math.fmod(float(y), float(x))),
+    'max'  : dict.fromkeys([int, float], lambda y, x: x if float(x) > float(y) else y),
+    'min'  : dict.fromkeys([int, float], lambda y, x: x if float(x) < float(y) else y),
+}
+
+binop_raw_tower = [int, float, complex]
+binop_raw_table = {}
+for (_op, _fns) in binop_raw_kind_fns.items():
+    for _ytype in binop_raw_tower:
+        for _xtype in binop_raw_tower:
+            _kind = _ytype if binop_raw_tower.index(_ytype) > binop_raw_tower.index(_xtype) else _xtype
+            if _kind in _fns:
+                binop_raw_table[(_ytype, _xtype, _op)] = _fns[_kind]
 
 
 # Helper routines for KEY